@@ -1,10 +1,24 @@
 import sys
 import os
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-from src.ui.main_window import MainWindow
+import multiprocessing
+from src.utils.startup_profiler import StartupProfiler
+
+# 시작 단계별 시간을 출력하고 예산과 비교한 뒤 종료 (통과하면 종료 코드 0, 초과하면 1)
+PROFILE_STARTUP_FLAG = '--profile-startup'
 
 def main():
+    # 패키징된 실행 파일에서 병렬 로더 작업 프로세스 지원
+    multiprocessing.freeze_support()
+
+    profiling = PROFILE_STARTUP_FLAG in sys.argv
+    profiler = StartupProfiler(enabled=profiling)
+    with profiler.measure('import_qt'):
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtCore import Qt
+    # 메인 창 모듈은 다이얼로그/데이터 모듈을 import하지 않으므로 가볍게 로드됨
+    with profiler.measure('import_main_window'):
+        from src.ui.main_window import MainWindow
+
     # Windows에서 High DPI 스케일링 활성화
     if hasattr(Qt, 'AA_EnableHighDpiScaling'):
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
@@ -14,7 +28,8 @@ def main():
     # Mac에서 IMKClient 로그 메시지 숨기기
     os.environ['QT_MAC_WANTS_LAYER'] = '1'
     
-    app = QApplication(sys.argv)
+    with profiler.measure('create_application'):
+        app = QApplication(sys.argv)
     
     # Windows에서 기본 폰트 크기 조정
     if sys.platform == 'win32':
@@ -22,9 +37,18 @@ def main():
         font.setPointSize(9)  # Windows 기본 폰트 크기
         app.setFont(font)
     
-    main_window = MainWindow()
-    main_window.show()
-    
+    with profiler.measure('create_main_window'):
+        main_window = MainWindow(profiler if profiling else None)
+        main_window.show()
+
+    if profiling:
+        # 백그라운드 미리 로드까지 기록한 뒤 결과 출력
+        def finish_profile():
+            ok = profiler.report()
+            main_window.close()
+            app.exit(0 if ok else 1)
+        main_window.preloader.finished.connect(finish_profile)
+
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
@@ -0,0 +1,236 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFileDialog, QMessageBox
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QPainter
+import os
+
+# 확대/이동이 멈춘 뒤 범위 변경을 알리기까지 기다리는 시간(ms)
+RANGE_CHANGE_DELAY = 300
+# 크기 변경이 멈춘 뒤 다시 그리기까지 기다리는 시간(ms)
+RESIZE_DELAY = 200
+# 마우스 휠 한 칸의 확대 비율
+ZOOM_STEP = 0.8
+
+class ChartCanvas(QWidget):
+    """렌더링된 그래프 이미지를 표시하고 확대/이동 입력을 ChartPanel에 전달"""
+
+    def __init__(self, panel: 'ChartPanel'):
+        super().__init__(panel)
+        self.panel = panel
+        self.image = None
+        self.message = ''
+        self.offset = 0
+        self.drag_start = 0
+        self.setMinimumHeight(250)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self.image is not None:
+            painter.drawImage(self.rect().translated(self.offset, 0), self.image)
+        if self.message:
+            painter.drawText(self.rect(), Qt.AlignCenter, self.message)
+        painter.end()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.panel.on_resized()
+
+    def wheelEvent(self, event):
+        if self.panel.zoomable:
+            self.panel.zoom(event.position().x(), ZOOM_STEP if event.angleDelta().y() > 0 else 1 / ZOOM_STEP)
+
+    def mousePressEvent(self, event):
+        if self.panel.zoomable and event.button() == Qt.LeftButton:
+            self.drag_start = event.position().x()
+
+    def mouseMoveEvent(self, event):
+        if self.panel.zoomable and event.buttons() & Qt.LeftButton:
+            # 끄는 동안은 이미지만 옮겨 보여 주고 놓으면 다시 조회
+            self.offset = int(event.position().x() - self.drag_start)
+            self.update()
+
+    def mouseReleaseEvent(self, event):
+        if self.panel.zoomable and event.button() == Qt.LeftButton and self.offset:
+            self.panel.pan(self.offset)
+        self.offset = 0
+
+    def mouseDoubleClickEvent(self, event):
+        if self.panel.zoomable:
+            self.panel.reset_range()
+
+
+class ChartPanel(QWidget):
+    """다이얼로그에 넣는 차트 패널
+
+    그래프는 RenderService가 작업 스레드에서 이미지로 그리고 패널은 받은 이미지만 표시하므로
+    데이터 조회와 렌더링 중에도 다이얼로그가 멈추지 않는다. 같은 패널에 새 요청을 보내면 이전 요청은 버려진다.
+    파일이 필요하면 내보내기 버튼으로 현재 차트를 저장한다.
+    zoomable이면 휠로 확대/축소, 끌어서 이동, 두 번 클릭으로 전체 범위를 보고,
+    보이는 날짜 범위가 바뀌면 range_changed(시작, 끝)를 보내 그 범위만 더 세밀한 해상도로 다시 조회할 수 있게 한다.
+    전체 범위로 돌아가면 range_changed(None, None)를 보낸다.
+    """
+
+    range_changed = Signal(object, object)
+
+    def __init__(self, render_service, key: str, plot, zoomable=False, export_dir='data/graphs', parent=None):
+        super().__init__(parent)
+        self.render_service = render_service
+        self.key = key
+        self.plot = plot
+        self.zoomable = zoomable
+        self.export_dir = export_dir
+        self.data = None
+        self.view = None
+        self.has_data = False
+        self.loading = False
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+        self.canvas = ChartCanvas(self)
+        layout.addWidget(self.canvas)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.export_btn = QPushButton('그래프 내보내기')
+        self.export_btn.clicked.connect(self.export)
+        self.export_btn.setEnabled(False)
+        button_layout.addWidget(self.export_btn)
+        layout.addLayout(button_layout)
+
+        self.range_timer = QTimer(self)
+        self.range_timer.setSingleShot(True)
+        self.range_timer.setInterval(RANGE_CHANGE_DELAY)
+        self.range_timer.timeout.connect(self.emit_range)
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(RESIZE_DELAY)
+        self.resize_timer.timeout.connect(self.rerender)
+
+        render_service.rendered.connect(self.on_rendered)
+        render_service.saved.connect(self.on_saved)
+        render_service.failed.connect(self.on_failed)
+
+    def pixel_width(self) -> int:
+        """그래프 가로 픽셀 수 (조회할 최대 점 수)"""
+        return max(self.canvas.width(), 100)
+
+    def canvas_size(self):
+        """렌더링할 이미지 크기 (픽셀 단위 가로, 세로)"""
+        return max(self.canvas.width(), 100), max(self.canvas.height(), 100)
+
+    def update_chart(self, data):
+        """이미 조회한 데이터로 차트 갱신 (data가 없으면 비움)"""
+        if not data:
+            self.clear()
+            return
+        self.request(lambda: data)
+
+    def request(self, fetch):
+        """작업 스레드에서 fetch()로 데이터를 조회해 그리기 (None이면 비움)"""
+        self.loading = True
+        self.canvas.message = '' if self.canvas.image is not None else '불러오는 중...'
+        self.canvas.update()
+        self.render_service.request(self.key, self.plot, fetch, self.canvas_size())
+
+    def rerender(self):
+        """마지막 데이터를 현재 크기로 다시 그리기"""
+        if self.data is not None:
+            self.request(lambda data=self.data: data)
+
+    def on_resized(self):
+        if self.data is not None:
+            self.resize_timer.start()
+
+    def on_rendered(self, key, result):
+        if key != self.key:
+            return
+        self.loading = False
+        if result['image'] is None:
+            self.clear()
+            return
+        self.data = result['data']
+        self.view = result['view']
+        self.has_data = True
+        self.export_btn.setEnabled(True)
+        self.canvas.image = result['image']
+        self.canvas.message = ''
+        self.canvas.update()
+        # 요청한 뒤 크기가 바뀌었으면 (처음 표시될 때 등) 현재 크기로 다시 그림
+        if (self.canvas.image.width(), self.canvas.image.height()) != self.canvas_size():
+            self.resize_timer.start()
+
+    def on_saved(self, key, path):
+        if key == f'{self.key}_save':
+            self.export_btn.setEnabled(self.has_data)
+
+    def on_failed(self, key, error):
+        if key == self.key:
+            self.loading = False
+            self.canvas.message = '그래프를 그리지 못했습니다'
+            self.canvas.update()
+        elif key == f'{self.key}_save':
+            self.export_btn.setEnabled(self.has_data)
+            QMessageBox.warning(self, '그래프 내보내기', f'그래프 저장 중 오류가 발생했습니다.\n{error}')
+
+    def clear(self):
+        """차트 비우기 (진행 중인 요청도 버림)"""
+        self.render_service.cancel(self.key)
+        self.loading = False
+        self.data = None
+        self.view = None
+        self.has_data = False
+        self.export_btn.setEnabled(False)
+        self.canvas.image = None
+        self.canvas.message = '데이터 없음'
+        self.canvas.update()
+
+    # ---- 확대/이동 ----
+
+    def x_to_value(self, x: float) -> float:
+        """화면 x 좌표를 축 값으로 변환 (렌더링 당시 축 위치 기준)"""
+        scale = self.canvas.image.width() / max(self.canvas.width(), 1)
+        left, right = self.view['left'], self.view['right']
+        low, high = self.view['xlim']
+        return low + (x * scale - left) / max(right - left, 1) * (high - low)
+
+    def zoom(self, x: float, factor: float):
+        """커서 위치를 중심으로 확대(factor < 1)/축소"""
+        if self.view is None:
+            return
+        center = self.x_to_value(x)
+        low, high = self.view['xlim']
+        self.set_range(center + (low - center) * factor, center + (high - center) * factor)
+
+    def pan(self, dx: int):
+        """화면에서 dx 픽셀만큼 끈 방향으로 이동"""
+        if self.view is None:
+            return
+        shift = self.x_to_value(0) - self.x_to_value(dx)
+        low, high = self.view['xlim']
+        self.set_range(low + shift, high + shift)
+
+    def set_range(self, low: float, high: float):
+        self.view['xlim'] = (low, high)
+        self.range_timer.start()
+
+    def reset_range(self):
+        """전체 범위로 되돌리기"""
+        self.range_timer.stop()
+        self.range_changed.emit(None, None)
+
+    def emit_range(self):
+        """보이는 날짜 범위 알림"""
+        from matplotlib.dates import num2date
+        low, high = self.view['xlim']
+        self.range_changed.emit(num2date(low).replace(tzinfo=None), num2date(high).replace(tzinfo=None))
+
+    def export(self):
+        """현재 차트를 이미지 파일로 저장 (작업 스레드에서 렌더링)"""
+        if not self.has_data:
+            return
+        filepath, _ = QFileDialog.getSaveFileName(
+            self, '그래프 내보내기', os.path.join(self.export_dir, f'{self.key}.png'),
+            'PNG (*.png);;SVG (*.svg);;PDF (*.pdf)')
+        if filepath:
+            self.export_btn.setEnabled(False)
+            self.render_service.save(self.key, self.plot, self.data, filepath)
@@ -0,0 +1,120 @@
+import threading
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from ..utils.history_query import HistoryCursor, HistoryQuery
+
+class HistoryTask(QRunnable):
+    """이력 커서 열기/행 읽기와 통계 조회를 작업 스레드에서 실행"""
+
+    def __init__(self, service: 'HistoryService', generation: int, key, job, handler):
+        super().__init__()
+        # 작업 객체 수명은 HistoryService.tasks가 관리
+        self.setAutoDelete(False)
+        self.service = service
+        self.generation = generation
+        self.key = key
+        self.job = job
+        # 결과를 받아 시그널로 내보내는 HistoryService 메서드 (GUI 스레드에서 호출)
+        self.handler = handler
+
+    def run(self):
+        try:
+            # 커서는 파일/캐시를 지연해서 읽으므로 행을 꺼내는 동안 데이터 잠금을 잡음
+            with self.service.test_manager.lock:
+                result = self.job(lambda: self.service.is_stale(self.generation))
+            error = None
+        except Exception as e:
+            print(f"이력 조회 중 오류 발생: {e}")
+            result, error = None, str(e)
+        self.service._done.emit(self.generation, self.key, result, error)
+
+
+class HistoryService(QObject):
+    """이력 조회(TestManager.open_history)와 추가 행 읽기, 통계 조회를 작업 스레드 하나에서 차례로 실행
+
+    새 요청이 들어오면 이전 요청은 stale이 되어, 대기 중이면 대기열에서 빠지고
+    실행 중이면 읽던 행까지만 돌려주고 멈춘다. 결과는 fetched(세대, 키, 커서, 행, 최신 여부)로 받는다.
+    최신이 아닌 결과도 커서에서 이미 꺼낸 행이므로 버리지 말고 해당 키의 캐시에 붙여야 한다.
+    call()로 요청한 조회 결과는 최신일 때만 completed(세대, 키, 결과)로 받는다.
+    """
+
+    fetched = Signal(int, object, object, object, bool)
+    completed = Signal(int, object, object)
+    failed = Signal(int, object, str)
+    _done = Signal(int, object, object, object)
+
+    def __init__(self, test_manager, parent=None):
+        super().__init__(parent)
+        self.test_manager = test_manager
+        # 같은 커서를 두 스레드가 동시에 읽지 않도록 한 번에 하나씩 실행
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.tasks = {}
+        self._done.connect(self._on_done)
+
+    def is_stale(self, generation: int) -> bool:
+        with self.lock:
+            return generation != self.generation
+
+    def _submit(self, key, job, handler) -> int:
+        with self.lock:
+            self.generation += 1
+            generation = self.generation
+        # 아직 시작하지 않은 요청은 대기열에서 제거 (커서를 건드리기 전이므로 잃는 행 없음)
+        for task in list(self.tasks.values()):
+            if self.pool.tryTake(task):
+                del self.tasks[task.generation]
+        task = HistoryTask(self, generation, key, job, handler)
+        self.tasks[generation] = task
+        self.pool.start(task)
+        return generation
+
+    def open(self, key, query: HistoryQuery, order_by: str, descending: bool, count: int) -> int:
+        """커서를 열고 첫 count행 읽기 요청"""
+        def job(cancelled):
+            cursor = self.test_manager.open_history(query, order_by, descending, cancelled)
+            # 정렬용 전체 조회 중 취소되면 커서 없이 끝냄 (다음에 같은 조건이면 다시 엶)
+            if cursor is None:
+                return None, []
+            return cursor, cursor.fetch(count, cancelled)
+        return self._submit(key, job, self._emit_fetched)
+
+    def fetch(self, key, cursor: HistoryCursor, count: int) -> int:
+        """열린 커서에서 다음 count행 읽기 요청"""
+        return self._submit(key, lambda cancelled: (cursor, cursor.fetch(count, cancelled)), self._emit_fetched)
+
+    def call(self, key, func) -> int:
+        """func()(TestManager 조회 등)를 작업 스레드에서 실행하는 요청 (결과는 completed로 받음)"""
+        return self._submit(key, lambda cancelled: func(), self._emit_completed)
+
+    def _emit_fetched(self, generation: int, key, result):
+        cursor, rows = result
+        self.fetched.emit(generation, key, cursor, rows, not self.is_stale(generation))
+
+    def _emit_completed(self, generation: int, key, result):
+        if not self.is_stale(generation):
+            self.completed.emit(generation, key, result)
+
+    @Slot(int, object, object, object)
+    def _on_done(self, generation: int, key, result, error):
+        task = self.tasks.pop(generation, None)
+        if task is None:
+            return
+        if error is not None:
+            if not self.is_stale(generation):
+                self.failed.emit(generation, key, error)
+            return
+        task.handler(generation, key, result)
+
+    def cancel(self):
+        """대기/실행 중 요청을 stale로 만듦"""
+        with self.lock:
+            self.generation += 1
+
+    def shutdown(self):
+        """대기 중 작업을 버리고 실행 중 작업이 멈출 때까지 대기"""
+        self.cancel()
+        self.pool.clear()
+        self.pool.waitForDone()
+        self.tasks.clear()
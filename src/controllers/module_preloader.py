@@ -0,0 +1,64 @@
+import importlib
+import threading
+import time
+from typing import List, Optional
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+class PreloadTask(QRunnable):
+    """모듈 목록을 차례로 import (중지 요청이 오면 다음 모듈부터 건너뜀)"""
+
+    def __init__(self, preloader: 'ModulePreloader'):
+        super().__init__()
+        # 작업 객체 수명은 ModulePreloader.task가 관리
+        self.setAutoDelete(False)
+        self.preloader = preloader
+
+    def run(self):
+        for name in self.preloader.modules:
+            if self.preloader.stop_event.is_set():
+                break
+            begin = time.perf_counter()
+            try:
+                importlib.import_module(name, self.preloader.package)
+            except Exception as e:
+                # 실패한 모듈은 해당 하위 시스템을 열 때 다시 import하며 오류를 보여 줌
+                print(f"모듈 미리 로드 중 오류 발생 ({name}): {e}")
+                continue
+            self.preloader.loaded.emit(name, (time.perf_counter() - begin) * 1000)
+        self.preloader.finished.emit()
+
+
+class ModulePreloader(QObject):
+    """메인 창이 표시된 뒤 하위 시스템 모듈을 작업 스레드에서 미리 import
+
+    다이얼로그를 처음 열 때 pandas/matplotlib 등을 import하느라 멈추지 않도록 한다.
+    미리 로드가 끝나기 전에 다이얼로그를 열면 그 모듈은 import 잠금에서 기다렸다가 같은 모듈을 쓴다.
+
+    loaded(모듈 이름, 소요 ms): 모듈 하나를 로드함
+    finished(): 목록을 모두 처리함 (중지한 경우 포함)
+    """
+
+    loaded = Signal(str, float)
+    finished = Signal()
+
+    def __init__(self, modules: List[str], package: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.modules = list(modules)
+        self.package = package
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.stop_event = threading.Event()
+        self.task = None
+
+    def start(self):
+        """백그라운드 로드 시작"""
+        if self.task is not None:
+            return
+        self.stop_event.clear()
+        self.task = PreloadTask(self)
+        self.pool.start(self.task)
+
+    def stop(self):
+        """남은 모듈은 건너뛰고 로드 중인 모듈이 끝날 때까지 대기"""
+        self.stop_event.set()
+        self.pool.waitForDone()
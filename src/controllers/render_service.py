@@ -0,0 +1,168 @@
+import threading
+from typing import Dict, Any, Optional, Tuple
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from PySide6.QtGui import QImage
+from ..utils.visualization_manager import VisualizationManager
+
+# 렌더링 작업 스레드 수
+RENDER_THREADS = 2
+# 화면 출력용 Figure 해상도
+RENDER_DPI = 100
+
+class RenderTask(QRunnable):
+    """데이터 조회(fetch)와 그래프 렌더링을 작업 스레드에서 실행"""
+
+    def __init__(self, service: 'RenderService', key: str, generation: int, kind: str, job):
+        super().__init__()
+        # 작업 객체 수명은 RenderService.tasks가 관리
+        self.setAutoDelete(False)
+        self.service = service
+        self.key = key
+        self.generation = generation
+        self.kind = kind
+        self.job = job
+
+    def run(self):
+        # 시작 전에 더 새 요청이 들어왔으면 건너뜀
+        if self.service.is_stale(self.key, self.generation):
+            self.service._done.emit(self.key, self.generation, None, None)
+            return
+        try:
+            result = self.job(lambda: self.service.is_stale(self.key, self.generation))
+            error = None
+        except Exception as e:
+            print(f"그래프 렌더링 중 오류 발생: {e}")
+            result = None
+            error = str(e)
+        self.service._done.emit(self.key, self.generation, result, error)
+
+
+class RenderService(QObject):
+    """차트 요청을 받아 작업 스레드에서 렌더링하고 결과를 Qt 시그널로 전달
+
+    요청은 키(차트 자리)별로 세대 번호를 붙인다. 같은 키에 새 요청이 오면 아직 시작하지 않은
+    이전 요청은 대기열에서 빼고, 이미 실행 중인 요청의 결과는 버리므로 필터를 빠르게 바꿔도
+    지난 렌더링이 쌓이지 않는다. 결과는 GUI 스레드에서 rendered/saved/failed 시그널로 받는다.
+
+    데이터 조회(fetch)는 data_lock(보통 TestManager.lock) 안에서 한 번에 하나씩 실행하고,
+    Agg 렌더링만 작업 스레드들에서 동시에 실행한다.
+
+    rendered(key, {'image': QImage, 'data', 'view'}): 화면 출력용 이미지 버퍼
+    saved(key, path): 파일로 저장한 그래프 경로 (캐시 파일 포함)
+    """
+
+    rendered = Signal(str, object)
+    saved = Signal(str, str)
+    failed = Signal(str, str)
+    _done = Signal(str, int, object, object)
+
+    def __init__(self, visualization_manager: Optional[VisualizationManager] = None,
+                 max_threads: int = RENDER_THREADS, data_lock=None, parent=None):
+        super().__init__(parent)
+        self.visualization_manager = visualization_manager or VisualizationManager()
+        # 잠금을 받지 않아도 이 서비스의 조회끼리는 동시에 실행하지 않음
+        self.data_lock = data_lock or threading.RLock()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self.lock = threading.Lock()
+        self.generations = {}
+        # 대기/실행 중 작업 ((키, 세대) -> 작업), 키별 가장 최근 작업
+        self.tasks = {}
+        self.pending = {}
+        self._done.connect(self._on_done)
+
+    def is_stale(self, key: str, generation: int) -> bool:
+        """더 새 요청이 들어온 작업인지 여부"""
+        with self.lock:
+            return self.generations.get(key) != generation
+
+    def _submit(self, key: str, job, kind: str) -> int:
+        with self.lock:
+            generation = self.generations.get(key, 0) + 1
+            self.generations[key] = generation
+        self._take_pending(key)
+        task = RenderTask(self, key, generation, kind, job)
+        self.tasks[(key, generation)] = task
+        self.pending[key] = task
+        self.pool.start(task)
+        return generation
+
+    def _take_pending(self, key: str):
+        """아직 시작하지 않은 이전 요청은 대기열에서 제거"""
+        previous = self.pending.pop(key, None)
+        if previous is not None and self.pool.tryTake(previous):
+            del self.tasks[(key, previous.generation)]
+
+    def request(self, key: str, plot, fetch, size: Tuple[int, int]) -> int:
+        """fetch()로 데이터를 조회해 plot(chart, data)로 그린 이미지 요청 (size: 픽셀 단위 가로, 세로)
+
+        fetch가 None을 돌려주면 image 없이 data=None 결과를 보낸다.
+        """
+        def job(stale):
+            with self.data_lock:
+                data = None if stale() else fetch()
+            if data is None or stale():
+                return {'image': None, 'data': data, 'view': None}
+            image, view = self.render_image(key, plot, data, size)
+            return {'image': image, 'data': data, 'view': view}
+        return self._submit(key, job, 'image')
+
+    def save(self, key: str, plot, data: Any, path: str, figsize: Tuple[float, float] = (10, 6)) -> int:
+        """plot(chart, data)로 그린 그래프를 파일로 저장 요청"""
+        def job(stale):
+            with self.visualization_manager.figure_pool.acquire(f'{key}_save', figsize) as chart:
+                plot(chart, data)
+                chart.figure.savefig(path)
+            return path
+        return self._submit(f'{key}_save', job, 'file')
+
+    def render_image(self, key: str, plot, data: Any, size: Tuple[int, int]) -> Tuple[QImage, Dict[str, Any]]:
+        """화면 없는 Figure에 그려 이미지 버퍼와 축 위치(확대/이동 좌표 변환용) 반환"""
+        width, height = max(size[0], 100), max(size[1], 100)
+        with self.visualization_manager.figure_pool.acquire(key, (6, 4)) as chart:
+            chart.figure.set_dpi(RENDER_DPI)
+            chart.figure.set_size_inches(width / RENDER_DPI, height / RENDER_DPI)
+            plot(chart, data)
+            canvas = chart.figure.canvas
+            canvas.draw()
+            buffer = canvas.buffer_rgba()
+            image = QImage(bytes(buffer), buffer.shape[1], buffer.shape[0],
+                           QImage.Format_RGBA8888).copy()
+            bbox = chart.ax.get_window_extent()
+            view = {
+                'left': bbox.x0,
+                'right': bbox.x1,
+                'xlim': chart.ax.get_xlim()
+            }
+        return image, view
+
+    @Slot(str, int, object, object)
+    def _on_done(self, key: str, generation: int, result, error):
+        task = self.tasks.pop((key, generation), None)
+        if task is not None and self.pending.get(key) is task:
+            del self.pending[key]
+        # 전달 직전에 더 새 요청이 들어왔으면 버림
+        if task is None or self.is_stale(key, generation):
+            return
+        if error is not None:
+            self.failed.emit(key, error)
+        elif task.kind == 'file':
+            self.saved.emit(key, result)
+        else:
+            self.rendered.emit(key, result)
+
+    def cancel(self, key: str):
+        """키의 대기/실행 중 요청 결과를 버림"""
+        with self.lock:
+            self.generations[key] = self.generations.get(key, 0) + 1
+        self._take_pending(key)
+
+    def shutdown(self):
+        """대기 중 작업을 버리고 실행 중 작업이 끝날 때까지 대기"""
+        with self.lock:
+            for key in self.generations:
+                self.generations[key] += 1
+        self.pool.clear()
+        self.pool.waitForDone()
+        self.pending.clear()
+        self.tasks.clear()
@@ -0,0 +1,161 @@
+from collections import OrderedDict
+from typing import Optional
+from PySide6.QtCore import Qt, QModelIndex, Signal
+from .record_table_model import RecordTableModel
+from ..controllers.history_service import HistoryService
+from ..utils.history_query import HistoryQuery
+
+# 뷰가 끝까지 스크롤할 때마다 추가로 읽는 행 수
+FETCH_BATCH_SIZE = 200
+# 조회 조건(필터/정렬)별로 보관하는 읽은 행과 커서 수
+VIEW_CACHE_SIZE = 8
+
+HISTORY_COLUMNS = [
+    ('날짜', 'timestamp', None),
+    ('테스트 항목', 'test_item', None),
+    ('측정값', 'measured_value', '{:.2f}'),
+    ('기준값', 'reference_value', '{:.2f}'),
+    ('오차', 'error', '{:.2f}%'),
+    ('결과', 'result', None),
+    ('시리얼', 'serial_number', None)
+]
+
+class HistoryView:
+    """조회 조건 하나의 읽은 행과 이어 읽을 커서"""
+
+    def __init__(self):
+        self.records = []
+        self.cursor = None
+
+
+class HistoryTableModel(RecordTableModel):
+    """테스트 이력 표 모델
+
+    TestManager.open_history 커서를 HistoryService 작업 스레드에서 열고, 뷰가 요청할 때
+    (canFetchMore/fetchMore)만 다음 행을 읽는다. 열 제목을 눌러 정렬하면 데이터 계층에서
+    그 순서로 커서를 다시 연다. 조건(필터/정렬)별로 읽은 행과 커서를 보관해 이전 조건으로
+    돌아가면 다시 읽지 않고 바로 보여 주며, 데이터가 바뀌면 보관한 내용을 버린다.
+
+    loading_changed(조회 중 여부): 조회 시작/끝 (로딩 표시용)
+    loaded(): 조건을 바꾼 뒤 첫 행이 표시됨
+    """
+
+    loading_changed = Signal(bool)
+    loaded = Signal()
+    failed = Signal(str)
+
+    def __init__(self, test_manager, parent=None):
+        super().__init__(HISTORY_COLUMNS, parent=parent)
+        self.test_manager = test_manager
+        self.service = HistoryService(test_manager, self)
+        self.service.fetched.connect(self.on_fetched)
+        self.service.failed.connect(self.on_failed)
+        self.query = None
+        self.key = None
+        self.view = None
+        self.order_by = 'timestamp'
+        self.descending = True
+        self.loading = False
+        self.views = OrderedDict()
+        self.views_markers = None
+
+    @property
+    def cursor(self):
+        return self.view.cursor if self.view is not None else None
+
+    def set_loading(self, loading: bool):
+        if loading != self.loading:
+            self.loading = loading
+            self.loading_changed.emit(loading)
+
+    def load(self, query: HistoryQuery):
+        """조건의 이력 표시 (보관한 결과가 있으면 바로, 없으면 작업 스레드에서 첫 묶음 조회)"""
+        markers = self.test_manager.change_markers()
+        if markers != self.views_markers:
+            self.views.clear()
+            self.views_markers = markers
+
+        self.query = query
+        self.key = (query.cache_key(), self.order_by, self.descending)
+        view = self.views.get(self.key)
+        cached = view is not None and view.cursor is not None
+
+        self.beginResetModel()
+        if view is None:
+            view = self.views[self.key] = HistoryView()
+            while len(self.views) > VIEW_CACHE_SIZE:
+                self.views.popitem(last=False)
+        self.views.move_to_end(self.key)
+        self.view = view
+        self.records = view.records
+        self.endResetModel()
+
+        if cached:
+            # 진행 중이던 다른 조건의 조회는 멈춤
+            self.service.cancel()
+            self.set_loading(False)
+            self.loaded.emit()
+            return
+        self.set_loading(True)
+        self.service.open(self.key, query, self.order_by, self.descending, FETCH_BATCH_SIZE)
+
+    def on_fetched(self, generation: int, key, cursor, rows, current: bool):
+        """작업 스레드 조회 결과 반영 (다른 조건의 결과는 그 조건의 보관 행에만 붙임)"""
+        view = self.views.get(key)
+        if view is None or cursor is None:
+            return
+        if view.cursor is not None and view.cursor is not cursor:
+            # 같은 조건을 다시 열었는데 이전 요청이 먼저 끝나 그 커서로 이미 표시 중
+            if current and key == self.key:
+                self.set_loading(False)
+            return
+        first_batch = view.cursor is None
+        view.cursor = cursor
+        if key != self.key:
+            view.records.extend(rows)
+            return
+
+        if rows:
+            first = len(self.records)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self.records.extend(rows)
+            self.endInsertRows()
+        if current:
+            self.set_loading(False)
+        if first_batch:
+            self.loaded.emit()
+
+    def on_failed(self, generation: int, key, error: str):
+        if key == self.key:
+            self.set_loading(False)
+            self.failed.emit(error)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return (not parent.isValid() and not self.loading
+                and self.cursor is not None and not self.cursor.exhausted)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self.set_loading(True)
+        self.service.fetch(self.key, self.cursor, FETCH_BATCH_SIZE)
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """열 정렬 (데이터 계층에서 정렬한 커서로 다시 조회)"""
+        self.order_by = self.columns[column][1]
+        self.descending = order == Qt.DescendingOrder
+        if self.query is not None:
+            self.load(self.query)
+
+    def has_more(self) -> bool:
+        """아직 읽지 않은 행이 있는지 여부"""
+        return self.cursor is None or not self.cursor.exhausted
+
+    def run_id(self, row: int) -> Optional[str]:
+        """행의 실행 ID"""
+        record = self.record(row)
+        return record['run_id'] if record else None
+
+    def shutdown(self):
+        """진행 중인 조회를 멈추고 작업 스레드 종료 대기"""
+        self.service.shutdown()
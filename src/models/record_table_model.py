@@ -0,0 +1,89 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+# 열 정의: (제목, 필드 이름 또는 레코드에서 값을 꺼내는 함수, 표시 형식)
+# 표시 형식은 '{:.2f}' 같은 format 문자열이나 값을 받는 함수이며, None이면 str(값)
+Column = Tuple[str, Union[str, Callable[[Dict[str, Any]], Any]], Optional[Union[str, Callable[[Any], str]]]]
+
+class RecordTableModel(QAbstractTableModel):
+    """레코드(dict) 목록을 표로 보여 주는 모델
+
+    셀 문자열은 뷰가 그 셀을 그릴 때만 만든다. 정렬은 표시 문자열이 아닌 원래 값으로 한다.
+    """
+
+    def __init__(self, columns: Sequence[Column], records: Optional[List[Dict[str, Any]]] = None, parent=None):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self.records = list(records or [])
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def value(self, record: Dict[str, Any], column: int) -> Any:
+        """레코드의 열 값 (형식 적용 전)"""
+        key = self.columns[column][1]
+        return key(record) if callable(key) else record.get(key)
+
+    def format_value(self, value: Any, column: int) -> str:
+        """열 표시 형식으로 변환 (값이 없으면 '-')"""
+        if value is None:
+            return '-'
+        fmt = self.columns[column][2]
+        if fmt is None:
+            return str(value)
+        return fmt(value) if callable(fmt) else fmt.format(value)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.records[index.row()]
+        if role == Qt.DisplayRole:
+            return self.format_value(self.value(record, index.column()), index.column())
+        if role == Qt.UserRole:
+            return record
+        return None
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section][0]
+        return super().headerData(section, orientation, role)
+
+    def record(self, row: int) -> Optional[Dict[str, Any]]:
+        """행의 레코드 (범위 밖이면 None)"""
+        return self.records[row] if 0 <= row < len(self.records) else None
+
+    def set_records(self, records: List[Dict[str, Any]]):
+        """전체 레코드 교체"""
+        self.beginResetModel()
+        self.records = list(records)
+        self.endResetModel()
+
+    def append_record(self, record: Dict[str, Any]):
+        """레코드 하나를 끝에 추가"""
+        row = len(self.records)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.records.append(record)
+        self.endInsertRows()
+
+    def clear(self):
+        self.set_records([])
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """원래 값 기준 정렬 (값이 없는 행은 항상 마지막)"""
+        self.layoutAboutToBeChanged.emit()
+        # 선택/현재 행이 정렬 후에도 같은 레코드를 가리키도록 영구 인덱스 이동
+        persistent = self.persistentIndexList()
+        tracked = [id(self.records[index.row()]) for index in persistent]
+
+        present = [record for record in self.records if self.value(record, column) is not None]
+        missing = [record for record in self.records if self.value(record, column) is None]
+        present.sort(key=lambda record: self.value(record, column), reverse=order == Qt.DescendingOrder)
+        self.records = present + missing
+
+        rows = {id(record): row for row, record in enumerate(self.records)}
+        self.changePersistentIndexList(
+            persistent, [self.index(rows[record], index.column()) for record, index in zip(tracked, persistent)])
+        self.layoutChanged.emit()
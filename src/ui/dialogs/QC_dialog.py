@@ -1,13 +1,22 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                              QPushButton, QLabel, QComboBox, 
-                             QTableWidget, QTableWidgetItem, QHeaderView,
-                             QGroupBox, QGridLayout)
+                             QTableView, QHeaderView,
+                             QGroupBox, QGridLayout, QLineEdit)
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QIcon
+from ...models.record_table_model import RecordTableModel
 from ...utils.test_manager import TestManager
 import os
 import sys
 
+RESULT_COLUMNS = [
+    ('테스트 항목', 'test_item', None),
+    ('측정값', 'measured_value', '{:.2f}'),
+    ('기준값', 'reference_value', '{:.2f}'),
+    ('오차', 'error', '{:.2f}%'),
+    ('결과', 'result', None)
+]
+
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -40,10 +49,26 @@ class QualityCenterDialog(QDialog):
         
         layout.addLayout(test_layout)
 
+        # DUT 정보
+        dut_layout = QHBoxLayout()
+        dut_layout.addWidget(QLabel('시리얼 번호:'))
+        self.serial_edit = QLineEdit()
+        dut_layout.addWidget(self.serial_edit)
+
+        dut_layout.addWidget(QLabel('로트:'))
+        self.lot_edit = QLineEdit()
+        dut_layout.addWidget(self.lot_edit)
+
+        dut_layout.addWidget(QLabel('픽스처:'))
+        self.fixture_edit = QLineEdit()
+        dut_layout.addWidget(self.fixture_edit)
+
+        layout.addLayout(dut_layout)
+
         # 테스트 결과 테이블
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(5)
-        self.result_table.setHorizontalHeaderLabels(['테스트 항목', '측정값', '기준값', '오차', '결과'])
+        self.result_model = RecordTableModel(RESULT_COLUMNS, parent=self)
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_model)
         self.result_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(self.result_table)
 
@@ -62,6 +87,10 @@ class QualityCenterDialog(QDialog):
         self.history_btn = QPushButton('테스트 이력')
         self.history_btn.clicked.connect(self.show_history)
         button_layout.addWidget(self.history_btn)
+
+        self.statistics_btn = QPushButton('테스트 통계')
+        self.statistics_btn.clicked.connect(self.show_statistics)
+        button_layout.addWidget(self.statistics_btn)
         
         self.close_btn = QPushButton('닫기')
         self.close_btn.clicked.connect(self.close)
@@ -79,7 +108,7 @@ class QualityCenterDialog(QDialog):
         self.start_btn.setEnabled(False)
         self.save_btn.setEnabled(False)
         self.current_test_index = 0
-        self.result_table.setRowCount(0)
+        self.result_model.clear()
         self.timer.start(1000)  # 1초마다 업데이트
 
     def update_test(self):
@@ -96,30 +125,23 @@ class QualityCenterDialog(QDialog):
         result = self.test_manager.run_test(test_item)
 
         # 결과 테이블에 추가
-        row = self.result_table.rowCount()
-        self.result_table.insertRow(row)
-        self.result_table.setItem(row, 0, QTableWidgetItem(test_item))
-        self.result_table.setItem(row, 1, QTableWidgetItem(f"{result['measured_value']:.2f}"))
-        self.result_table.setItem(row, 2, QTableWidgetItem(f"{result['reference_value']:.2f}"))
-        self.result_table.setItem(row, 3, QTableWidgetItem(f"{result['error']:.2f}%"))
-        self.result_table.setItem(row, 4, QTableWidgetItem(result['result']))
+        self.result_model.append_record(dict(result, test_item=test_item))
 
         self.current_test_index += 1
 
     def save_results(self):
-        """테스트 결과 저장"""
-        results = []
-        for row in range(self.result_table.rowCount()):
-            result = {
-                'test_item': self.result_table.item(row, 0).text(),
-                'measured_value': float(self.result_table.item(row, 1).text()),
-                'reference_value': float(self.result_table.item(row, 2).text()),
-                'error': float(self.result_table.item(row, 3).text().replace('%', '')),
-                'result': self.result_table.item(row, 4).text()
-            }
-            results.append(result)
+        """테스트 결과 저장 (표시용으로 반올림한 문자열이 아닌 원래 측정값 저장)"""
+        results = [
+            {key: record[key] for key in ('test_item', 'measured_value', 'reference_value', 'error', 'result')}
+            for record in self.result_model.records
+        ]
         
-        self.test_manager.save_test_results(results)
+        dut_info = {
+            'serial_number': self.serial_edit.text().strip(),
+            'lot': self.lot_edit.text().strip(),
+            'fixture': self.fixture_edit.text().strip()
+        }
+        self.test_manager.save_test_results(results, dut_info)
         self.save_btn.setEnabled(False)
 
     def show_history(self):
@@ -128,6 +150,12 @@ class QualityCenterDialog(QDialog):
         dialog = TestHistoryDialog()
         dialog.exec_()
 
+    def show_statistics(self):
+        """테스트 통계 표시"""
+        from .test_statistics_dialog import TestStatisticsDialog
+        dialog = TestStatisticsDialog()
+        dialog.exec_()
+
     def closeEvent(self, event):
         """다이얼로그 종료 시 처리"""
         self.timer.stop()
@@ -1,10 +1,11 @@
-from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                              QPushButton, QLabel, QTableWidget,
                              QTableWidgetItem, QHeaderView, QMessageBox,
                              QGroupBox, QGridLayout)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QIcon
 from ...utils.test_manager import TestManager
+from ...utils.report_generator import DEFAULT_TEST_TYPE
 import os
 import sys
 import webbrowser
@@ -17,10 +18,13 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 class TestDetailDialog(QDialog):
-    def __init__(self, test_id: str):
+    def __init__(self, test_id: str, test_manager: TestManager = None):
         super().__init__()
-        self.test_manager = TestManager()
+        self.test_manager = test_manager or TestManager()
+        # 리포트 생성기(jinja2)는 리포트를 처음 볼 때 만듦
+        self.report_generator = None
         self.test_id = test_id
+        self.test_data = None
         self.initUI()
         self.load_test_detail()
 
@@ -51,6 +55,15 @@ class TestDetailDialog(QDialog):
         info_layout.addWidget(QLabel('테스트 결과:'), 2, 0)
         self.result_label = QLabel()
         info_layout.addWidget(self.result_label, 2, 1)
+
+        # DUT 정보
+        info_layout.addWidget(QLabel('시리얼/로트:'), 3, 0)
+        self.dut_label = QLabel()
+        info_layout.addWidget(self.dut_label, 3, 1)
+
+        info_layout.addWidget(QLabel('스테이션:'), 4, 0)
+        self.station_label = QLabel()
+        info_layout.addWidget(self.station_label, 4, 1)
         
         info_group.setLayout(info_layout)
         layout.addWidget(info_group)
@@ -79,21 +92,21 @@ class TestDetailDialog(QDialog):
 
     def load_test_detail(self):
         """테스트 상세 정보 로드"""
-        # 테스트 데이터 찾기
-        test_data = None
-        for test in self.test_manager.get_test_history():
-            if test['timestamp'] == self.test_id:
-                test_data = test
-                break
-
+        # 실행 ID로 저장된 실행 조회
+        test_data = self.test_manager.get_test_detail(self.test_id)
         if not test_data:
             QMessageBox.warning(self, '오류', '테스트 정보를 찾을 수 없습니다.')
-            self.close()
+            # 생성자 안에서는 아직 열리지 않았으므로 이벤트 루프에서 닫음
+            QTimer.singleShot(0, self.reject)
             return
+        self.test_data = test_data
 
         # 테스트 정보 표시
-        self.type_label.setText(test_data['test_type'])
+        dut = test_data.get('dut') or {}
+        self.type_label.setText(test_data.get('test_type') or DEFAULT_TEST_TYPE)
         self.time_label.setText(test_data['timestamp'])
+        self.dut_label.setText(f"{dut.get('serial_number') or '-'} / {dut.get('lot') or '-'}")
+        self.station_label.setText(dut.get('station') or '-')
         
         # 테스트 결과 계산
         total_tests = len(test_data['results'])
@@ -107,12 +120,15 @@ class TestDetailDialog(QDialog):
             self.result_table.setItem(i, 0, QTableWidgetItem(result['test_item']))
             self.result_table.setItem(i, 1, QTableWidgetItem(f"{result['measured_value']:.2f}"))
             self.result_table.setItem(i, 2, QTableWidgetItem(f"{result['reference_value']:.2f}"))
-            self.result_table.setItem(i, 3, QTableWidgetItem(result['unit']))
+            self.result_table.setItem(i, 3, QTableWidgetItem(result.get('unit', '')))
             self.result_table.setItem(i, 4, QTableWidgetItem(result['result']))
 
     def view_report(self):
         """테스트 리포트 보기"""
-        report_path = self.test_manager.generate_report(self.test_id)
+        if self.report_generator is None:
+            from ...utils.report_generator import ReportGenerator
+            self.report_generator = ReportGenerator()
+        report_path = self.report_generator.generate_report(self.test_data) if self.test_data else None
         if report_path:
             webbrowser.open('file://' + os.path.abspath(report_path))
         else:
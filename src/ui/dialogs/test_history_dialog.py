@@ -1,17 +1,25 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                              QPushButton, QLabel, QComboBox, 
-                             QTableWidget, QTableWidgetItem, QHeaderView,
+                             QTableView, QAbstractItemView, QHeaderView,
                              QGroupBox, QGridLayout, QTabWidget,
-                             QCalendarWidget, QMessageBox)
-from PySide6.QtCore import Qt, QDate
+                             QCalendarWidget, QMessageBox, QLineEdit,
+                             QDateEdit, QCheckBox, QProgressDialog)
+from PySide6.QtCore import Qt, QDate, QTimer
 from PySide6.QtGui import QIcon
+from ...components.chart_panel import ChartPanel
+from ...controllers.render_service import RenderService
+from ...models.history_table_model import HistoryTableModel
 from ...utils.test_manager import TestManager
 from ...utils.visualization_manager import VisualizationManager
+from ...utils.history_query import HistoryQuery
 import os
 import sys
 import webbrowser
 from datetime import datetime, timedelta
 
+# 필터 변경이 멈춘 뒤 조회를 시작하기까지 기다리는 시간(ms)
+FILTER_DEBOUNCE_DELAY = 250
+
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -24,6 +32,13 @@ class TestHistoryDialog(QDialog):
         super().__init__()
         self.test_manager = TestManager()
         self.visualization_manager = VisualizationManager()
+        self.render_service = RenderService(self.visualization_manager, data_lock=self.test_manager.lock, parent=self)
+        # 내보내기(openpyxl)/리포트(jinja2)는 처음 쓸 때 만듦 (다이얼로그를 여는 시간 단축)
+        self.export_manager = None
+        self.export_job = None
+        self.report_generator = None
+        self.report_job = None
+        self.chart_run_id = None
         self.initUI()
         self.load_history()
 
@@ -43,26 +58,107 @@ class TestHistoryDialog(QDialog):
         filter_layout.addWidget(QLabel('테스트 유형:'))
         self.type_combo = QComboBox()
         self.type_combo.addItems(['전체', '전압', '전류', '온도', '저항'])
-        self.type_combo.currentTextChanged.connect(self.load_history)
+        self.type_combo.currentTextChanged.connect(self.schedule_load)
         filter_layout.addWidget(self.type_combo)
         
         # 기간 필터
         filter_layout.addWidget(QLabel('기간:'))
         self.period_combo = QComboBox()
         self.period_combo.addItems(['오늘', '1주일', '1개월', '3개월', '전체'])
-        self.period_combo.currentTextChanged.connect(self.load_history)
+        self.period_combo.currentTextChanged.connect(self.schedule_load)
         filter_layout.addWidget(self.period_combo)
+
+        # 종료일 필터
+        self.end_date_check = QCheckBox('종료일:')
+        self.end_date_check.toggled.connect(self.schedule_load)
+        filter_layout.addWidget(self.end_date_check)
+        self.end_date_edit = QDateEdit(QDate.currentDate())
+        self.end_date_edit.setCalendarPopup(True)
+        self.end_date_edit.dateChanged.connect(self.schedule_load)
+        filter_layout.addWidget(self.end_date_edit)
+
+        # 결과 필터
+        filter_layout.addWidget(QLabel('결과:'))
+        self.result_combo = QComboBox()
+        self.result_combo.addItems(['전체', 'PASS', 'FAIL'])
+        self.result_combo.currentTextChanged.connect(self.schedule_load)
+        filter_layout.addWidget(self.result_combo)
         
         layout.addLayout(filter_layout)
 
-        # 테스트 이력 테이블
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(6)
-        self.history_table.setHorizontalHeaderLabels(['날짜', '테스트 항목', '측정값', '기준값', '오차', '결과'])
+        # 상세 필터 영역
+        detail_filter_layout = QHBoxLayout()
+
+        # 측정값 범위 필터
+        detail_filter_layout.addWidget(QLabel('측정값:'))
+        self.min_value_edit = QLineEdit()
+        self.min_value_edit.setPlaceholderText('최소')
+        self.min_value_edit.editingFinished.connect(self.schedule_load)
+        detail_filter_layout.addWidget(self.min_value_edit)
+        detail_filter_layout.addWidget(QLabel('~'))
+        self.max_value_edit = QLineEdit()
+        self.max_value_edit.setPlaceholderText('최대')
+        self.max_value_edit.editingFinished.connect(self.schedule_load)
+        detail_filter_layout.addWidget(self.max_value_edit)
+
+        # 오차 임계값 필터
+        detail_filter_layout.addWidget(QLabel('오차 ≥'))
+        self.min_error_edit = QLineEdit()
+        self.min_error_edit.setPlaceholderText('%')
+        self.min_error_edit.editingFinished.connect(self.schedule_load)
+        detail_filter_layout.addWidget(self.min_error_edit)
+
+        # DUT 시리얼/스테이션 필터
+        detail_filter_layout.addWidget(QLabel('시리얼:'))
+        self.serial_edit = QLineEdit()
+        self.serial_edit.editingFinished.connect(self.schedule_load)
+        detail_filter_layout.addWidget(self.serial_edit)
+
+        detail_filter_layout.addWidget(QLabel('스테이션:'))
+        self.station_edit = QLineEdit()
+        self.station_edit.editingFinished.connect(self.schedule_load)
+        detail_filter_layout.addWidget(self.station_edit)
+
+        layout.addLayout(detail_filter_layout)
+
+        # 시리얼/로트 추적 검색
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(QLabel('추적 검색:'))
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText('시리얼 번호 또는 로트 (전체 기간)')
+        self.search_edit.returnPressed.connect(self.load_history)
+        search_layout.addWidget(self.search_edit)
+
+        self.search_btn = QPushButton('검색')
+        self.search_btn.clicked.connect(self.load_history)
+        search_layout.addWidget(self.search_btn)
+
+        # 조회 상태 (불러오는 중 / 표시 행 수)
+        self.status_label = QLabel()
+        search_layout.addWidget(self.status_label)
+
+        layout.addLayout(search_layout)
+
+        # 테스트 이력 테이블 (스크롤하면 다음 행을 읽고, 열 제목을 누르면 데이터 계층에서 정렬)
+        self.history_model = HistoryTableModel(self.test_manager, self)
+        self.history_model.loading_changed.connect(self.update_status)
+        self.history_model.rowsInserted.connect(self.update_status)
+        self.history_model.loaded.connect(self.update_result_chart)
+        self.history_model.failed.connect(self.on_load_failed)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
+        self.history_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.history_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.history_table.setSortingEnabled(True)
+        self.history_table.sortByColumn(0, Qt.DescendingOrder)
+        self.history_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         layout.addWidget(self.history_table)
 
+        # 선택한 실행의 측정값/기준값 그래프 (선택이 바뀌면 바로 갱신)
+        self.result_chart = ChartPanel(self.render_service, 'test_result',
+                                       self.visualization_manager.plot_test_result)
+        layout.addWidget(self.result_chart)
+
         # 버튼 레이아웃
         button_layout = QHBoxLayout()
         
@@ -71,25 +167,33 @@ class TestHistoryDialog(QDialog):
         self.view_detail_btn.setEnabled(False)
         button_layout.addWidget(self.view_detail_btn)
         
-        self.view_graph_btn = QPushButton('그래프 보기')
-        self.view_graph_btn.clicked.connect(self.view_graph)
-        self.view_graph_btn.setEnabled(False)
-        button_layout.addWidget(self.view_graph_btn)
-        
         self.delete_btn = QPushButton('삭제')
         self.delete_btn.clicked.connect(self.delete_test)
         self.delete_btn.setEnabled(False)
         button_layout.addWidget(self.delete_btn)
         
+        self.export_btn = QPushButton('내보내기')
+        self.export_btn.clicked.connect(self.export_history)
+        button_layout.addWidget(self.export_btn)
+
+        self.batch_report_btn = QPushButton('일괄 리포트')
+        self.batch_report_btn.clicked.connect(self.generate_batch_report)
+        button_layout.addWidget(self.batch_report_btn)
+
         self.close_btn = QPushButton('닫기')
         self.close_btn.clicked.connect(self.close)
         button_layout.addWidget(self.close_btn)
         
         layout.addLayout(button_layout)
 
-    def load_history(self):
-        """테스트 이력 로드"""
-        # 필터 조건 설정
+        # 필터를 연달아 바꾸면 마지막 변경 후에 한 번만 조회
+        self.load_timer = QTimer(self)
+        self.load_timer.setSingleShot(True)
+        self.load_timer.setInterval(FILTER_DEBOUNCE_DELAY)
+        self.load_timer.timeout.connect(self.load_history)
+
+    def build_query(self):
+        """현재 필터 조건으로 이력 조회 조건 생성"""
         test_type = self.type_combo.currentText()
         if test_type == '전체':
             test_type = None
@@ -106,58 +210,103 @@ class TestHistoryDialog(QDialog):
         else:  # 전체
             start_date = None
 
-        # 테스트 이력 조회
-        history = self.test_manager.get_test_history(test_type=test_type, start_date=start_date)
-        
-        # 테이블 업데이트
-        self.history_table.setRowCount(len(history))
-        for i, test in enumerate(history):
-            self.history_table.setItem(i, 0, QTableWidgetItem(test['timestamp']))
-            self.history_table.setItem(i, 1, QTableWidgetItem(test['test_item']))
-            self.history_table.setItem(i, 2, QTableWidgetItem(f"{test['measured_value']:.2f}"))
-            self.history_table.setItem(i, 3, QTableWidgetItem(f"{test['reference_value']:.2f}"))
-            self.history_table.setItem(i, 4, QTableWidgetItem(f"{test['error']:.2f}%"))
-            self.history_table.setItem(i, 5, QTableWidgetItem(test['result']))
+        def parse_float(edit):
+            try:
+                return float(edit.text()) if edit.text().strip() else None
+            except ValueError:
+                return None
+
+        result = self.result_combo.currentText()
+        query = HistoryQuery(
+            test_type=test_type,
+            start_date=start_date,
+            end_date=self.end_date_edit.date().toPython() if self.end_date_check.isChecked() else None,
+            result=None if result == '전체' else result,
+            min_value=parse_float(self.min_value_edit),
+            max_value=parse_float(self.max_value_edit),
+            min_error=parse_float(self.min_error_edit),
+            serial_number=self.serial_edit.text().strip() or None,
+            station=self.station_edit.text().strip() or None
+        )
+
+        # 추적 검색: 해당 시리얼/로트의 실행만 전체 기간에서 조회 (색인 조회는 조회 작업 스레드에서 실행)
+        search_text = self.search_edit.text().strip()
+        if search_text:
+            query.trace = search_text
+            query.start_date = None
+            query.end_date = None
+            query.include_archive = True
+        return query
+
+    def schedule_load(self):
+        """필터 변경 시 잠시 기다렸다가 조회 (기다리는 동안 다시 바뀌면 처음부터 다시 기다림)"""
+        self.load_timer.start()
+
+    def load_history(self):
+        """테스트 이력 로드 (작업 스레드에서 첫 묶음만 읽고 나머지는 스크롤할 때 읽음)
+
+        진행 중이던 이전 조건의 조회는 멈추고, 같은 조건을 이미 읽었으면 바로 표시한다.
+        """
+        self.load_timer.stop()
+        self.history_model.load(self.build_query())
+
+        # 필터가 바뀌어 선택 행의 실행이 달라졌으면 그래프도 갱신
+        self.update_result_chart()
+
+    def update_status(self):
+        """조회 상태 표시"""
+        if self.history_model.loading:
+            self.status_label.setText('불러오는 중...')
+            return
+        rows = self.history_model.rowCount()
+        more = '+' if self.history_model.has_more() else ''
+        self.status_label.setText(f'{rows:,}{more}행')
+
+    def on_load_failed(self, error):
+        self.status_label.setText('조회 실패')
+        QMessageBox.warning(self, '테스트 이력', f'이력 조회 중 오류가 발생했습니다.\n{error}')
+
+    def selected_run_id(self):
+        """선택한 행의 실행 ID (선택이 없으면 None)"""
+        if not self.history_table.selectionModel().hasSelection():
+            return None
+        return self.history_model.run_id(self.history_table.currentIndex().row())
 
     def on_selection_changed(self):
         """테이블 선택 변경 시 처리"""
-        selected = len(self.history_table.selectedItems()) > 0
+        selected = self.history_table.selectionModel().hasSelection()
         self.view_detail_btn.setEnabled(selected)
-        self.view_graph_btn.setEnabled(selected)
         self.delete_btn.setEnabled(selected)
+        self.update_result_chart()
 
     def view_detail(self):
         """선택한 테스트의 상세 정보 표시"""
-        row = self.history_table.currentRow()
-        if row < 0:
+        test_id = self.selected_run_id()
+        if test_id is None:
             return
-            
-        test_id = self.history_table.item(row, 0).text()
-        test_data = self.test_manager.get_test_detail(test_id)
         
         from .test_detail_dialog import TestDetailDialog
-        dialog = TestDetailDialog(test_data)
+        dialog = TestDetailDialog(test_id, self.test_manager)
         dialog.exec_()
 
-    def view_graph(self):
-        """선택한 테스트의 그래프 표시"""
-        row = self.history_table.currentRow()
-        if row < 0:
+    def update_result_chart(self):
+        """선택한 실행의 그래프 갱신 (같은 실행의 다른 행을 고르면 그대로 둠)"""
+        test_id = self.selected_run_id()
+        if test_id is None:
+            self.chart_run_id = None
+            self.result_chart.clear()
             return
-            
-        test_id = self.history_table.item(row, 0).text()
-        test_data = self.test_manager.get_test_detail(test_id)
-        
-        filepath = self.visualization_manager.create_test_result_graph(test_data)
-        webbrowser.open('file://' + os.path.abspath(filepath))
+
+        if test_id == self.chart_run_id:
+            return
+        self.chart_run_id = test_id
+        self.result_chart.request(lambda: self.test_manager.get_test_detail(test_id))
 
     def delete_test(self):
         """선택한 테스트 삭제"""
-        row = self.history_table.currentRow()
-        if row < 0:
+        test_id = self.selected_run_id()
+        if test_id is None:
             return
-            
-        test_id = self.history_table.item(row, 0).text()
         
         reply = QMessageBox.question(
             self,
@@ -169,4 +318,103 @@ class TestHistoryDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             self.test_manager.delete_test(test_id)
-            self.load_history() 
\ No newline at end of file
+            self.load_history()
+
+    def export_history(self):
+        """현재 필터 조건의 이력을 설정된 형식으로 내보내기 (백그라운드)"""
+        if self.export_job is not None and not self.export_job.done:
+            return
+
+        if self.export_manager is None:
+            from ...utils.export_manager import ExportManager
+            self.export_manager = ExportManager(self.test_manager)
+        self.export_job = self.export_manager.start(query=self.build_query())
+        self.export_btn.setEnabled(False)
+
+        self.export_progress = QProgressDialog('이력 내보내는 중...', '취소', 0, 0, self)
+        self.export_progress.setWindowTitle('내보내기')
+        self.export_progress.canceled.connect(self.export_job.cancel)
+        self.export_progress.show()
+
+        # 작업 스레드 상태를 주기적으로 확인해 진행 표시 갱신
+        self.export_timer = QTimer(self)
+        self.export_timer.timeout.connect(self.check_export)
+        self.export_timer.start(200)
+
+    def check_export(self):
+        """내보내기 진행 상황 확인"""
+        job = self.export_job
+        if not job.done:
+            self.export_progress.setLabelText(f'이력 내보내는 중... ({job.rows:,}행)')
+            return
+
+        self.export_timer.stop()
+        self.export_progress.reset()
+        self.export_btn.setEnabled(True)
+        if job.error:
+            QMessageBox.warning(self, '내보내기', f'내보내기 중 오류가 발생했습니다.\n{job.error}')
+        elif not job.result['cancelled']:
+            QMessageBox.information(
+                self, '내보내기', f"{job.result['rows']:,}행을 저장했습니다.\n{job.result['path']}")
+
+    def describe_filters(self):
+        """일괄 리포트 목차에 표시할 필터 조건 설명"""
+        parts = [f'항목 {self.type_combo.currentText()}', f'기간 {self.period_combo.currentText()}']
+        for label, edit in (('시리얼', self.serial_edit), ('스테이션', self.station_edit),
+                            ('추적', self.search_edit)):
+            if edit.text().strip():
+                parts.append(f'{label} {edit.text().strip()}')
+        return ', '.join(parts)
+
+    def generate_batch_report(self):
+        """현재 필터 조건의 실행별 리포트와 목차를 일괄 생성 (백그라운드)"""
+        if self.report_job is not None and not self.report_job.finished:
+            return
+
+        if self.report_generator is None:
+            from ...utils.report_generator import ReportGenerator
+            self.report_generator = ReportGenerator()
+        self.report_job = self.report_generator.start_batch(
+            self.test_manager, self.build_query(), self.describe_filters())
+        self.batch_report_btn.setEnabled(False)
+
+        self.report_progress = QProgressDialog('리포트 생성 중...', '취소', 0, 0, self)
+        self.report_progress.setWindowTitle('일괄 리포트')
+        self.report_progress.canceled.connect(self.report_job.cancel)
+        self.report_progress.show()
+
+        self.report_timer = QTimer(self)
+        self.report_timer.timeout.connect(self.check_batch_report)
+        self.report_timer.start(200)
+
+    def check_batch_report(self):
+        """일괄 리포트 진행 상황 확인"""
+        job = self.report_job
+        if not job.finished:
+            if job.total:
+                self.report_progress.setMaximum(job.total)
+                self.report_progress.setValue(job.done)
+            return
+
+        self.report_timer.stop()
+        self.report_progress.reset()
+        self.batch_report_btn.setEnabled(True)
+        if job.error:
+            QMessageBox.warning(self, '일괄 리포트', f'리포트 생성 중 오류가 발생했습니다.\n{job.error}')
+        elif not job.result['cancelled']:
+            webbrowser.open('file://' + os.path.abspath(job.result['index']))
+
+    def done(self, result):
+        """다이얼로그 종료 시 처리 (닫기 버튼, Esc, accept/reject 모두 여기를 거침)"""
+        self.load_timer.stop()
+        self.history_model.shutdown()
+        self.render_service.shutdown()
+        if self.export_job is not None and not self.export_job.done:
+            self.export_job.cancel()
+            self.export_job.join()
+        if self.report_job is not None and not self.report_job.finished:
+            self.report_job.cancel()
+            self.report_job.join()
+        # 다음 실행 때 바로 표시할 수 있도록 캐시 스냅샷 저장
+        self.test_manager.save_snapshot()
+        super().done(result)
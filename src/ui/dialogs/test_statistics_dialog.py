@@ -1,14 +1,57 @@
-from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                              QPushButton, QLabel, QComboBox, 
-                             QTableWidget, QTableWidgetItem, QHeaderView,
-                             QGroupBox, QGridLayout, QTabWidget)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QPixmap
+                             QTableView, QAbstractItemView, QHeaderView,
+                             QGroupBox, QGridLayout, QTabWidget, QWidget,
+                             QMessageBox)
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QIcon
+from ...components.chart_panel import ChartPanel
+from ...controllers.history_service import HistoryService
+from ...controllers.render_service import RenderService
+from ...models.record_table_model import RecordTableModel
 from ...utils.test_manager import TestManager
 from ...utils.visualization_manager import VisualizationManager
 import os
 import sys
-import webbrowser
+from datetime import datetime
+
+TYPE_COLUMNS = [
+    ('테스트 유형', 'test_type', None),
+    ('테스트 수', 'count', None),
+    ('통과', 'passed', None),
+    ('실패', 'failed', None),
+    ('통과율', 'pass_rate', '{:.1f}%')
+]
+
+DAILY_COLUMNS = [
+    ('날짜', 'date', lambda date: f'{date[:4]}-{date[4:6]}-{date[6:]}'),
+    ('테스트 수', 'total', None),
+    ('통과', 'passed', None),
+    ('실패', 'failed', None),
+    ('통과율', 'pass_rate', '{:.1f}%')
+]
+
+SPC_COLUMNS = [
+    ('테스트 항목', 'test_item', None),
+    ('샘플 수', 'count', None),
+    ('평균', 'mean', '{:.3f}'),
+    ('표준편차', 'sigma', '{:.3f}'),
+    ('Cp', 'cp', '{:.3f}'),
+    ('Cpk', 'cpk', '{:.3f}'),
+    ('UCL', lambda stats: (stats['individuals'] or {}).get('ucl'), '{:.3f}'),
+    ('LCL', lambda stats: (stats['individuals'] or {}).get('lcl'), '{:.3f}'),
+    ('규칙 위반', lambda stats: len(stats['violations']), None)
+]
+
+def record_table(model):
+    """모델을 보여 주는 정렬 가능한 행 단위 선택 표"""
+    table = QTableView()
+    table.setModel(model)
+    table.setSelectionBehavior(QAbstractItemView.SelectRows)
+    table.setSelectionMode(QAbstractItemView.SingleSelection)
+    table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    table.setSortingEnabled(True)
+    return table
 
 def resource_path(relative_path):
     try:
@@ -22,6 +65,12 @@ class TestStatisticsDialog(QDialog):
         super().__init__()
         self.test_manager = TestManager()
         self.visualization_manager = VisualizationManager()
+        self.render_service = RenderService(self.visualization_manager, data_lock=self.test_manager.lock, parent=self)
+        # 기간별 통계/공정 능력 조회는 작업 스레드에서 실행 (기간을 바꾸면 이전 조회 결과는 버림)
+        self.history_service = HistoryService(self.test_manager, self)
+        self.history_service.completed.connect(self.on_statistics_loaded)
+        self.history_service.failed.connect(self.on_statistics_failed)
+        self.current_stats = None
         self.initUI()
         self.load_statistics()
 
@@ -85,27 +134,25 @@ class TestStatisticsDialog(QDialog):
         type_group = QGroupBox('테스트 유형별 통계')
         type_layout = QVBoxLayout()
         
-        self.type_table = QTableWidget()
-        self.type_table.setColumnCount(5)
-        self.type_table.setHorizontalHeaderLabels(['테스트 유형', '테스트 수', '통과', '실패', '통과율'])
-        self.type_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.type_model = RecordTableModel(TYPE_COLUMNS, parent=self)
+        self.type_table = record_table(self.type_model)
         type_layout.addWidget(self.type_table)
         
         type_group.setLayout(type_layout)
         summary_layout.addWidget(type_group)
 
-        # 그래프 버튼
-        graph_btn_layout = QHBoxLayout()
+        # 요약/분포 그래프 (기간 변경 시 바로 갱신)
+        graph_layout = QHBoxLayout()
         
-        self.summary_graph_btn = QPushButton('요약 그래프 보기')
-        self.summary_graph_btn.clicked.connect(self.show_summary_graph)
-        graph_btn_layout.addWidget(self.summary_graph_btn)
+        self.summary_chart = ChartPanel(self.render_service, 'test_summary',
+                                        self.visualization_manager.plot_test_summary)
+        graph_layout.addWidget(self.summary_chart)
         
-        self.distribution_graph_btn = QPushButton('분포 그래프 보기')
-        self.distribution_graph_btn.clicked.connect(self.show_distribution_graph)
-        graph_btn_layout.addWidget(self.distribution_graph_btn)
+        self.distribution_chart = ChartPanel(self.render_service, 'test_distribution',
+                                             self.visualization_manager.plot_test_distribution)
+        graph_layout.addWidget(self.distribution_chart)
         
-        summary_layout.addLayout(graph_btn_layout)
+        summary_layout.addLayout(graph_layout)
 
         # 일별 통계 탭
         daily_tab = QWidget()
@@ -116,87 +163,179 @@ class TestStatisticsDialog(QDialog):
         daily_group = QGroupBox('일별 통계')
         daily_table_layout = QVBoxLayout()
         
-        self.daily_table = QTableWidget()
-        self.daily_table.setColumnCount(5)
-        self.daily_table.setHorizontalHeaderLabels(['날짜', '테스트 수', '통과', '실패', '통과율'])
-        self.daily_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.daily_model = RecordTableModel(DAILY_COLUMNS, parent=self)
+        self.daily_table = record_table(self.daily_model)
         daily_table_layout.addWidget(self.daily_table)
         
         daily_group.setLayout(daily_table_layout)
         daily_layout.addWidget(daily_group)
 
-        # 일별 추이 그래프 버튼
-        self.trend_graph_btn = QPushButton('일별 추이 그래프 보기')
-        self.trend_graph_btn.clicked.connect(self.show_trend_graph)
-        daily_layout.addWidget(self.trend_graph_btn)
+        # 통과율 추이 그래프 (확대하면 보이는 범위만 시간 단위로 다시 조회)와 시간대별 통과율 히트맵
+        trend_layout = QHBoxLayout()
+        self.trend_chart = ChartPanel(self.render_service, 'pass_rate_series',
+                                      self.visualization_manager.plot_pass_rate_series, zoomable=True)
+        self.trend_chart.range_changed.connect(self.update_trend_chart)
+        trend_layout.addWidget(self.trend_chart, 3)
+        self.heatmap_chart = ChartPanel(self.render_service, 'pass_rate_heatmap',
+                                        self.visualization_manager.plot_pass_rate_heatmap)
+        trend_layout.addWidget(self.heatmap_chart, 2)
+        daily_layout.addLayout(trend_layout)
+
+        # 공정 능력 탭
+        spc_tab = QWidget()
+        spc_layout = QVBoxLayout()
+        spc_tab.setLayout(spc_layout)
+
+        self.spc_model = RecordTableModel(SPC_COLUMNS, parent=self)
+        self.spc_table = record_table(self.spc_model)
+        self.spc_table.selectionModel().selectionChanged.connect(self.update_measurement_chart)
+        spc_layout.addWidget(self.spc_table)
+
+        # 선택한 항목의 측정값 분포(규격/공정 능력 표시)와 관리도 (관리도는 확대 범위만 원시 측정값으로 다시 조회)
+        measurement_layout = QHBoxLayout()
+        self.measurement_chart = ChartPanel(self.render_service, 'measurement_distribution',
+                                            self.visualization_manager.plot_measurement_distribution)
+        measurement_layout.addWidget(self.measurement_chart)
+        self.control_chart = ChartPanel(self.render_service, 'control_chart',
+                                        self.visualization_manager.plot_control_chart, zoomable=True)
+        self.control_chart.range_changed.connect(self.update_control_chart)
+        measurement_layout.addWidget(self.control_chart)
+        spc_layout.addLayout(measurement_layout)
 
         # 탭 추가
         tab_widget.addTab(summary_tab, '요약')
         tab_widget.addTab(daily_tab, '일별 통계')
+        tab_widget.addTab(spc_tab, '공정 능력')
 
         # 닫기 버튼
         close_btn = QPushButton('닫기')
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
 
-    def load_statistics(self):
-        """통계 정보 로드"""
-        # 기간 설정
+    def current_period(self):
+        """선택된 기간 구분"""
         period_map = {
             '1일': 'day',
             '1주일': 'week',
             '1개월': 'month'
         }
-        period = period_map.get(self.period_combo.currentText(), 'day')
-        
-        # 통계 정보 조회
-        self.current_stats = self.test_manager.get_test_statistics(period)
-        
+        return period_map.get(self.period_combo.currentText(), 'day')
+
+    def load_statistics(self):
+        """통계 정보 로드 (작업 스레드에서 조회하고 끝나면 표시)"""
+        period = self.current_period()
+        self.pass_rate_label.setText('불러오는 중...')
+
+        def fetch():
+            return self.test_manager.get_test_statistics(period), self.test_manager.get_spc_statistics()
+        self.history_service.call(period, fetch)
+
+    def on_statistics_loaded(self, generation, period, result):
+        """조회한 통계 표시"""
+        self.current_stats, spc_stats = result
+
         # 요약 정보 표시
         self.total_tests_label.setText(str(self.current_stats['total_tests']))
         self.passed_tests_label.setText(str(self.current_stats['total_passed']))
         self.failed_tests_label.setText(str(self.current_stats['total_failed']))
         self.pass_rate_label.setText(f"{self.current_stats['average_pass_rate']:.1f}%")
         
-        # 테스트 유형별 통계 표시
-        self.type_table.setRowCount(len(self.current_stats['test_types']))
-        for i, (test_type, type_stats) in enumerate(self.current_stats['test_types'].items()):
-            self.type_table.setItem(i, 0, QTableWidgetItem(test_type))
-            self.type_table.setItem(i, 1, QTableWidgetItem(str(type_stats['count'])))
-            self.type_table.setItem(i, 2, QTableWidgetItem(str(type_stats['passed'])))
-            self.type_table.setItem(i, 3, QTableWidgetItem(str(type_stats['failed'])))
-            self.type_table.setItem(i, 4, QTableWidgetItem(f"{type_stats['pass_rate']:.1f}%"))
-        
-        # 일별 통계 표시
-        self.daily_table.setRowCount(len(self.current_stats['daily_stats']))
-        for i, daily_stat in enumerate(self.current_stats['daily_stats']):
-            date = f"{daily_stat['date'][:4]}-{daily_stat['date'][4:6]}-{daily_stat['date'][6:]}"
-            self.daily_table.setItem(i, 0, QTableWidgetItem(date))
-            self.daily_table.setItem(i, 1, QTableWidgetItem(str(daily_stat['total'])))
-            self.daily_table.setItem(i, 2, QTableWidgetItem(str(daily_stat['passed'])))
-            self.daily_table.setItem(i, 3, QTableWidgetItem(str(daily_stat['failed'])))
-            self.daily_table.setItem(i, 4, QTableWidgetItem(f"{daily_stat['pass_rate']:.1f}%"))
-
-    def show_summary_graph(self):
-        """요약 그래프 표시"""
-        if not hasattr(self, 'current_stats'):
-            return
-        
-        filepath = self.visualization_manager.create_test_summary_graph(self.current_stats)
-        webbrowser.open('file://' + os.path.abspath(filepath))
+        # 테스트 유형별/일별 통계 표시
+        self.type_model.set_records([
+            dict(type_stats, test_type=test_type)
+            for test_type, type_stats in self.current_stats['test_types'].items()
+        ])
+        self.daily_model.set_records(self.current_stats['daily_stats'])
 
-    def show_distribution_graph(self):
-        """분포 그래프 표시"""
-        if not hasattr(self, 'current_stats'):
-            return
-        
-        filepath = self.visualization_manager.create_test_distribution_graph(self.current_stats)
-        webbrowser.open('file://' + os.path.abspath(filepath))
+        self.load_spc_statistics(spc_stats)
+        self.update_charts()
+
+    def on_statistics_failed(self, generation, period, error):
+        self.pass_rate_label.setText('조회 실패')
+        QMessageBox.warning(self, '테스트 통계', f'통계 조회 중 오류가 발생했습니다.\n{error}')
+
+    def load_spc_statistics(self, spc_stats):
+        """공정 능력 통계 표시"""
+        selected = self.selected_test_item()
+        self.spc_model.set_records([
+            dict(item_stats, test_item=test_item) for test_item, item_stats in spc_stats.items()
+        ])
+        # 모델을 다시 채우면 선택이 풀리므로 이전에 보던 항목을 다시 선택
+        for row, record in enumerate(self.spc_model.records):
+            if record['test_item'] == selected:
+                self.spc_table.selectRow(row)
+
+    def update_charts(self):
+        """요약/분포/일별 추이/히트맵 그래프 갱신"""
+        has_data = self.current_stats['total_tests'] > 0
+        self.summary_chart.update_chart(self.current_stats if has_data else None)
+        self.distribution_chart.update_chart(self.current_stats if has_data else None)
+        self.update_trend_chart()
+        self.update_heatmap_chart()
+        self.update_measurement_chart()
+
+    def period_range(self):
+        """선택 기간의 추이 조회 범위 (시작 시각, 현재 시각)"""
+        start_date = self.test_manager.get_period_start(self.current_period())
+        return datetime.combine(start_date, datetime.min.time()), datetime.now()
+
+    def update_trend_chart(self, start=None, end=None):
+        """통과율 추이 그래프 갱신 (범위 생략 시 선택 기간 전체)"""
+        if start is None:
+            start, end = self.period_range()
+        max_points = self.trend_chart.pixel_width()
 
-    def show_trend_graph(self):
-        """일별 추이 그래프 표시"""
-        if not hasattr(self, 'current_stats'):
+        def fetch():
+            series = self.test_manager.get_pass_rate_series(start, end, max_points)
+            return series if series['count'] else None
+        self.trend_chart.request(fetch)
+
+    def update_heatmap_chart(self):
+        """선택 기간의 시간대별 통과율 히트맵 갱신"""
+        start, end = self.period_range()
+
+        def fetch():
+            heatmap = self.test_manager.get_pass_rate_heatmap(start, end)
+            return heatmap if heatmap['count'] else None
+        self.heatmap_chart.request(fetch)
+
+    def selected_test_item(self):
+        """공정 능력 표에서 선택한 테스트 항목"""
+        if not self.spc_table.selectionModel().hasSelection():
+            return None
+        record = self.spc_model.record(self.spc_table.currentIndex().row())
+        return record['test_item'] if record else None
+
+    def update_control_chart(self, start=None, end=None):
+        """선택한 항목의 관리도 갱신 (범위 생략 시 선택 기간 전체)"""
+        test_item = self.selected_test_item()
+        if test_item is None:
+            self.control_chart.clear()
             return
-        
-        filepath = self.visualization_manager.create_daily_trend_graph(self.current_stats)
-        webbrowser.open('file://' + os.path.abspath(filepath)) 
\ No newline at end of file
+        if start is None:
+            start, end = self.period_range()
+        max_points = self.control_chart.pixel_width()
+
+        def fetch():
+            series = self.test_manager.get_control_chart(test_item, start, end, max_points)
+            return series if series['count'] else None
+        self.control_chart.request(fetch)
+
+    def update_measurement_chart(self):
+        """선택한 항목의 측정값 분포/관리도 갱신"""
+        test_item = self.selected_test_item()
+        if test_item is None:
+            self.measurement_chart.clear()
+        else:
+            start_date = self.test_manager.get_period_start(self.current_period())
+            self.measurement_chart.request(
+                lambda: self.test_manager.get_measurement_distribution(test_item, start_date=start_date))
+        self.update_control_chart()
+
+    def done(self, result):
+        """다이얼로그 종료 시 처리 (닫기 버튼, Esc, accept/reject 모두 여기를 거침)"""
+        self.history_service.shutdown()
+        self.render_service.shutdown()
+        # 다음 실행 때 바로 표시할 수 있도록 캐시 스냅샷 저장
+        self.test_manager.save_snapshot()
+        super().done(result)
@@ -1,10 +1,28 @@
 from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QPushButton
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon
-from .dialogs.OC_dialog import OperationsCenterDialog
-from .dialogs.QC_dialog import QualityCenterDialog
+from ..controllers.module_preloader import ModulePreloader
+from ..utils.settings_manager import SettingsManager
 import os
 import sys
 
+# 메인 창이 표시된 뒤 백그라운드에서 미리 import할 하위 시스템 모듈 (점으로 시작하면 이 패키지 기준 상대 경로)
+# 다이얼로그 모듈은 pyserial, TestManager 등을 끌어오므로 메인 창 모듈에서는 직접 import하지 않고
+# 해당 다이얼로그를 열 때 import한다. matplotlib/pandas/jinja2/openpyxl은 다이얼로그 모듈도
+# 쓰는 메서드 안에서 import하므로 다이얼로그를 먼저 로드한 뒤 따로 미리 로드한다.
+PRELOAD_MODULES = [
+    '.dialogs.QC_dialog',
+    '.dialogs.test_history_dialog',
+    '.dialogs.test_statistics_dialog',
+    '.dialogs.OC_dialog',
+    '..utils.statistics_engine',
+    'matplotlib.figure',
+    'matplotlib.backends.backend_agg',
+    'matplotlib.dates',
+    'jinja2',
+    'openpyxl'
+]
+
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     try:
@@ -16,9 +34,16 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, profiler=None):
         super().__init__()
+        self.profiler = profiler
+        self.report_scheduler = None
+        self.preloader = ModulePreloader(PRELOAD_MODULES, __package__, self)
+        if profiler is not None:
+            self.preloader.loaded.connect(lambda name, elapsed: profiler.record(f'preload {name}', elapsed))
         self.initUI()
+        # 창을 먼저 그린 뒤 이벤트 루프에서 무거운 하위 시스템 준비
+        QTimer.singleShot(0, self.start_background_tasks)
 
     def initUI(self):
         self.setWindowTitle('SerialPy')
@@ -43,12 +68,38 @@ class MainWindow(QMainWindow):
         qc_btn.clicked.connect(self.show_quality_center)
         layout.addWidget(qc_btn)
 
+    def start_background_tasks(self):
+        """메인 창 표시 후 모듈 미리 로드와 요약 리포트 자동 생성 시작"""
+        if self.profiler is not None:
+            self.profiler.mark('window_shown')
+        self.preloader.start()
+        self.start_report_scheduler()
+
     def show_operations_center(self):
         """운영 센터 다이얼로그 표시"""
+        from .dialogs.OC_dialog import OperationsCenterDialog
         dialog = OperationsCenterDialog()
         dialog.exec_()
 
     def show_quality_center(self):
         """품질 관리 센터 다이얼로그 표시"""
+        from .dialogs.QC_dialog import QualityCenterDialog
         dialog = QualityCenterDialog()
-        dialog.exec_() 
\ No newline at end of file
+        dialog.exec_()
+
+    def start_report_scheduler(self):
+        """설정에 따라 기간 요약 리포트 자동 생성 시작"""
+        schedule = SettingsManager().get_report_schedule_settings()
+        if not schedule['enabled'] or not schedule['periods'] or self.report_scheduler is not None:
+            return
+        from ..utils.summary_manager import ReportScheduler
+        from ..utils.test_manager import TestManager
+        self.report_scheduler = ReportScheduler(TestManager(), periods=schedule['periods'])
+        self.report_scheduler.start()
+
+    def closeEvent(self, event):
+        """종료 시 모듈 미리 로드와 요약 리포트 자동 생성 중지"""
+        self.preloader.stop()
+        if self.report_scheduler is not None:
+            self.report_scheduler.stop()
+        super().closeEvent(event)
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 파일 이름의 내용 키 (페이지 파일 등 같은 키를 가진 파일은 한 항목으로 취급)
+KEY_LENGTH = 20
+KEY_PATTERN = re.compile(r'_([0-9a-f]{%d})(?:_p\d+)?\.[A-Za-z0-9]+$' % KEY_LENGTH)
+
+class ArtifactCache:
+    """입력 내용 해시로 이름을 붙인 리포트/그래프 파일 캐시
+
+    같은 입력(데이터 + 템플릿/스타일 버전)이면 같은 파일 이름이 되므로 다시 그리지 않고 재사용한다.
+    사용할 때마다 수정 시각을 갱신하고, 오래된 항목부터 기간/용량 한도에 맞춰 삭제한다.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 200 * 1024 * 1024,
+                 max_age_days: float = 30, evict_interval: float = 60):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.evict_interval = evict_interval
+        self.evicted_at = 0.0
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """입력 내용 해시 키"""
+        encoded = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()[:KEY_LENGTH]
+
+    def get(self, filename: str) -> Optional[Path]:
+        """캐시된 파일 경로 (없으면 None), 사용 시각 갱신"""
+        path = self.cache_dir / filename
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, path: Path) -> Path:
+        """새로 만든 파일 등록 (주기적으로 한도 초과분 정리)"""
+        if time.time() - self.evicted_at >= self.evict_interval:
+            self.evict()
+        return path
+
+    def entries(self) -> Dict[str, List[os.DirEntry]]:
+        """내용 키별 캐시 파일 목록"""
+        entries = {}
+        with os.scandir(self.cache_dir) as scan:
+            for entry in scan:
+                match = KEY_PATTERN.search(entry.name)
+                if match and entry.is_file():
+                    entries.setdefault(match.group(1), []).append(entry)
+        return entries
+
+    def evict(self) -> int:
+        """기간이 지났거나 용량 한도를 넘는 항목을 오래 사용하지 않은 순서로 삭제"""
+        self.evicted_at = time.time()
+        items = []
+        for key, files in self.entries().items():
+            stats = [entry.stat() for entry in files]
+            used_at = max(stat.st_mtime for stat in stats)
+            size = sum(stat.st_size for stat in stats)
+            items.append((used_at, size, files))
+
+        items.sort(key=lambda item: item[0])
+        total = sum(size for _, size, _ in items)
+        removed = 0
+        for used_at, size, files in items:
+            if self.evicted_at - used_at <= self.max_age and total <= self.max_bytes:
+                break
+            for entry in files:
+                try:
+                    os.remove(entry.path)
+                except OSError as e:
+                    print(f"캐시 파일 삭제 중 오류 발생: {e}")
+            total -= size
+            removed += 1
+        return removed
@@ -1 +1,198 @@
- 
\ No newline at end of file
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+
+class DBManager:
+    """실행 색인 데이터베이스 관리 (SQLite)
+
+    실행 원본은 JSON 파일로 저장하고, 이 데이터베이스에는 조회용 색인만 둔다.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            serial_number TEXT,
+            lot TEXT,
+            fixture TEXT,
+            station TEXT,
+            result_count INTEGER NOT NULL,
+            failed_count INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_runs_serial ON runs (serial_number, run_id);
+        CREATE INDEX IF NOT EXISTS idx_runs_lot ON runs (lot, run_id);
+        CREATE INDEX IF NOT EXISTS idx_runs_station ON runs (station, run_id);
+        CREATE TABLE IF NOT EXISTS imports (
+            content_hash TEXT PRIMARY KEY,
+            run_id TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.lock, self.connection:
+            self.connection.executescript(self.SCHEMA)
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        self.connection.close()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self.lock:
+            row = self.connection.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row['value'] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self.lock, self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    @staticmethod
+    def run_row(run_id: str, test_data: Dict[str, Any]) -> tuple:
+        """실행 데이터를 runs 테이블 행으로 변환"""
+        dut = test_data.get('dut') or {}
+        results = test_data['results']
+        return (
+            run_id,
+            test_data['timestamp'],
+            dut.get('serial_number') or None,
+            dut.get('lot') or None,
+            dut.get('fixture') or None,
+            dut.get('station') or None,
+            len(results),
+            sum(1 for r in results if r['result'] != 'PASS')
+        )
+
+    def add_runs(self, rows: Iterable[tuple]):
+        """실행 색인 일괄 추가 (단일 트랜잭션)"""
+        with self.lock, self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def add_run(self, run_id: str, test_data: Dict[str, Any]):
+        """실행 색인 추가"""
+        self.add_runs([self.run_row(run_id, test_data)])
+
+    def _existing(self, table: str, column: str, values: Iterable[str]) -> set:
+        values = list(values)
+        found = set()
+        with self.lock:
+            # SQLite 바인딩 변수 개수 제한에 맞춰 나누어 조회
+            for i in range(0, len(values), 500):
+                chunk = values[i:i + 500]
+                sql = f"SELECT {column} FROM {table} WHERE {column} IN ({', '.join('?' * len(chunk))})"
+                found.update(row[0] for row in self.connection.execute(sql, chunk))
+        return found
+
+    def existing_hashes(self, hashes: Iterable[str]) -> set:
+        """이미 가져온 실행 내용 해시 조회"""
+        return self._existing('imports', 'content_hash', hashes)
+
+    def existing_run_ids(self, run_ids: Iterable[str]) -> set:
+        """색인에 이미 있는 실행 ID 조회"""
+        return self._existing('runs', 'run_id', run_ids)
+
+    def add_imported_runs(self, run_rows: Iterable[tuple], hash_rows: Iterable[tuple]):
+        """가져온 실행 색인과 내용 해시를 한 트랜잭션으로 추가"""
+        with self.lock, self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)', run_rows)
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO imports VALUES (?, ?)', hash_rows)
+
+    def remove_run(self, run_id: str):
+        """실행 색인 삭제"""
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM runs WHERE run_id = ?', (run_id,))
+
+    def clear_runs(self):
+        """실행 색인 전체 삭제"""
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM runs')
+
+    def find_runs(self, serial_number: Optional[str] = None,
+                  lot: Optional[str] = None, station: Optional[str] = None,
+                  start_key: Optional[str] = None, end_key: Optional[str] = None) -> List[Dict[str, Any]]:
+        """시리얼 번호/로트/스테이션으로 실행 조회 (최신순, 실행 ID 범위로 좁힐 수 있음)"""
+        conditions = []
+        params = []
+        if serial_number:
+            conditions.append('serial_number = ?')
+            params.append(serial_number)
+        if lot:
+            conditions.append('lot = ?')
+            params.append(lot)
+        if station:
+            conditions.append('station = ?')
+            params.append(station)
+        if not conditions:
+            return []
+        where, range_params = self._key_range(start_key, end_key)
+        where += (' AND ' if where else ' WHERE ') + ' AND '.join(conditions)
+
+        sql = f'SELECT * FROM runs{where} ORDER BY run_id DESC'
+        params = range_params + params
+        with self.lock:
+            return [dict(row) for row in self.connection.execute(sql, params)]
+
+    def run_ids_between(self, start_key: Optional[str] = None, end_key: Optional[str] = None,
+                        limit: Optional[int] = None, descending: bool = True) -> List[str]:
+        """정렬된 실행 ID 색인 범위 조회 (start_key 이상, end_key 미만)"""
+        where, params = self._key_range(start_key, end_key)
+        sql = f"SELECT run_id FROM runs{where} ORDER BY run_id {'DESC' if descending else 'ASC'}"
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        with self.lock:
+            return [row[0] for row in self.connection.execute(sql, params)]
+
+    @staticmethod
+    def _key_range(start_key: Optional[str], end_key: Optional[str]) -> tuple:
+        conditions = []
+        params = []
+        if start_key:
+            conditions.append('run_id >= ?')
+            params.append(start_key)
+        if end_key:
+            conditions.append('run_id < ?')
+            params.append(end_key)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        return where, params
+
+    def runs_between(self, start_key: Optional[str] = None, end_key: Optional[str] = None,
+                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """실행 ID 범위의 실행 색인 행 조회 (최신순)"""
+        where, params = self._key_range(start_key, end_key)
+        sql = f'SELECT * FROM runs{where} ORDER BY run_id DESC'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        with self.lock:
+            return [dict(row) for row in self.connection.execute(sql, params)]
+
+    def run_totals(self, start_key: Optional[str] = None, end_key: Optional[str] = None) -> Dict[str, int]:
+        """실행 ID 범위의 실행 수와 불합격 포함 실행 수"""
+        where, params = self._key_range(start_key, end_key)
+        sql = f'SELECT COUNT(*), COALESCE(SUM(failed_count > 0), 0) FROM runs{where}'
+        with self.lock:
+            runs, failed_runs = self.connection.execute(sql, params).fetchone()
+        return {'runs': runs, 'failed_runs': failed_runs}
+
+    def latest_runs(self, limit: int) -> List[Dict[str, Any]]:
+        """최근 실행 N건 조회"""
+        with self.lock:
+            return [dict(row) for row in self.connection.execute(
+                'SELECT * FROM runs ORDER BY run_id DESC LIMIT ?', (limit,))]
+
+    def count_runs(self) -> int:
+        with self.lock:
+            return self.connection.execute('SELECT COUNT(*) FROM runs').fetchone()[0]
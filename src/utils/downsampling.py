@@ -0,0 +1,66 @@
+import numpy as np
+
+def lttb_indices(x, y, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets로 남길 점의 인덱스 (x 오름차순 가정)
+
+    첫 점과 마지막 점은 항상 남기고, 나머지 구간마다 이전 선택점과 다음 구간 평균이
+    이루는 삼각형 넓이가 가장 큰 점을 고른다. 선의 모양(추세, 꺾임)을 유지한다.
+    """
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (threshold - 2)
+    sampled = np.empty(threshold, dtype='int64')
+    sampled[0] = 0
+    sampled[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        sampled[i + 1] = a
+    return sampled
+
+
+def minmax_indices(x, y, buckets: int) -> np.ndarray:
+    """x 범위를 같은 폭 구간으로 나누어 구간별 최소/최대 점의 인덱스 (x 오름차순 가정)
+
+    이상값(스파이크)을 빠뜨리지 않으므로 원시 측정값처럼 잡음이 많은 데이터에 쓴다.
+    결과는 최대 2 * buckets개이며 원래 순서를 유지한다.
+    """
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    n = len(x)
+    if n <= 2 * buckets or buckets < 1:
+        return np.arange(n)
+
+    span = x[-1] - x[0]
+    if span <= 0:
+        bucket = np.zeros(n, dtype='int64')
+    else:
+        bucket = np.minimum(((x - x[0]) / span * buckets).astype('int64'), buckets - 1)
+
+    # 구간 안에서 y 순으로 정렬하면 구간의 첫 원소가 최소, 마지막 원소가 최대
+    order = np.lexsort((y, bucket))
+    edges = np.searchsorted(bucket, np.arange(buckets + 1))
+    starts, ends = edges[:-1], edges[1:]
+    filled = ends > starts
+    selected = np.concatenate([order[starts[filled]], order[ends[filled] - 1]])
+    return np.unique(selected)
+
+
+def downsample(x, y, max_points: int, method: str = 'lttb') -> np.ndarray:
+    """max_points 이하로 줄일 때 남길 점의 인덱스 (method: 'lttb' 또는 'minmax')"""
+    if method == 'minmax':
+        return minmax_indices(x, y, max(max_points // 2, 1))
+    if method == 'lttb':
+        return lttb_indices(x, y, max_points)
+    raise ValueError(f'알 수 없는 다운샘플링 방식: {method}')
@@ -0,0 +1,181 @@
+import csv
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+from .history_query import HistoryQuery
+from .run_id import new_run_id
+from .settings_manager import SettingsManager
+
+EXPORT_COLUMNS = ['run_id', 'timestamp', 'test_item', 'measured_value', 'reference_value',
+                  'error', 'result', 'serial_number', 'lot', 'station']
+EXPORT_EXTENSIONS = {'CSV': '.csv', 'Excel': '.xlsx', 'JSON': '.jsonl'}
+# 엑셀 시트 최대 행 수 (머리행 포함), 넘으면 다음 시트로 이어 씀
+EXCEL_MAX_ROWS = 1048576
+
+class ExportManager:
+    """테스트 이력을 CSV/Excel/JSON Lines 파일로 스트리밍 내보내기
+
+    이력은 TestManager.iter_history에서 실행 단위로 읽어 바로 파일에 쓰므로
+    전체 결과를 메모리에 올리지 않는다. 파일은 임시 이름으로 쓴 뒤 완료 시 교체한다.
+    """
+
+    def __init__(self, test_manager, settings_manager: Optional[SettingsManager] = None):
+        self.test_manager = test_manager
+        self.settings_manager = settings_manager or SettingsManager()
+
+    def default_path(self, fmt: str) -> Path:
+        """설정의 저장 경로 아래 내보내기 파일 경로"""
+        save_path = Path(self.settings_manager.get_file_settings()['save_path'])
+        return save_path / f'test_history_{new_run_id()}{EXPORT_EXTENSIONS[fmt]}'
+
+    def iter_rows(self, query: HistoryQuery, test_items: Optional[Iterable[str]] = None,
+                  cancel_event: Optional[threading.Event] = None) -> Iterator[Dict[str, Any]]:
+        """내보낼 결과 레코드 (test_items가 있으면 해당 항목만)
+
+        이력 생성기는 실행 파일을 지연해서 읽으므로 레코드를 꺼낼 때마다 데이터 잠금을 잡는다.
+        레코드 사이에는 잠금을 놓으므로 긴 내보내기 중에도 저장/삭제/압축이 진행된다.
+        """
+        items = set(test_items) if test_items else None
+        history = self.test_manager.iter_history(query)
+        while True:
+            with self.test_manager.lock:
+                record = next(history, None)
+            if record is None:
+                return
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            if items is None or record['test_item'] in items:
+                yield record
+
+    def export(self, query: Optional[HistoryQuery] = None, fmt: Optional[str] = None,
+               path: Optional[Path] = None, test_items: Optional[List[str]] = None,
+               progress_callback=None, cancel_event: Optional[threading.Event] = None,
+               chunk_size: int = 1000) -> Dict[str, Any]:
+        """이력 내보내기
+
+        fmt/path를 생략하면 파일 설정(file.format, file.save_path)을 사용한다.
+        progress_callback(기록한 행 수)는 chunk_size 행마다와 마지막에 호출된다.
+        반환: {'path', 'rows', 'cancelled'} (취소 시 파일은 남기지 않음)
+        """
+        query = query or HistoryQuery()
+        fmt = fmt or self.settings_manager.get_file_settings().get('format', 'CSV')
+        if fmt not in EXPORT_EXTENSIONS:
+            raise ValueError(f'지원하지 않는 파일 형식: {fmt}')
+        path = Path(path) if path else self.default_path(fmt)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        writers = {'CSV': self._write_csv, 'Excel': self._write_excel, 'JSON': self._write_jsonl}
+        rows = self.iter_rows(query, test_items, cancel_event)
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            count = writers[fmt](tmp_path, rows, progress_callback, chunk_size)
+            if cancel_event is not None and cancel_event.is_set():
+                tmp_path.unlink()
+                return {'path': None, 'rows': count, 'cancelled': True}
+            tmp_path.replace(path)
+        except Exception:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+        if progress_callback:
+            progress_callback(count)
+        return {'path': str(path), 'rows': count, 'cancelled': False}
+
+    def start(self, query: Optional[HistoryQuery] = None, fmt: Optional[str] = None,
+              path: Optional[Path] = None, test_items: Optional[List[str]] = None) -> 'ExportJob':
+        """백그라운드 스레드에서 내보내기 시작"""
+        job = ExportJob(self, query, fmt, path, test_items)
+        job.start()
+        return job
+
+    @staticmethod
+    def _report(count, progress_callback, chunk_size):
+        if progress_callback and count % chunk_size == 0:
+            progress_callback(count)
+
+    def _write_csv(self, path: Path, rows, progress_callback, chunk_size) -> int:
+        count = 0
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_COLUMNS)
+            for record in rows:
+                writer.writerow([record[column] for column in EXPORT_COLUMNS])
+                count += 1
+                self._report(count, progress_callback, chunk_size)
+        return count
+
+    def _write_jsonl(self, path: Path, rows, progress_callback, chunk_size) -> int:
+        count = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in rows:
+                f.write(json.dumps({column: record[column] for column in EXPORT_COLUMNS},
+                                   ensure_ascii=False))
+                f.write('\n')
+                count += 1
+                self._report(count, progress_callback, chunk_size)
+        return count
+
+    def _write_excel(self, path: Path, rows, progress_callback, chunk_size) -> int:
+        # openpyxl은 Excel로 내보낼 때 import (다이얼로그를 여는 시간 단축)
+        from openpyxl import Workbook
+        # write-only 모드는 행을 바로 직렬화하므로 시트 전체를 메모리에 두지 않음
+        workbook = Workbook(write_only=True)
+        sheet = None
+        sheet_rows = EXCEL_MAX_ROWS
+        count = 0
+        for record in rows:
+            if sheet_rows >= EXCEL_MAX_ROWS:
+                sheet = workbook.create_sheet(f'history_{len(workbook.worksheets) + 1}')
+                sheet.append(EXPORT_COLUMNS)
+                sheet_rows = 1
+            sheet.append([record[column] for column in EXPORT_COLUMNS])
+            sheet_rows += 1
+            count += 1
+            self._report(count, progress_callback, chunk_size)
+
+        if sheet is None:
+            workbook.create_sheet('history_1').append(EXPORT_COLUMNS)
+        workbook.save(path)
+        return count
+
+
+class ExportJob(threading.Thread):
+    """백그라운드 내보내기 작업
+
+    UI는 rows/done/result/error를 주기적으로 확인하고, cancel()로 중단을 요청한다.
+    """
+
+    def __init__(self, manager: ExportManager, query, fmt, path, test_items):
+        super().__init__(daemon=True)
+        self.manager = manager
+        self.query = query
+        self.fmt = fmt
+        self.path = path
+        self.test_items = test_items
+        self.cancel_event = threading.Event()
+        self.rows = 0
+        self.result = None
+        self.error = None
+        self.done = False
+
+    def _on_progress(self, rows: int):
+        self.rows = rows
+
+    def run(self):
+        try:
+            self.result = self.manager.export(
+                self.query, self.fmt, self.path, self.test_items,
+                progress_callback=self._on_progress, cancel_event=self.cancel_event)
+        except Exception as e:
+            print(f"이력 내보내기 중 오류 발생: {e}")
+            self.error = str(e)
+        finally:
+            self.done = True
+
+    def cancel(self):
+        """내보내기 취소 요청"""
+        self.cancel_event.set()
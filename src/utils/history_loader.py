@@ -0,0 +1,219 @@
+import json
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+class RunColumns:
+    """실행/결과를 컬럼 단위로 담는 압축 청크
+
+    실행 단위 값은 실행 테이블에 한 번만 두고, 결과 테이블은 실행 번호로 참조한다.
+    반복되는 문자열(항목, 판정, 단위)은 코드 배열로 저장한다.
+    """
+
+    def __init__(self):
+        # 실행 테이블
+        self.run_ids = []
+        self.timestamps = []
+        self.serial_numbers = []
+        self.lots = []
+        self.fixtures = []
+        self.stations = []
+        # 결과 테이블
+        self.run_index = array('I')
+        self.item_codes = array('H')
+        self.result_codes = array('B')
+        self.unit_codes = array('H')
+        self.measured_values = array('d')
+        self.reference_values = array('d')
+        self.errors = array('d')
+        # 코드 사전
+        self.items = []
+        self.results = []
+        self.units = []
+        self._lookup = {}
+
+    def __len__(self) -> int:
+        return len(self.run_index)
+
+    @property
+    def run_count(self) -> int:
+        return len(self.run_ids)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lookup']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lookup = {}
+
+    def _code(self, table: List[str], value: str) -> int:
+        key = (id(table), value)
+        code = self._lookup.get(key)
+        if code is None:
+            if value in table:
+                code = table.index(value)
+            else:
+                code = len(table)
+                table.append(value)
+            self._lookup[key] = code
+        return code
+
+    def add_run(self, run_id: str, test_data: Dict[str, Any]):
+        """실행 하나 추가"""
+        dut = test_data.get('dut') or {}
+        index = len(self.run_ids)
+        self.run_ids.append(run_id)
+        self.timestamps.append(test_data['timestamp'])
+        self.serial_numbers.append(dut.get('serial_number', ''))
+        self.lots.append(dut.get('lot', ''))
+        self.fixtures.append(dut.get('fixture', ''))
+        self.stations.append(dut.get('station', ''))
+
+        for result in test_data['results']:
+            self.run_index.append(index)
+            self.item_codes.append(self._code(self.items, result['test_item']))
+            self.result_codes.append(self._code(self.results, result['result']))
+            self.unit_codes.append(self._code(self.units, result.get('unit', '')))
+            self.measured_values.append(float(result['measured_value']))
+            self.reference_values.append(float(result['reference_value']))
+            self.errors.append(float(result['error']))
+
+    def extend(self, other: 'RunColumns'):
+        """다른 청크를 뒤에 이어 붙임 (코드 사전 재매핑)"""
+        offset = len(self.run_ids)
+        self.run_ids.extend(other.run_ids)
+        self.timestamps.extend(other.timestamps)
+        self.serial_numbers.extend(other.serial_numbers)
+        self.lots.extend(other.lots)
+        self.fixtures.extend(other.fixtures)
+        self.stations.extend(other.stations)
+
+        item_map = [self._code(self.items, value) for value in other.items]
+        result_map = [self._code(self.results, value) for value in other.results]
+        unit_map = [self._code(self.units, value) for value in other.units]
+        self.run_index.extend(index + offset for index in other.run_index)
+        self.item_codes.extend(item_map[code] for code in other.item_codes)
+        self.result_codes.extend(result_map[code] for code in other.result_codes)
+        self.unit_codes.extend(unit_map[code] for code in other.unit_codes)
+        self.measured_values.extend(other.measured_values)
+        self.reference_values.extend(other.reference_values)
+        self.errors.extend(other.errors)
+
+    def iter_runs(self) -> Iterator[Dict[str, Any]]:
+        """저장 형식과 같은 실행 딕셔너리로 복원"""
+        position = 0
+        total = len(self.run_index)
+        for index, run_id in enumerate(self.run_ids):
+            results = []
+            while position < total and self.run_index[position] == index:
+                results.append({
+                    'test_item': self.items[self.item_codes[position]],
+                    'measured_value': self.measured_values[position],
+                    'reference_value': self.reference_values[position],
+                    'error': self.errors[position],
+                    'result': self.results[self.result_codes[position]],
+                    'unit': self.units[self.unit_codes[position]]
+                })
+                position += 1
+            yield {
+                'run_id': run_id,
+                'timestamp': self.timestamps[index],
+                'dut': {
+                    'serial_number': self.serial_numbers[index],
+                    'lot': self.lots[index],
+                    'fixture': self.fixtures[index],
+                    'station': self.stations[index]
+                },
+                'results': results
+            }
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """get_test_history와 같은 형식의 결과 레코드로 전개"""
+        for position, index in enumerate(self.run_index):
+            yield {
+                'run_id': self.run_ids[index],
+                'timestamp': self.timestamps[index],
+                'test_item': self.items[self.item_codes[position]],
+                'measured_value': self.measured_values[position],
+                'reference_value': self.reference_values[position],
+                'error': self.errors[position],
+                'result': self.results[self.result_codes[position]],
+                'serial_number': self.serial_numbers[index],
+                'lot': self.lots[index],
+                'station': self.stations[index]
+            }
+
+
+def parse_run_files(paths: List[str]) -> RunColumns:
+    """실행 파일 목록을 읽어 컬럼 청크로 변환 (작업 프로세스에서 실행)"""
+    columns = RunColumns()
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                test_data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"실행 파일 읽기 실패 ({path}): {e}")
+            continue
+        run_id = test_data.get('run_id') or Path(path).stem[len('test_'):]
+        columns.add_run(run_id, test_data)
+    return columns
+
+
+class HistoryLoader:
+    """실행 파일을 프로세스 풀로 나누어 병렬로 읽는 대량 로더
+
+    마이그레이션, 감사, 색인 재구성처럼 전체 파일을 읽어야 할 때 사용한다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 500):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.cancelled = False
+
+    def iter_chunks(self, files: Iterable[Path], progress_callback=None,
+                    cancel_event=None) -> Iterator[RunColumns]:
+        """파일 순서를 유지하며 청크 단위로 결과 반환
+
+        progress_callback(완료 파일 수, 전체 파일 수), cancel_event는 threading.Event.
+        취소되면 대기 중인 작업을 버리고 반복을 끝내며 cancelled를 True로 둔다.
+        """
+        files = [str(file) for file in files]
+        batches = [files[i:i + self.chunk_size] for i in range(0, len(files), self.chunk_size)]
+        self.cancelled = False
+        if not batches:
+            return
+
+        done_files = 0
+        pending = {}
+        next_index = 0
+        executor = ProcessPoolExecutor(max_workers=min(self.max_workers, len(batches)))
+        try:
+            futures = {executor.submit(parse_run_files, batch): i for i, batch in enumerate(batches)}
+            for future in as_completed(futures):
+                if cancel_event is not None and cancel_event.is_set():
+                    self.cancelled = True
+                    return
+
+                index = futures[future]
+                pending[index] = future.result()
+                done_files += len(batches[index])
+                if progress_callback:
+                    progress_callback(done_files, len(files))
+
+                # 앞 청크가 모두 끝난 경우에만 순서대로 내보냄
+                while next_index in pending:
+                    yield pending.pop(next_index)
+                    next_index += 1
+        finally:
+            executor.shutdown(wait=not self.cancelled, cancel_futures=True)
+
+    def load(self, files: Iterable[Path], progress_callback=None, cancel_event=None) -> RunColumns:
+        """전체 파일을 하나의 컬럼 청크로 로드"""
+        columns = RunColumns()
+        for chunk in self.iter_chunks(files, progress_callback, cancel_event):
+            columns.extend(chunk)
+        return columns
@@ -0,0 +1,135 @@
+from datetime import date, datetime
+from itertools import islice
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional
+
+# 이력 행에서 정렬할 수 있는 필드
+SORT_FIELDS = ('timestamp', 'test_item', 'measured_value', 'reference_value', 'error', 'result', 'serial_number')
+
+class HistoryQuery:
+    """테스트 이력 조회 조건
+
+    조건은 저장소 단계별로 나누어 평가한다.
+    - 색인(실행 ID/시리얼/로트/스테이션/추적 검색어/기간): 정렬된 실행 색인에서 대상 실행만 골라 직접 조회
+    - 실행 ID(날짜): 파일을 열기 전에 판정
+    - 실행(시리얼/로트/스테이션/추적 검색어): 파일을 읽은 직후 결과 전개 전에 다시 확인 (색인과 파일이 다를 때 대비)
+    - 결과(항목/판정/측정값/오차): 결과 레코드 단위로 판정
+    """
+
+    def __init__(self, test_type: Optional[str] = None,
+                 start_date: Optional[date] = None, end_date: Optional[date] = None,
+                 result: Optional[str] = None,
+                 min_value: Optional[float] = None, max_value: Optional[float] = None,
+                 min_error: Optional[float] = None, max_error: Optional[float] = None,
+                 serial_number: Optional[str] = None, station: Optional[str] = None,
+                 lot: Optional[str] = None, run_ids: Optional[Iterable[str]] = None,
+                 include_archive: bool = False, trace: Optional[str] = None):
+        self.test_type = test_type
+        self.start_date = start_date
+        self.end_date = end_date
+        self.result = result
+        self.min_value = min_value
+        self.max_value = max_value
+        self.min_error = min_error
+        self.max_error = max_error
+        self.serial_number = serial_number
+        self.station = station
+        self.lot = lot
+        self.run_ids = set(run_ids) if run_ids is not None else None
+        self.include_archive = include_archive
+        # 추적 검색어 (시리얼 번호 또는 로트가 일치하는 실행, 색인 조회는 조회 작업 스레드에서 실행)
+        self.trace = trace
+
+    def cache_key(self) -> tuple:
+        """결과 캐시 키 (모든 조건 포함)"""
+        return (
+            self.test_type, self.start_date, self.end_date, self.result,
+            self.min_value, self.max_value, self.min_error, self.max_error,
+            self.serial_number, self.station, self.lot,
+            frozenset(self.run_ids) if self.run_ids is not None else None,
+            self.include_archive, self.trace
+        )
+
+    @staticmethod
+    def key_date(run_key: str) -> date:
+        """실행 키(YYYYMMDD_...)의 날짜"""
+        return datetime.strptime(run_key[:8], '%Y%m%d').date()
+
+    def matches_key(self, run_key: str) -> bool:
+        """실행 ID 단계 조건 (날짜 범위)"""
+        run_date = self.key_date(run_key)
+        if self.start_date and run_date < self.start_date:
+            return False
+        if self.end_date and run_date > self.end_date:
+            return False
+        return True
+
+    @property
+    def has_run_filter(self) -> bool:
+        return bool(self.serial_number or self.station or self.lot or self.trace)
+
+    def matches_run(self, test_data: Dict[str, Any]) -> bool:
+        """실행 단계 조건 (DUT 시리얼/로트/스테이션)"""
+        dut = test_data.get('dut') or {}
+        if self.serial_number and dut.get('serial_number') != self.serial_number:
+            return False
+        if self.lot and dut.get('lot') != self.lot:
+            return False
+        if self.station and dut.get('station') != self.station:
+            return False
+        if self.trace and self.trace not in (dut.get('serial_number'), dut.get('lot')):
+            return False
+        return True
+
+    def matches_result(self, result: Dict[str, Any]) -> bool:
+        """결과 단계 조건 (항목/판정/측정값/오차)"""
+        if self.test_type and result['test_item'] != self.test_type:
+            return False
+        if self.result and result['result'] != self.result:
+            return False
+        if self.min_value is not None and result['measured_value'] < self.min_value:
+            return False
+        if self.max_value is not None and result['measured_value'] > self.max_value:
+            return False
+        if self.min_error is not None and result['error'] < self.min_error:
+            return False
+        if self.max_error is not None and result['error'] > self.max_error:
+            return False
+        return True
+
+
+class HistoryCursor:
+    """조회 결과 이력 행을 요청한 만큼씩 꺼내는 커서
+
+    행 반복자를 앞에서부터 필요한 만큼만 소비하므로 화면에 보이는 행만 읽을 수 있다.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        self.rows = iter(rows)
+        self.fetched = 0
+        self.exhausted = False
+
+    def fetch(self, count: int, cancelled: Optional[Callable[[], bool]] = None) -> List[Dict[str, Any]]:
+        """다음 행을 최대 count개 조회 (남은 행이 없으면 exhausted)
+
+        cancelled()가 참이 되면 그때까지 읽은 행만 반환하고, 커서는 다음 fetch에서 이어 읽는다.
+        """
+        if self.exhausted:
+            return []
+        if cancelled is None:
+            rows = list(islice(self.rows, count))
+            self.exhausted = len(rows) < count
+        else:
+            rows = []
+            # 다음 행(파일 읽기)을 꺼내기 전에 취소 여부 확인
+            while len(rows) < count and not cancelled():
+                row = next(self.rows, None)
+                if row is None:
+                    self.exhausted = True
+                    break
+                rows.append(row)
+        self.fetched += len(rows)
+        return rows
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        while not self.exhausted:
+            yield from self.fetch(1000)
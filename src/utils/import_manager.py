@@ -0,0 +1,356 @@
+import argparse
+import csv
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+from .history_loader import HistoryLoader
+from .run_id import RunIdGenerator
+
+# 열 이름 별칭 (소문자, 괄호 안 단위 제거 후 비교)
+COLUMN_ALIASES = {
+    'run_id': ('run_id', '실행 id'),
+    'timestamp': ('timestamp', 'datetime', 'date', 'time', '날짜', '일시', '시각'),
+    'test_item': ('test_item', 'item', '테스트 항목', '항목'),
+    'measured_value': ('measured_value', 'measured', 'value', '측정값'),
+    'reference_value': ('reference_value', 'reference', '기준값'),
+    'error': ('error', '오차', '오차율'),
+    'result': ('result', '결과', '판정'),
+    'unit': ('unit', '단위'),
+    'serial_number': ('serial_number', 'serial', 'sn', '시리얼', '시리얼 번호'),
+    'lot': ('lot', '로트'),
+    'fixture': ('fixture', '지그', '픽스처'),
+    'station': ('station', '스테이션')
+}
+# 이전 도구에서 쓰던 항목 이름
+ITEM_ALIASES = {
+    'voltage': '전압', 'volt': '전압',
+    'current': '전류',
+    'temperature': '온도', 'temp': '온도',
+    'resistance': '저항'
+}
+RESULT_ALIASES = {
+    'PASS': 'PASS', 'P': 'PASS', 'OK': 'PASS', '합격': 'PASS',
+    'FAIL': 'FAIL', 'F': 'FAIL', 'NG': 'FAIL', '불합격': 'FAIL'
+}
+TIMESTAMP_FORMATS = ('%Y%m%d_%H%M%S', '%Y%m%d%H%M%S', '%Y/%m/%d %H:%M:%S', '%Y/%m/%d %H:%M', '%Y/%m/%d')
+RUN_ID_PATTERN = re.compile(r'^\d{8}_\d{6}_\d{9}_[A-Za-z0-9-]+_\d{6}$')
+UNIT_SUFFIX = re.compile(r'\s*[\(\[].*?[\)\]]\s*$')
+
+class ImportManager:
+    """이전 도구의 CSV/Excel 결과와 기존 test_*.json 디렉토리를 결과 저장소로 대량 가져오기
+
+    입력은 실행 단위로 스트리밍하며 항목 이름을 TestManager.test_items 기준으로 정규화한다.
+    실행 내용 해시를 색인 DB에 남겨 같은 파일을 다시 가져와도 중복되지 않는다.
+    보존 기간이 지난 실행은 원시 파일을 거치지 않고 바로 월별 압축 보관 파일에 쓴다.
+    """
+
+    def __init__(self, test_manager, batch_size: int = 5000):
+        self.test_manager = test_manager
+        self.batch_size = batch_size
+        self.column_lookup = {alias: column for column, aliases in COLUMN_ALIASES.items()
+                              for alias in aliases}
+
+    # ---- 정규화 ----
+
+    def normalize_item(self, name) -> Optional[str]:
+        """항목 이름을 test_items 키로 변환 (알 수 없으면 None)"""
+        if name is None:
+            return None
+        key = UNIT_SUFFIX.sub('', str(name)).strip()
+        if key in self.test_manager.test_items:
+            return key
+        return ITEM_ALIASES.get(key.lower())
+
+    def normalize_column(self, name) -> Optional[str]:
+        if name is None:
+            return None
+        return self.column_lookup.get(UNIT_SUFFIX.sub('', str(name)).strip().lower())
+
+    @staticmethod
+    def parse_time(value) -> datetime:
+        """엑셀 날짜 또는 여러 형식의 문자열을 시각으로 변환"""
+        if isinstance(value, datetime):
+            return value
+        text = str(value).strip()
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
+        for fmt in TIMESTAMP_FORMATS:
+            try:
+                return datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+        raise ValueError(f'시각 형식을 알 수 없음: {value}')
+
+    @staticmethod
+    def parse_number(value) -> Optional[float]:
+        if value is None or value == '':
+            return None
+        if isinstance(value, str):
+            value = value.strip().rstrip('%').replace(',', '')
+        return float(value)
+
+    def normalize_result(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """결과 한 건 검증/정규화 (빠진 기준값, 오차, 판정은 항목 규격으로 계산)"""
+        item = self.normalize_item(row.get('test_item'))
+        if item is None:
+            raise ValueError(f"알 수 없는 테스트 항목: {row.get('test_item')}")
+        spec = self.test_manager.test_items[item]
+
+        measured = self.parse_number(row.get('measured_value'))
+        if measured is None:
+            raise ValueError('측정값 없음')
+        reference = self.parse_number(row.get('reference_value'))
+        if reference is None:
+            reference = spec['reference']
+        error = self.parse_number(row.get('error'))
+        if error is None:
+            error = abs(measured - reference) / reference * 100
+
+        result = RESULT_ALIASES.get(str(row.get('result') or '').strip().upper())
+        if result is None:
+            result = 'PASS' if error <= (spec['tolerance'] / spec['reference'] * 100) else 'FAIL'
+
+        return {
+            'test_item': item,
+            'measured_value': measured,
+            'reference_value': reference,
+            'error': error,
+            'result': result,
+            'unit': row.get('unit') or spec['unit']
+        }
+
+    @staticmethod
+    def content_hash(test_data: Dict[str, Any]) -> str:
+        """실행 ID를 제외한 실행 내용 해시 (재가져오기 중복 판정용)"""
+        content = {key: test_data[key] for key in ('timestamp', 'dut', 'results')}
+        encoded = json.dumps(content, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def finalize_run(self, time: datetime, dut: Dict[str, Any], results: List[Dict[str, Any]],
+                     run_id: Optional[str] = None) -> Dict[str, Any]:
+        """저장 형식의 실행 데이터 생성
+
+        원본에 현재 형식의 실행 ID가 없으면 시각과 내용 해시로 결정적인 ID를 만들어
+        다시 가져와도 같은 ID가 되도록 한다.
+        """
+        test_data = {
+            'timestamp': time.strftime('%Y%m%d_%H%M%S'),
+            'dut': {
+                'serial_number': str(dut.get('serial_number') or ''),
+                'lot': str(dut.get('lot') or ''),
+                'fixture': str(dut.get('fixture') or ''),
+                'station': str(dut.get('station') or '')
+            },
+            'results': results
+        }
+        content_hash = self.content_hash(test_data)
+        if not (run_id and RUN_ID_PATTERN.match(run_id)):
+            run_id = RunIdGenerator.format_id(time, test_data['dut']['station'], int(content_hash[:12], 16))
+        return {'run_id': run_id, **test_data, 'content_hash': content_hash}
+
+    # ---- 입력 형식별 읽기 ----
+
+    def iter_table_runs(self, rows: Iterable[tuple], stats: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """머리행이 있는 표(한 행 = 결과 한 건)를 실행 단위로 묶어 반환
+
+        실행 ID 열이 있으면 그 값으로, 없으면 (시각, 시리얼, 스테이션)이 같은 연속 행을 한 실행으로 본다.
+        """
+        rows = iter(rows)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [self.normalize_column(name) for name in header]
+        if 'timestamp' not in columns or 'test_item' not in columns:
+            raise ValueError(f'필수 열(날짜, 테스트 항목)이 없음: {list(header)}')
+
+        current_key = None
+        current = None
+        for values in rows:
+            row = {column: value for column, value in zip(columns, values) if column}
+            if not any(value not in (None, '') for value in row.values()):
+                continue
+            stats['rows'] += 1
+            try:
+                time = self.parse_time(row['timestamp'])
+                result = self.normalize_result(row)
+            except (KeyError, ValueError, TypeError) as e:
+                self._reject(stats, f"{stats['rows']}행: {e}")
+                continue
+
+            key = (row.get('run_id') or time, row.get('serial_number'), row.get('station'))
+            if key != current_key:
+                if current:
+                    yield self.finalize_run(*current)
+                current_key = key
+                current = (time, row, [], row.get('run_id'))
+            current[2].append(result)
+
+        if current:
+            yield self.finalize_run(*current)
+
+    def iter_csv_runs(self, path: Path, stats: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            yield from self.iter_table_runs(csv.reader(f), stats)
+
+    def iter_excel_runs(self, path: Path, stats: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        # openpyxl은 Excel 파일을 가져올 때 import
+        from openpyxl import load_workbook
+        # read-only 모드는 시트를 행 단위로 읽으므로 파일 전체를 메모리에 올리지 않음
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            for sheet in workbook.worksheets:
+                yield from self.iter_table_runs(sheet.iter_rows(values_only=True), stats)
+        finally:
+            workbook.close()
+
+    def iter_json_runs(self, directory: Path, stats: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """test_*.json 디렉토리 (파일은 병렬 로더로 읽음)"""
+        with os.scandir(directory) as entries:
+            files = sorted(entry.path for entry in entries
+                           if entry.name.startswith('test_') and entry.name.endswith('.json'))
+
+        for chunk in HistoryLoader().iter_chunks(files):
+            for test_data in chunk.iter_runs():
+                stats['rows'] += len(test_data['results'])
+                try:
+                    time = self.parse_time(test_data['timestamp'])
+                    results = [self.normalize_result(result) for result in test_data['results']]
+                except (KeyError, ValueError, TypeError) as e:
+                    self._reject(stats, f"{test_data['run_id']}: {e}")
+                    continue
+                yield self.finalize_run(time, test_data['dut'], results, test_data['run_id'])
+
+    def iter_runs(self, path: Path, stats: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """경로 형식에 따라 실행 단위로 읽기"""
+        path = Path(path)
+        if path.is_dir():
+            return self.iter_json_runs(path, stats)
+        suffix = path.suffix.lower()
+        if suffix == '.csv':
+            return self.iter_csv_runs(path, stats)
+        if suffix in ('.xlsx', '.xlsm'):
+            return self.iter_excel_runs(path, stats)
+        raise ValueError(f'지원하지 않는 가져오기 형식: {path}')
+
+    @staticmethod
+    def _reject(stats: Dict[str, Any], message: str):
+        stats['rejected'] += 1
+        # 오류 메시지는 앞부분만 보관
+        if len(stats['errors']) < 100:
+            stats['errors'].append(message)
+
+    # ---- 저장 ----
+
+    def import_paths(self, paths: Iterable[Path], progress_callback=None,
+                     cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """파일/디렉토리 목록 가져오기
+
+        progress_callback(가져온 실행 수)는 배치마다 호출되고,
+        cancel_event가 설정되면 현재 배치까지만 저장하고 끝낸다.
+        반환: {'runs', 'rows', 'duplicates', 'rejected', 'errors', 'cancelled'}
+        """
+        stats = {'runs': 0, 'rows': 0, 'duplicates': 0, 'rejected': 0, 'errors': [], 'cancelled': False}
+        # 가져온 실행을 색인에 바로 추가하므로 기존 색인부터 맞춤
+        self.test_manager.ensure_run_index()
+        raw_days = self.test_manager.retention_settings['raw_days']
+        cutoff = (datetime.now().date() - timedelta(days=raw_days)).strftime('%Y%m%d')
+
+        batch = []
+        for path in paths:
+            try:
+                for test_data in self.iter_runs(path, stats):
+                    batch.append(test_data)
+                    if len(batch) >= self.batch_size:
+                        self._write_batch(batch, cutoff, stats)
+                        batch = []
+                        if progress_callback:
+                            progress_callback(stats['runs'])
+                    if cancel_event is not None and cancel_event.is_set():
+                        stats['cancelled'] = True
+                        break
+            except (OSError, ValueError) as e:
+                self._reject(stats, f'{path}: {e}')
+            if stats['cancelled']:
+                break
+
+        self._write_batch(batch, cutoff, stats)
+        if progress_callback:
+            progress_callback(stats['runs'])
+        return stats
+
+    def _write_batch(self, batch: List[Dict[str, Any]], cutoff: str, stats: Dict[str, Any]):
+        """중복을 걸러 실행 파일/보관 파일에 쓰고 색인과 해시를 한 트랜잭션으로 추가"""
+        if not batch:
+            return
+        # 파일/보관 파일/색인/증분 통계를 쓰는 동안 같은 data 디렉토리의 다른 스레드 작업을 막음
+        with self.test_manager.lock:
+            db_manager = self.test_manager.db_manager
+            known = db_manager.existing_hashes(test_data['content_hash'] for test_data in batch)
+            # 이미 저장소에 있는 실행(같은 ID)도 중복으로 취급
+            stored = db_manager.existing_run_ids(test_data['run_id'] for test_data in batch)
+            runs = []
+            for test_data in batch:
+                content_hash = test_data.pop('content_hash')
+                if content_hash in known or test_data['run_id'] in stored:
+                    stats['duplicates'] += 1
+                    continue
+                known.add(content_hash)
+                stored.add(test_data['run_id'])
+                runs.append((content_hash, test_data))
+            if not runs:
+                return
+
+            runs.sort(key=lambda item: item[1]['run_id'])
+            archived = {}
+            for _, test_data in runs:
+                if test_data['run_id'][:8] < cutoff:
+                    archived.setdefault(test_data['run_id'][:6], []).append(test_data)
+                else:
+                    with open(self.test_manager.data_dir / f"test_{test_data['run_id']}.json", 'w', encoding='utf-8') as f:
+                        json.dump(test_data, f, ensure_ascii=False)
+
+            archive_dir = self.test_manager.archive_dir
+            if archived and not archive_dir.exists():
+                archive_dir.mkdir(parents=True)
+            for month, month_runs in archived.items():
+                with gzip.open(archive_dir / f'test_{month}.jsonl.gz', 'at', encoding='utf-8') as archive:
+                    archive.writelines(json.dumps(test_data, ensure_ascii=False) + '\n' for test_data in month_runs)
+
+            db_manager.add_imported_runs(
+                [db_manager.run_row(test_data['run_id'], test_data) for _, test_data in runs],
+                [(content_hash, test_data['run_id']) for content_hash, test_data in runs]
+            )
+            self.test_manager.register_runs([test_data for _, test_data in runs])
+            stats['runs'] += len(runs)
+
+
+def main():
+    """명령행 대량 가져오기: python -m src.utils.import_manager <파일 또는 디렉토리>..."""
+    from .test_manager import TestManager
+
+    parser = argparse.ArgumentParser(description='테스트 결과 대량 가져오기 (CSV, Excel, test_*.json 디렉토리)')
+    parser.add_argument('paths', nargs='+', help='가져올 CSV/Excel 파일 또는 test_*.json 디렉토리')
+    parser.add_argument('--data-dir', default=None, help='결과 저장 디렉토리 (기본: data)')
+    parser.add_argument('--batch-size', type=int, default=5000, help='트랜잭션당 실행 수')
+    args = parser.parse_args()
+
+    importer = ImportManager(TestManager(data_dir=args.data_dir), batch_size=args.batch_size)
+    stats = importer.import_paths(
+        args.paths, progress_callback=lambda runs: print(f'{runs:,}개 실행 가져옴', flush=True))
+    print(f"완료: 실행 {stats['runs']:,}, 결과 행 {stats['rows']:,}, "
+          f"중복 {stats['duplicates']:,}, 제외 {stats['rejected']:,}")
+    for message in stats['errors']:
+        print(f'  {message}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,36 +1,23 @@
+import hashlib
+import json
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
-import pandas as pd
-import jinja2
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from .run_id import new_run_id
+from .artifact_cache import ArtifactCache
 
-class ReportGenerator:
-    def __init__(self):
-        self.report_dir = Path('data/reports')
-        self.ensure_report_dir()
-        self.template_dir = Path('templates')
-        self.ensure_template_dir()
-
-    def ensure_report_dir(self):
-        """리포트 저장 디렉토리 생성"""
-        if not self.report_dir.exists():
-            self.report_dir.mkdir(parents=True)
-
-    def ensure_template_dir(self):
-        """템플릿 디렉토리 생성"""
-        if not self.template_dir.exists():
-            self.template_dir.mkdir(parents=True)
-            self.create_default_template()
+if TYPE_CHECKING:
+    import jinja2
 
-    def create_default_template(self):
-        """기본 HTML 템플릿 생성"""
-        template = """
-<!DOCTYPE html>
+# 모든 리포트가 상속하는 기본 레이아웃
+BASE_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>테스트 리포트 - {{ test_type }}</title>
+    <title>{% block title %}{{ self.report_name() }}{% endblock %}</title>
     <style>
         body {
             font-family: Arial, sans-serif;
@@ -110,15 +97,41 @@ class ReportGenerator:
             color: #666;
         }
     </style>
+    {% block style %}{% endblock %}
 </head>
 <body>
     <div class="container">
         <div class="header">
+            {% block header %}
+            <h1>{{ self.report_name() }}</h1>
+            <p>생성 시간: {{ timestamp }}</p>
+            {% endblock %}
+        </div>
+
+        {% block content %}{% endblock %}
+
+        <div class="footer">
+            <p>EVAR Tool - {% block report_name %}테스트 리포트{% endblock %}</p>
+            <p>생성 시간: {{ timestamp }}</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# 단일 테스트 실행 리포트
+REPORT_TEMPLATE = """{% extends "base.html" %}
+{% import "macros.html" as macros %}
+
+{% block title %}테스트 리포트 - {{ test_type }}{% endblock %}
+
+{% block header %}
             <h1>테스트 리포트</h1>
             <p>테스트 유형: {{ test_type }}</p>
             <p>생성 시간: {{ timestamp }}</p>
-        </div>
+{% endblock %}
 
+{% block content %}
         <div class="summary">
             <h2>테스트 요약</h2>
             <div class="summary-grid">
@@ -142,77 +155,671 @@ class ReportGenerator:
         </div>
 
         <h2>상세 결과</h2>
+        {% if page_count > 1 %}
+        <p>전체 {{ total_tests }}건 중 1-{{ results|length }}건</p>
+        {{ macros.page_links(pages) }}
+        {% endif %}
+        {{ macros.result_table(results) }}
+{% endblock %}
+"""
+
+# 리포트 공용 매크로 (결과 표, 페이지 링크)
+MACROS_TEMPLATE = """{% macro result_table(results) %}
+    <table>
+        <thead>
+            <tr>
+                <th>테스트 항목</th>
+                <th>측정값</th>
+                <th>기준값</th>
+                <th>단위</th>
+                <th>결과</th>
+            </tr>
+        </thead>
+        <tbody>
+            {% for result in results %}
+            <tr>
+                <td>{{ result.test_item }}</td>
+                <td>{{ "%.2f"|format(result.measured_value) }}</td>
+                <td>{{ "%.2f"|format(result.reference_value) }}</td>
+                <td>{{ result.unit }}</td>
+                <td class="{{ result.result.lower() }}">{{ result.result }}</td>
+            </tr>
+            {% endfor %}
+        </tbody>
+    </table>
+{% endmacro %}
+
+{% macro page_links(pages) %}
+<p class="pages">
+    페이지:
+    {% for page in pages %}
+    <a href="{{ page.filename }}">{{ page.number }}</a>
+    {% endfor %}
+</p>
+{% endmacro %}
+"""
+
+# 큰 결과 표의 2페이지 이후
+PAGE_TEMPLATE = """{% extends "base.html" %}
+{% import "macros.html" as macros %}
+
+{% block title %}테스트 리포트 - {{ test_type }} ({{ page_number }}페이지){% endblock %}
+
+{% block header %}
+            <h1>테스트 리포트</h1>
+            <p>테스트 유형: {{ test_type }}</p>
+            <p>{{ page_number }}페이지 ({{ first_row }}-{{ last_row }}건)</p>
+{% endblock %}
+
+{% block content %}
+        <p class="pages">
+            <a href="{{ report_filename }}">요약</a>
+            {% if previous_filename %}<a href="{{ previous_filename }}">이전</a>{% endif %}
+            {% if next_filename %}<a href="{{ next_filename }}">다음</a>{% endif %}
+        </p>
+        {{ macros.result_table(results) }}
+{% endblock %}
+"""
+
+# 일괄 리포트 목차
+INDEX_TEMPLATE = """{% extends "base.html" %}
+
+{% block report_name %}일괄 리포트{% endblock %}
+
+{% block header %}
+            <h1>일괄 리포트</h1>
+            <p>조건: {{ description }}</p>
+            <p>생성 시간: {{ timestamp }}</p>
+{% endblock %}
+
+{% block content %}
+        <div class="summary">
+            <h2>요약</h2>
+            <div class="summary-grid">
+                <div class="summary-item">
+                    <h3>실행</h3>
+                    <p>{{ run_count }}</p>
+                </div>
+                <div class="summary-item">
+                    <h3>전체 테스트</h3>
+                    <p>{{ total_tests }}</p>
+                </div>
+                <div class="summary-item">
+                    <h3>실패</h3>
+                    <p class="fail">{{ failed_tests }}</p>
+                </div>
+                <div class="summary-item">
+                    <h3>통과율</h3>
+                    <p>{{ "%.1f"|format(pass_rate) }}%</p>
+                </div>
+            </div>
+        </div>
+
+        <h2>실행 목록</h2>
         <table>
             <thead>
                 <tr>
-                    <th>테스트 항목</th>
-                    <th>측정값</th>
-                    <th>기준값</th>
-                    <th>단위</th>
+                    <th>실행 ID</th>
+                    <th>시리얼</th>
+                    <th>로트</th>
+                    <th>스테이션</th>
+                    <th>통과/전체</th>
                     <th>결과</th>
                 </tr>
             </thead>
             <tbody>
-                {% for result in results %}
+                {% for run in runs %}
                 <tr>
-                    <td>{{ result.test_item }}</td>
-                    <td>{{ "%.2f"|format(result.measured_value) }}</td>
-                    <td>{{ "%.2f"|format(result.reference_value) }}</td>
-                    <td>{{ result.unit }}</td>
-                    <td class="{{ result.result.lower() }}">{{ result.result }}</td>
+                    <td><a href="{{ run.filename }}">{{ run.run_id }}</a></td>
+                    <td>{{ run.serial_number }}</td>
+                    <td>{{ run.lot }}</td>
+                    <td>{{ run.station }}</td>
+                    <td>{{ run.passed_tests }}/{{ run.total_tests }}</td>
+                    <td class="{{ 'fail' if run.failed_tests else 'pass' }}">{{ 'FAIL' if run.failed_tests else 'PASS' }}</td>
                 </tr>
                 {% endfor %}
             </tbody>
         </table>
+{% endblock %}
+"""
 
-        <div class="footer">
-            <p>EVAR Tool - 테스트 리포트</p>
+# 기간(근무조/일/주/월)·로트 요약 리포트
+SUMMARY_TEMPLATE = """{% extends "base.html" %}
+
+{% block report_name %}{{ kind_name }} 요약 리포트{% endblock %}
+
+{% block style %}
+    <style>
+        .trend td.bar { width: 60%; }
+        .trend .bar-fill {
+            height: 14px;
+            background-color: #28a745;
+        }
+    </style>
+{% endblock %}
+
+{% block header %}
+            <h1>{{ kind_name }} 요약 리포트</h1>
+            <p>{{ label }}{% if start %} ({{ start }} ~ {{ end }}){% endif %}</p>
             <p>생성 시간: {{ timestamp }}</p>
+{% endblock %}
+
+{% block content %}
+        <div class="summary">
+            <h2>요약</h2>
+            <div class="summary-grid">
+                <div class="summary-item">
+                    <h3>실행</h3>
+                    <p>{{ run_count }}</p>
+                </div>
+                <div class="summary-item">
+                    <h3>불합격 실행</h3>
+                    <p class="fail">{{ failed_runs }}</p>
+                </div>
+                <div class="summary-item">
+                    <h3>전체 테스트</h3>
+                    <p>{{ total_tests }}</p>
+                </div>
+                <div class="summary-item">
+                    <h3>통과율</h3>
+                    <p>{{ "%.1f"|format(pass_rate) }}%</p>
+                </div>
+            </div>
         </div>
-    </div>
-</body>
-</html>
+
+        <h2>통과율 추이</h2>
+        <table class="trend">
+            <tbody>
+                {% for point in trend %}
+                <tr>
+                    <td>{{ point.label }}</td>
+                    <td class="bar"><div class="bar-fill" style="width: {{ "%.1f"|format(point.pass_rate) }}%"></div></td>
+                    <td>{{ "%.1f"|format(point.pass_rate) }}%</td>
+                    <td>{{ point.total }}건</td>
+                </tr>
+                {% endfor %}
+            </tbody>
+        </table>
+
+        <h2>불합격 상위 항목</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>테스트 항목</th>
+                    <th>불합격</th>
+                    <th>전체</th>
+                    <th>수율</th>
+                </tr>
+            </thead>
+            <tbody>
+                {% for item in top_failures %}
+                <tr>
+                    <td>{{ item.test_item }}</td>
+                    <td class="fail">{{ item.failed }}</td>
+                    <td>{{ item.count }}</td>
+                    <td>{{ "%.1f"|format(item.pass_rate) }}%</td>
+                </tr>
+                {% else %}
+                <tr><td colspan="4">불합격 없음</td></tr>
+                {% endfor %}
+            </tbody>
+        </table>
+
+        <h2>항목별 수율 및 공정 능력</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>테스트 항목</th>
+                    <th>전체</th>
+                    <th>수율</th>
+                    <th>평균</th>
+                    <th>표준편차</th>
+                    <th>기간 Ppk</th>
+                    <th>현재 Cpk</th>
+                </tr>
+            </thead>
+            <tbody>
+                {% for item in items %}
+                <tr>
+                    <td>{{ item.test_item }}</td>
+                    <td>{{ item.count }}</td>
+                    <td>{{ "%.1f"|format(item.pass_rate) }}%</td>
+                    <td>{{ "%.3f"|format(item.mean) if item.mean is not none else '-' }}</td>
+                    <td>{{ "%.3f"|format(item.std) if item.std is not none else '-' }}</td>
+                    <td>{{ "%.2f"|format(item.ppk) if item.ppk is not none else '-' }}</td>
+                    <td>{{ "%.2f"|format(item.cpk) if item.cpk is not none else '-' }}</td>
+                </tr>
+                {% endfor %}
+            </tbody>
+        </table>
+
+        <h2>실행 목록</h2>
+        {% if runs|length < run_count %}
+        <p>전체 {{ run_count }}건 중 최근 {{ runs|length }}건</p>
+        {% endif %}
+        <table>
+            <thead>
+                <tr>
+                    <th>실행 ID</th>
+                    <th>시리얼</th>
+                    <th>로트</th>
+                    <th>스테이션</th>
+                    <th>불합격/전체</th>
+                    <th>결과</th>
+                </tr>
+            </thead>
+            <tbody>
+                {% for run in runs %}
+                <tr>
+                    <td>{{ run.run_id }}</td>
+                    <td>{{ run.serial_number or '' }}</td>
+                    <td>{{ run.lot or '' }}</td>
+                    <td>{{ run.station or '' }}</td>
+                    <td>{{ run.failed_count }}/{{ run.result_count }}</td>
+                    <td class="{{ 'fail' if run.failed_count else 'pass' }}">{{ 'FAIL' if run.failed_count else 'PASS' }}</td>
+                </tr>
+                {% endfor %}
+            </tbody>
+        </table>
+{% endblock %}
 """
-        template_path = self.template_dir / 'report_template.html'
-        with open(template_path, 'w', encoding='utf-8') as f:
-            f.write(template)
 
-    def generate_report(self, test_data: Dict[str, Any]) -> str:
-        """테스트 리포트 생성"""
+DEFAULT_TEMPLATES = {
+    'base.html': BASE_TEMPLATE,
+    'macros.html': MACROS_TEMPLATE,
+    'report_template.html': REPORT_TEMPLATE,
+    'report_page.html': PAGE_TEMPLATE,
+    'report_index.html': INDEX_TEMPLATE,
+    'summary_report.html': SUMMARY_TEMPLATE
+}
+
+# 기본 템플릿 버전 (DEFAULT_TEMPLATES 내용이 바뀌면 올려서 수정되지 않은 기존 기본 템플릿을 교체)
+TEMPLATE_VERSION = 2
+# 버전 표식이 생기기 전에 생성된 기본 템플릿의 내용 해시 (수정되지 않았으면 교체 대상)
+LEGACY_TEMPLATE_HASHES = {
+    'report_template.html': {
+        'ff6f34447854810c1029961051354a653bd62b9ea9ed086779d7f548af158104',
+        '65c881d6aaa24572f5ce7d4b1989d62743817cbea1ba7458262439d3d398b0ea'
+    }
+}
+# 템플릿 디렉토리에 남기는 기본 템플릿 버전/내용 해시 기록
+TEMPLATE_MANIFEST = '.default_templates.json'
+
+# 리포트 형식 버전 (리포트 내용 계산 방식이 바뀌면 올려서 캐시 무효화)
+REPORT_VERSION = 1
+# 리포트 캐시 한도
+REPORT_CACHE_MAX_BYTES = 500 * 1024 * 1024
+REPORT_CACHE_MAX_AGE_DAYS = 30
+
+# 저장된 실행에는 유형이 없음 (QC 테스트 화면에서 저장)
+DEFAULT_TEST_TYPE = 'QC'
+
+# 리포트 한 페이지에 넣는 최대 결과 수 (넘으면 페이지 파일로 나눔)
+REPORT_PAGE_SIZE = 1000
+
+def template_hash(text: str) -> str:
+    """템플릿 내용 해시 (파일을 쓴 OS와 관계없이 같도록 줄바꿈을 맞춘 뒤 계산)"""
+    return hashlib.sha256(text.replace('\r\n', '\n').encode('utf-8')).hexdigest()
+
+# 템플릿 디렉토리별 공용 환경 (템플릿은 프로세스당 한 번만 컴파일)
+_environments = {}
+
+def get_environment(template_dir: Path, cache_dir: Path = Path('data/cache/jinja')) -> 'jinja2.Environment':
+    """템플릿 디렉토리의 공용 jinja2 환경
+
+    템플릿 파일이 바뀌면 auto_reload로 다시 읽고,
+    컴파일 결과는 바이트코드 캐시에 저장해 다음 실행에서도 재사용한다.
+    jinja2는 리포트를 처음 만들 때 import한다 (프로그램 시작 시간 단축).
+    """
+    import jinja2
+    key = str(Path(template_dir).resolve())
+    if key not in _environments:
+        if not cache_dir.exists():
+            cache_dir.mkdir(parents=True)
+        _environments[key] = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(str(template_dir), encoding='utf-8'),
+            auto_reload=True,
+            bytecode_cache=jinja2.FileSystemBytecodeCache(str(cache_dir))
+        )
+    return _environments[key]
+
+# 작업 프로세스마다 하나씩 두는 생성기 (템플릿 환경을 작업 간에 재사용)
+_worker_generator = None
+
+def render_run_reports(paths: List[str], report_dir: str, query) -> List[Dict[str, Any]]:
+    """실행 파일들의 리포트 생성 후 실행별 요약 반환 (작업 프로세스에서 실행)"""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = ReportGenerator()
+    generator = _worker_generator
+
+    summaries = []
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                test_data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"실행 파일 읽기 실패 ({path}): {e}")
+            continue
+        if query is not None and query.has_run_filter and not query.matches_run(test_data):
+            continue
+
+        filepath = generator.generate_report(test_data, report_dir=Path(report_dir))
+        dut = test_data.get('dut') or {}
+        results = test_data['results']
+        passed_tests = sum(1 for r in results if r['result'] == 'PASS')
+        summaries.append({
+            'run_id': test_data.get('run_id', test_data['timestamp']),
+            'serial_number': dut.get('serial_number', ''),
+            'lot': dut.get('lot', ''),
+            'station': dut.get('station', ''),
+            'total_tests': len(results),
+            'passed_tests': passed_tests,
+            'failed_tests': len(results) - passed_tests,
+            'filename': Path(filepath).name
+        })
+    return summaries
+
+
+class ReportGenerator:
+    def __init__(self):
+        self.report_dir = Path('data/reports')
+        self.ensure_report_dir()
+        self.template_dir = Path('templates')
+        self.ensure_template_dir()
+        self.environment = get_environment(self.template_dir)
+        self.artifact_cache = ArtifactCache(self.report_dir, REPORT_CACHE_MAX_BYTES, REPORT_CACHE_MAX_AGE_DAYS)
+
+    def ensure_report_dir(self):
+        """리포트 저장 디렉토리 생성"""
+        if not self.report_dir.exists():
+            self.report_dir.mkdir(parents=True)
+
+    def ensure_template_dir(self):
+        """템플릿 디렉토리 생성"""
+        if not self.template_dir.exists():
+            self.template_dir.mkdir(parents=True)
+        self.create_default_template()
+
+    def create_default_template(self):
+        """기본 HTML 템플릿 생성/갱신
+
+        없는 템플릿은 만들고, 기본 템플릿 버전이 바뀌었으면 이전 기본 템플릿 중
+        수정되지 않은 것(기록한 해시 또는 이전 버전 해시와 같은 것)만 새 내용으로 교체한다.
+        사용자가 수정한 템플릿은 그대로 둔다.
+        """
+        manifest = self.load_template_manifest()
+        outdated = manifest.get('version') != TEMPLATE_VERSION
+        written = manifest.get('hashes', {})
+        hashes = dict(written)
+
+        for name, template in DEFAULT_TEMPLATES.items():
+            template_path = self.template_dir / name
+            default_hash = template_hash(template)
+            if template_path.exists():
+                if not outdated:
+                    continue
+                with open(template_path, 'r', encoding='utf-8') as f:
+                    current_hash = template_hash(f.read())
+                if current_hash == default_hash:
+                    hashes[name] = default_hash
+                    continue
+                if current_hash != written.get(name) and current_hash not in LEGACY_TEMPLATE_HASHES.get(name, ()):
+                    # 사용자가 수정한 템플릿
+                    continue
+
+            tmp_path = template_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(template)
+            tmp_path.replace(template_path)
+            hashes[name] = default_hash
+
+        if outdated or hashes != written:
+            self.save_template_manifest({'version': TEMPLATE_VERSION, 'hashes': hashes})
+
+    def load_template_manifest(self) -> Dict[str, Any]:
+        """기본 템플릿 기록 로드 (없거나 읽을 수 없으면 버전 표식 이전 설치로 봄)"""
+        manifest_path = self.template_dir / TEMPLATE_MANIFEST
+        if not manifest_path.exists():
+            return {}
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"템플릿 기록 로드 중 오류 발생: {e}")
+            return {}
+
+    def save_template_manifest(self, manifest: Dict[str, Any]):
+        manifest_path = self.template_dir / TEMPLATE_MANIFEST
+        tmp_path = manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        tmp_path.replace(manifest_path)
+
+    def template_version(self) -> List[tuple]:
+        """템플릿 파일 변경 표식 (리포트 캐시 키에 포함)"""
+        return [(name, (self.template_dir / name).stat().st_mtime_ns) for name in sorted(DEFAULT_TEMPLATES)]
+
+    def render_to_file(self, template_name: str, filepath: Path, **context):
+        """템플릿 출력을 문자열로 모으지 않고 조각 단위로 파일에 기록 (완료 후 교체)"""
+        template = self.environment.get_template(template_name)
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(template.generate(**context))
+        tmp_path.replace(filepath)
+
+    def generate_report(self, test_data: Dict[str, Any], page_size: int = REPORT_PAGE_SIZE,
+                        report_dir: Optional[Path] = None) -> str:
+        """테스트 리포트 생성
+
+        results는 리스트 대신 반복자여도 되며 한 번만 순회한다.
+        요약은 순회하면서 계산하고, page_size를 넘는 결과는 페이지 파일로 나누어
+        메모리에는 첫 페이지와 작성 중인 페이지만 둔다.
+        기본 리포트 디렉토리에 만드는 리스트 결과 리포트는 내용 해시로 캐시한다.
+        """
         if not test_data or 'results' not in test_data:
             return None
 
-        # 테스트 요약 정보 계산
-        total_tests = len(test_data['results'])
-        passed_tests = sum(1 for r in test_data['results'] if r['result'] == 'PASS')
+        cacheable = report_dir is None and isinstance(test_data['results'], list)
+        report_dir = report_dir or self.report_dir
+        test_type = test_data.get('test_type') or DEFAULT_TEST_TYPE
+
+        if cacheable:
+            # 같은 데이터와 템플릿이면 같은 파일 이름이 되어 이전 리포트를 그대로 사용
+            report_id = self.artifact_cache.make_key(
+                'report', REPORT_VERSION, self.template_version(), page_size, test_data)
+            cached = self.artifact_cache.get(f'report_{test_type}_{report_id}.html')
+            if cached:
+                return str(cached)
+        else:
+            # 같은 초에 생성되어도 겹치지 않는 ID 사용
+            report_id = test_data.get('run_id') or new_run_id()
+        stem = f"report_{test_type}_{report_id}"
+        filename = f'{stem}.html'
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        def page_filename(number):
+            return f'{stem}_p{number}.html'
+
+        def write_page(number, rows, first_row, has_next):
+            self.render_to_file(
+                'report_page.html', report_dir / page_filename(number),
+                test_type=test_type,
+                timestamp=timestamp,
+                page_number=number,
+                first_row=first_row,
+                last_row=first_row + len(rows) - 1,
+                results=rows,
+                report_filename=filename,
+                previous_filename=page_filename(number - 1) if number > 2 else filename,
+                next_filename=page_filename(number + 1) if has_next else None
+            )
+
+        # 한 번 순회하며 요약 계산과 페이지 분할
+        total_tests = 0
+        passed_tests = 0
+        first_page = []
+        page = first_page
+        page_number = 1
+        page_start = 1
+        for result in test_data['results']:
+            if len(page) >= page_size:
+                if page is not first_page:
+                    write_page(page_number, page, page_start, has_next=True)
+                page_number += 1
+                page_start = total_tests + 1
+                page = []
+            page.append(result)
+            total_tests += 1
+            if result['result'] == 'PASS':
+                passed_tests += 1
+        if page is not first_page:
+            write_page(page_number, page, page_start, has_next=False)
+
         failed_tests = total_tests - passed_tests
         pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
 
-        # 템플릿 로드
-        template_path = self.template_dir / 'report_template.html'
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template = jinja2.Template(f.read())
+        # 요약과 첫 페이지를 담은 리포트 본문
+        filepath = report_dir / filename
+        self.render_to_file(
+            'report_template.html', filepath,
+            test_type=test_type,
+            timestamp=timestamp,
+            total_tests=total_tests,
+            passed_tests=passed_tests,
+            failed_tests=failed_tests,
+            pass_rate=pass_rate,
+            results=first_page,
+            page_count=page_number,
+            pages=[{'number': 1, 'filename': filename}] + [
+                {'number': number, 'filename': page_filename(number)}
+                for number in range(2, page_number + 1)
+            ]
+        )
 
-        # 리포트 데이터 준비
-        report_data = {
-            'test_type': test_data['test_type'],
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'total_tests': total_tests,
-            'passed_tests': passed_tests,
-            'failed_tests': failed_tests,
-            'pass_rate': pass_rate,
-            'results': test_data['results']
-        }
+        if cacheable:
+            self.artifact_cache.put(filepath)
+        return str(filepath)
+
+    def generate_summary_report(self, summary: Dict[str, Any], report_dir: Optional[Path] = None) -> str:
+        """SummaryManager.build() 결과로 기간/로트 요약 리포트 생성
+
+        report_dir을 지정하면 summary_<기간 ID>.html 고정 이름으로 쓰고(예약 생성용),
+        생략하면 기본 리포트 디렉토리에 내용 해시 이름으로 캐시한다.
+        """
+        if report_dir is None:
+            key = self.artifact_cache.make_key('summary', REPORT_VERSION, self.template_version(), summary)
+            filename = f"summary_{summary['kind']}_{key}.html"
+            cached = self.artifact_cache.get(filename)
+            if cached:
+                return str(cached)
+            filepath = self.report_dir / filename
+        else:
+            filepath = Path(report_dir) / f"summary_{summary['period_id']}.html"
+
+        self.render_to_file(
+            'summary_report.html', filepath,
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            **summary
+        )
+        if report_dir is None:
+            self.artifact_cache.put(filepath)
+        return str(filepath)
+
+    def generate_batch(self, test_manager, query, description: str = '',
+                       progress_callback=None, cancel_event: Optional[threading.Event] = None,
+                       max_workers: Optional[int] = None, chunk_size: int = 50) -> Dict[str, Any]:
+        """조건에 맞는 실행들의 리포트와 목차 페이지를 작업 프로세스로 병렬 생성
+
+        실행 선택은 test_manager의 색인(기간, 시리얼, 로트)으로 하고 스테이션 조건은 작업 프로세스에서 확인한다.
+        결과는 report_dir/batch_<ID>/ 아래에 두며 보관(압축)된 실행은 제외한다.
+        progress_callback(완료 실행 수, 전체 실행 수), cancel_event는 threading.Event.
+        반환: {'index', 'runs', 'cancelled'}
+        """
+        run_ids = test_manager.find_run_ids(query)
+        paths = [str(path) for path in (test_manager.data_dir / f'test_{run_id}.json' for run_id in run_ids)
+                 if path.exists()]
+        batch_dir = self.report_dir / f'batch_{new_run_id()}'
+        batch_dir.mkdir(parents=True)
+
+        chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+        runs = []
+        done = 0
+        cancelled = False
+        if chunks:
+            executor = ProcessPoolExecutor(max_workers=min(max_workers or os.cpu_count() or 1, len(chunks)))
+            try:
+                futures = {executor.submit(render_run_reports, chunk, str(batch_dir), query): len(chunk)
+                           for chunk in chunks}
+                for future in as_completed(futures):
+                    if cancel_event is not None and cancel_event.is_set():
+                        cancelled = True
+                        break
+                    runs.extend(future.result())
+                    done += futures[future]
+                    if progress_callback:
+                        progress_callback(done, len(paths))
+            finally:
+                executor.shutdown(wait=not cancelled, cancel_futures=True)
+
+        # 목차는 최신 실행부터
+        runs.sort(key=lambda run: run['run_id'], reverse=True)
+        total_tests = sum(run['total_tests'] for run in runs)
+        passed_tests = sum(run['passed_tests'] for run in runs)
+        index_path = batch_dir / 'index.html'
+        self.render_to_file(
+            'report_index.html', index_path,
+            description=description or '전체',
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            run_count=len(runs),
+            total_tests=total_tests,
+            failed_tests=total_tests - passed_tests,
+            pass_rate=(passed_tests / total_tests * 100) if total_tests > 0 else 0,
+            runs=runs
+        )
+        return {'index': str(index_path), 'runs': len(runs), 'cancelled': cancelled}
+
+    def start_batch(self, test_manager, query, description: str = '') -> 'BatchReportJob':
+        """백그라운드 스레드에서 일괄 리포트 생성 시작"""
+        job = BatchReportJob(self, test_manager, query, description)
+        job.start()
+        return job
+
+
+class BatchReportJob(threading.Thread):
+    """백그라운드 일괄 리포트 작업
+
+    UI는 done/total/finished/result/error를 주기적으로 확인하고, cancel()로 중단을 요청한다.
+    """
 
-        # 리포트 생성
-        html_content = template.render(**report_data)
+    def __init__(self, generator: ReportGenerator, test_manager, query, description: str):
+        super().__init__(daemon=True)
+        self.generator = generator
+        self.test_manager = test_manager
+        self.query = query
+        self.description = description
+        self.cancel_event = threading.Event()
+        self.done = 0
+        self.total = 0
+        self.result = None
+        self.error = None
+        self.finished = False
 
-        # 리포트 파일 저장
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"report_{test_data['test_type']}_{timestamp}.html"
-        filepath = self.report_dir / filename
+    def _on_progress(self, done: int, total: int):
+        self.done = done
+        self.total = total
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    def run(self):
+        try:
+            self.result = self.generator.generate_batch(
+                self.test_manager, self.query, self.description,
+                progress_callback=self._on_progress, cancel_event=self.cancel_event)
+        except Exception as e:
+            print(f"일괄 리포트 생성 중 오류 발생: {e}")
+            self.error = str(e)
+        finally:
+            self.finished = True
 
-        return str(filepath) 
\ No newline at end of file
+    def cancel(self):
+        """일괄 리포트 생성 취소 요청"""
+        self.cancel_event.set()
@@ -0,0 +1,238 @@
+import json
+import re
+from datetime import datetime, timedelta, date
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+
+TIERS = ('minutely', 'hourly', 'daily', 'weekly', 'lot')
+# 분 단위 집계 구간 길이(분) (하루 이틀 범위 추이를 원시 파일 없이 표시)
+MINUTELY_BUCKET_MINUTES = 5
+# 집계 구간 키 형식과 구간 길이 (주 단위 키는 해당 주 월요일)
+BUCKET_FORMATS = {'minutely': '%Y%m%d%H%M', 'hourly': '%Y%m%d%H', 'daily': '%Y%m%d', 'weekly': '%Y%m%d'}
+BUCKET_WIDTHS = {
+    'minutely': timedelta(minutes=MINUTELY_BUCKET_MINUTES),
+    'hourly': timedelta(hours=1),
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1)
+}
+
+class RollupManager:
+    """5분/시간/일/주/로트 단위 항목별 집계(건수, 합격/불합격, 측정값 모멘트)를 저장 시점마다 갱신"""
+
+    def __init__(self, rollup_dir: Path):
+        self.rollup_dir = Path(rollup_dir)
+        self.meta_path = self.rollup_dir / 'meta.json'
+        self.ensure_rollup_dir()
+
+    def ensure_rollup_dir(self):
+        """집계 저장 디렉토리 생성"""
+        for tier in TIERS:
+            tier_dir = self.rollup_dir / tier
+            if not tier_dir.exists():
+                tier_dir.mkdir(parents=True)
+
+    @property
+    def initialized(self) -> bool:
+        """현재 집계 단위 구성으로 전체 이력이 반영되어 있는지 여부"""
+        return self.load_meta().get('tiers') == list(TIERS)
+
+    def load_meta(self) -> Dict[str, Any]:
+        if not self.meta_path.exists():
+            return {}
+        with open(self.meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_meta(self, **updates):
+        meta = self.load_meta()
+        meta.update(updates)
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+    @staticmethod
+    def bucket_key(tier: str, time: datetime) -> str:
+        """시각이 속한 집계 구간 키 (주 단위는 해당 주 월요일)"""
+        if tier == 'minutely':
+            return time.replace(minute=time.minute - time.minute % MINUTELY_BUCKET_MINUTES).strftime('%Y%m%d%H%M')
+        if tier == 'hourly':
+            return time.strftime('%Y%m%d%H')
+        if tier == 'daily':
+            return time.strftime('%Y%m%d')
+        return (time - timedelta(days=time.weekday())).strftime('%Y%m%d')
+
+    @staticmethod
+    def partition_key(tier: str, bucket: str) -> str:
+        """집계 파일 분할 키 (분 단위는 일별, 시간 단위는 월별, 로트는 로트별, 나머지는 연도별)"""
+        if tier == 'lot':
+            return re.sub(r'[^A-Za-z0-9_-]', '_', bucket)
+        if tier == 'minutely':
+            return bucket[:8]
+        return bucket[:6] if tier == 'hourly' else bucket[:4]
+
+    @staticmethod
+    def bucket_start(tier: str, bucket: str) -> datetime:
+        """집계 구간 키의 시작 시각"""
+        return datetime.strptime(bucket, BUCKET_FORMATS[tier])
+
+    def partition_path(self, tier: str, partition: str) -> Path:
+        return self.rollup_dir / tier / f'rollup_{partition}.json'
+
+    def load_partition(self, tier: str, partition: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        path = self.partition_path(tier, partition)
+        if not path.exists():
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_partition(self, tier: str, partition: str, buckets: Dict[str, Dict[str, Dict[str, Any]]]):
+        path = self.partition_path(tier, partition)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(buckets, f, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    @staticmethod
+    def _add_value(entry: Dict[str, Any], value: float, passed: bool):
+        entry['count'] += 1
+        entry['passed'] += 1 if passed else 0
+        delta = value - entry['mean']
+        entry['mean'] += delta / entry['count']
+        entry['m2'] += delta * (value - entry['mean'])
+        entry['min'] = value if entry['min'] is None else min(entry['min'], value)
+        entry['max'] = value if entry['max'] is None else max(entry['max'], value)
+
+    @staticmethod
+    def _remove_value(entry: Dict[str, Any], value: float, passed: bool):
+        # 최소/최대는 되돌릴 수 없으므로 삭제 후에는 범위 경계로만 유지
+        if entry['count'] <= 1:
+            entry.update({'count': 0, 'passed': 0, 'mean': 0.0, 'm2': 0.0})
+            return
+        previous_mean = (entry['count'] * entry['mean'] - value) / (entry['count'] - 1)
+        entry['m2'] = max(entry['m2'] - (value - previous_mean) * (value - entry['mean']), 0.0)
+        entry['mean'] = previous_mean
+        entry['count'] -= 1
+        entry['passed'] -= 1 if passed else 0
+
+    def _apply_run(self, partitions: Dict, test_data: Dict[str, Any], remove: bool = False):
+        time = datetime.strptime(test_data['timestamp'][:15], '%Y%m%d_%H%M%S')
+        lot = (test_data.get('dut') or {}).get('lot')
+        for tier in TIERS:
+            if tier == 'lot':
+                if not lot:
+                    continue
+                bucket = lot
+            else:
+                bucket = self.bucket_key(tier, time)
+            key = (tier, self.partition_key(tier, bucket))
+            if key not in partitions:
+                partitions[key] = self.load_partition(*key)
+            items = partitions[key].setdefault(bucket, {})
+
+            for result in test_data['results']:
+                item = result['test_item']
+                if item not in items:
+                    items[item] = {'count': 0, 'passed': 0, 'mean': 0.0, 'm2': 0.0, 'min': None, 'max': None}
+                value = float(result['measured_value'])
+                passed = result['result'] == 'PASS'
+                if remove:
+                    self._remove_value(items[item], value, passed)
+                    if items[item]['count'] == 0:
+                        del items[item]
+                else:
+                    self._add_value(items[item], value, passed)
+
+            if not items:
+                del partitions[key][bucket]
+
+    def _save_partitions(self, partitions: Dict):
+        for (tier, partition), buckets in partitions.items():
+            self.save_partition(tier, partition, buckets)
+
+    def add_run(self, test_data: Dict[str, Any]):
+        """저장된 테스트 실행 하나를 모든 집계 단위에 반영"""
+        partitions = {}
+        self._apply_run(partitions, test_data)
+        self._save_partitions(partitions)
+
+    def add_runs(self, runs: Iterable[Dict[str, Any]]):
+        """여러 실행을 한 번에 반영 (파티션 파일은 한 번씩만 저장)"""
+        partitions = {}
+        for test_data in runs:
+            self._apply_run(partitions, test_data)
+        self._save_partitions(partitions)
+
+    def remove_run(self, test_data: Dict[str, Any]):
+        """삭제된 테스트 실행을 모든 집계 단위에서 제외"""
+        partitions = {}
+        self._apply_run(partitions, test_data, remove=True)
+        self._save_partitions(partitions)
+
+    def rebuild(self, runs: Iterable[Dict[str, Any]]):
+        """전체 실행 목록으로 모든 집계 재구성"""
+        for tier in TIERS:
+            for path in (self.rollup_dir / tier).glob('rollup_*.json'):
+                path.unlink()
+
+        partitions = {}
+        for test_data in runs:
+            self._apply_run(partitions, test_data)
+        self._save_partitions(partitions)
+        self.save_meta(initialized_at=datetime.now().strftime('%Y%m%d_%H%M%S'), tiers=list(TIERS))
+
+    def query_lot(self, lot: str, test_item: Optional[str] = None) -> List[Dict[str, Any]]:
+        """로트 하나의 항목별 누계 조회 (query와 같은 행 형식, bucket은 로트)"""
+        buckets = self.load_partition('lot', self.partition_key('lot', lot))
+        return [
+            {
+                'bucket': lot,
+                'test_item': item,
+                'count': entry['count'],
+                'passed': entry['passed'],
+                'failed': entry['count'] - entry['passed'],
+                'mean': entry['mean'],
+                'm2': entry['m2'],
+                'min': entry['min'],
+                'max': entry['max']
+            }
+            for item, entry in buckets.get(lot, {}).items()
+            if not test_item or item == test_item
+        ]
+
+    def query(self, tier: str, start_date: Optional[date] = None,
+              end_date: Optional[date] = None, test_item: Optional[str] = None) -> List[Dict[str, Any]]:
+        """기간 내 집계 구간 목록 조회"""
+        start = start_date.strftime('%Y%m%d') if start_date else None
+        end = end_date.strftime('%Y%m%d') if end_date else None
+        if tier == 'weekly' and start:
+            # 시작일이 속한 주 전체 포함
+            start = self.bucket_key('weekly', datetime.combine(start_date, datetime.min.time()))
+
+        rows = []
+        for path in sorted((self.rollup_dir / tier).glob('rollup_*.json')):
+            partition = path.stem[len('rollup_'):]
+            if start and partition < start[:len(partition)]:
+                continue
+            if end and partition > end[:len(partition)]:
+                continue
+
+            with open(path, 'r', encoding='utf-8') as f:
+                buckets = json.load(f)
+            for bucket, items in buckets.items():
+                if start and bucket[:8] < start:
+                    continue
+                if end and bucket[:8] > end:
+                    continue
+                for item, entry in items.items():
+                    if test_item and item != test_item:
+                        continue
+                    rows.append({
+                        'bucket': bucket,
+                        'test_item': item,
+                        'count': entry['count'],
+                        'passed': entry['passed'],
+                        'failed': entry['count'] - entry['passed'],
+                        'mean': entry['mean'],
+                        'm2': entry['m2'],
+                        'min': entry['min'],
+                        'max': entry['max']
+                    })
+        return rows
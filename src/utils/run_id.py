@@ -0,0 +1,45 @@
+import re
+import threading
+import time
+from datetime import datetime
+
+class RunIdGenerator:
+    """시간 순서로 정렬되는 충돌 없는 실행 ID 생성
+
+    형식: YYYYMMDD_HHMMSS_<초 미만 ns 9자리>_<스테이션>_<순번 6자리>
+    같은 프로세스 안에서는 시계가 되돌아가도 ID가 항상 증가한다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.last_ns = 0
+        self.sequence = 0
+
+    @staticmethod
+    def sanitize_station(station: str) -> str:
+        """파일 이름과 ID 구분자에 안전한 스테이션 이름"""
+        return re.sub(r'[^A-Za-z0-9-]', '-', station or '') or 'NA'
+
+    @classmethod
+    def format_id(cls, time: datetime, station: str, sequence: int) -> str:
+        """지정 시각/순번의 실행 ID (외부 데이터 가져오기용)"""
+        prefix = time.strftime('%Y%m%d_%H%M%S')
+        return f'{prefix}_{time.microsecond * 1000:09d}_{cls.sanitize_station(station)}_{sequence % 1000000:06d}'
+
+    def next_id(self, station: str = '') -> str:
+        """다음 실행 ID 생성"""
+        with self.lock:
+            now_ns = max(time.time_ns(), self.last_ns + 1)
+            self.last_ns = now_ns
+            self.sequence = (self.sequence + 1) % 1000000
+            sequence = self.sequence
+
+        seconds, fraction = divmod(now_ns, 1000000000)
+        prefix = datetime.fromtimestamp(seconds).strftime('%Y%m%d_%H%M%S')
+        return f'{prefix}_{fraction:09d}_{self.sanitize_station(station)}_{sequence:06d}'
+
+run_id_generator = RunIdGenerator()
+
+def new_run_id(station: str = '') -> str:
+    """프로세스 공용 생성기로 실행 ID 생성"""
+    return run_id_generator.next_id(station)
@@ -16,6 +16,21 @@ class SettingsManager:
             'file': {
                 'save_path': str(Path.home() / 'Documents' / 'EVAR'),
                 'format': 'CSV'
+            },
+            'retention': {
+                'raw_days': 180
+            },
+            'station': {
+                'id': 'ST01',
+                'fixture': ''
+            },
+            'plant': {
+                'central_dir': 'data/central',
+                'stations': []
+            },
+            'report_schedule': {
+                'enabled': True,
+                'periods': ['shift', 'day', 'week']
             }
         }
         self.ensure_config_dir()
@@ -56,6 +71,22 @@ class SettingsManager:
         """파일 저장 설정 반환"""
         return self.settings.get('file', self.default_settings['file'])
 
+    def get_retention_settings(self):
+        """원시 데이터 보존 설정 반환"""
+        return self.settings.get('retention', self.default_settings['retention'])
+
+    def get_station_settings(self):
+        """스테이션 설정 반환"""
+        return self.settings.get('station', self.default_settings['station'])
+
+    def get_plant_settings(self):
+        """다중 스테이션 집계 설정 반환 (stations: [{'id', 'path'}])"""
+        return self.settings.get('plant', self.default_settings['plant'])
+
+    def get_report_schedule_settings(self):
+        """기간 요약 리포트 자동 생성 설정 반환"""
+        return self.settings.get('report_schedule', self.default_settings['report_schedule'])
+
     def update_serial_settings(self, settings):
         """시리얼 통신 설정 업데이트"""
         self.settings['serial'] = settings
@@ -64,4 +95,24 @@ class SettingsManager:
     def update_file_settings(self, settings):
         """파일 저장 설정 업데이트"""
         self.settings['file'] = settings
-        self.save_settings() 
\ No newline at end of file
+        self.save_settings()
+
+    def update_station_settings(self, settings):
+        """스테이션 설정 업데이트"""
+        self.settings['station'] = settings
+        self.save_settings()
+
+    def update_plant_settings(self, settings):
+        """다중 스테이션 집계 설정 업데이트"""
+        self.settings['plant'] = settings
+        self.save_settings()
+
+    def update_retention_settings(self, settings):
+        """원시 데이터 보존 설정 업데이트"""
+        self.settings['retention'] = settings
+        self.save_settings()
+
+    def update_report_schedule_settings(self, settings):
+        """기간 요약 리포트 자동 생성 설정 업데이트"""
+        self.settings['report_schedule'] = settings
+        self.save_settings()
@@ -0,0 +1,361 @@
+import json
+import math
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+
+DEFAULT_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+# 규격 항목의 분위수 버킷 폭 (기준값 부근에서 공차 대비 비율)
+SKETCH_RESOLUTION = 0.01
+# 항목별 상대 오차 범위 (규격이 없는 항목은 최댓값 사용)
+MIN_RELATIVE_ACCURACY = 1e-4
+MAX_RELATIVE_ACCURACY = 0.01
+
+class QuantileSketch:
+    """상대 오차가 보장되는 병합 가능한 분위수 스케치 (DDSketch 방식)"""
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self.log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        """값 추가"""
+        if value > 0:
+            index = self._index(value)
+            self.positive[index] = self.positive.get(index, 0) + count
+        elif value < 0:
+            index = self._index(-value)
+            self.negative[index] = self.negative.get(index, 0) + count
+        else:
+            self.zero_count += count
+        self.count += count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self._collapse()
+
+    def merge(self, other: 'QuantileSketch'):
+        """다른 스케치 병합 (같은 상대 오차 설정이어야 함)"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError('상대 오차 설정이 다른 스케치는 병합할 수 없습니다.')
+        for index, count in other.positive.items():
+            self.positive[index] = self.positive.get(index, 0) + count
+        for index, count in other.negative.items():
+            self.negative[index] = self.negative.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        self._collapse()
+
+    def _collapse(self):
+        """버킷 수가 한도를 넘으면 절댓값이 가장 작은 양수 버킷부터 합침"""
+        while len(self.positive) > self.max_buckets:
+            indexes = sorted(self.positive)
+            lowest, next_lowest = indexes[0], indexes[1]
+            self.positive[next_lowest] += self.positive.pop(lowest)
+        while len(self.negative) > self.max_buckets:
+            indexes = sorted(self.negative)
+            lowest, next_lowest = indexes[0], indexes[1]
+            self.negative[next_lowest] += self.negative.pop(lowest)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """분위수 추정값"""
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return max(-self._value(index), self.min)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return min(self._value(index), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'positive': {str(k): v for k, v in self.positive.items()},
+            'negative': {str(k): v for k, v in self.negative.items()},
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'min': self.min,
+            'max': self.max
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'QuantileSketch':
+        sketch = cls(data['relative_accuracy'])
+        sketch.positive = {int(k): v for k, v in data['positive'].items()}
+        sketch.negative = {int(k): v for k, v in data['negative'].items()}
+        sketch.zero_count = data['zero_count']
+        sketch.count = data['count']
+        sketch.min = data['min']
+        sketch.max = data['max']
+        return sketch
+
+
+class FixedHistogram:
+    """고정 구간 히스토그램 (같은 구간 설정끼리 병합 가능)"""
+
+    def __init__(self, low: float, high: float, bins: int):
+        self.low = low
+        self.high = high
+        self.bins = bins
+        self.counts = [0] * bins
+        self.underflow = 0
+        self.overflow = 0
+
+    @property
+    def edges(self) -> List[float]:
+        width = (self.high - self.low) / self.bins
+        return [self.low + width * i for i in range(self.bins + 1)]
+
+    def add(self, value: float, count: int = 1):
+        """값 추가"""
+        if value < self.low:
+            self.underflow += count
+        elif value >= self.high:
+            self.overflow += count
+        else:
+            index = int((value - self.low) / (self.high - self.low) * self.bins)
+            self.counts[min(index, self.bins - 1)] += count
+
+    def merge(self, other: 'FixedHistogram'):
+        """다른 히스토그램 병합"""
+        if (other.low, other.high, other.bins) != (self.low, self.high, self.bins):
+            raise ValueError('구간 설정이 다른 히스토그램은 병합할 수 없습니다.')
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'low': self.low,
+            'high': self.high,
+            'bins': self.bins,
+            'counts': self.counts,
+            'underflow': self.underflow,
+            'overflow': self.overflow
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FixedHistogram':
+        histogram = cls(data['low'], data['high'], data['bins'])
+        histogram.counts = list(data['counts'])
+        histogram.underflow = data['underflow']
+        histogram.overflow = data['overflow']
+        return histogram
+
+
+class SketchManager:
+    """항목별/일별 측정값 분위수 스케치와 히스토그램을 저장 시점마다 갱신"""
+
+    def __init__(self, test_items: Dict[str, Dict[str, Any]], sketch_dir: Path,
+                 bins: int = 40, span: float = 2.0):
+        self.test_items = test_items
+        self.sketch_dir = Path(sketch_dir)
+        self.bins = bins
+        self.span = span
+        self.meta_path = self.sketch_dir / 'meta.json'
+        self.ensure_sketch_dir()
+
+    def ensure_sketch_dir(self):
+        """스케치 저장 디렉토리 생성"""
+        if not self.sketch_dir.exists():
+            self.sketch_dir.mkdir(parents=True)
+
+    @property
+    def initialized(self) -> bool:
+        """현재 구간/정확도 설정으로 전체 이력이 반영되어 있는지 여부"""
+        if not self.meta_path.exists():
+            return False
+        with open(self.meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        return meta == self.settings()
+
+    def settings(self) -> Dict[str, Any]:
+        """저장된 스케치가 따르는 설정 (바뀌면 전체 재구성)"""
+        return {
+            'bins': self.bins,
+            'span': self.span,
+            'accuracy': {item: self.relative_accuracy(item) for item in sorted(self.test_items)}
+        }
+
+    def relative_accuracy(self, item: str) -> float:
+        """항목 스케치의 상대 오차
+
+        상대 오차는 값의 크기에 비례하므로 0에서 먼 측정값(3.3 V ± 0.1 V 등)은 고정 1%로는
+        버킷 하나가 공차의 1/3에 이른다. 규격이 있으면 기준값 부근 버킷 폭이
+        공차의 SKETCH_RESOLUTION 배가 되도록 정한다.
+        """
+        spec = self.test_items.get(item)
+        if not spec or not spec.get('reference') or not spec.get('tolerance'):
+            return MAX_RELATIVE_ACCURACY
+        accuracy = spec['tolerance'] * SKETCH_RESOLUTION / abs(spec['reference'])
+        return min(max(accuracy, MIN_RELATIVE_ACCURACY), MAX_RELATIVE_ACCURACY)
+
+    def new_histogram(self, item: str) -> Optional[FixedHistogram]:
+        """항목 규격(reference ± span × tolerance) 기준 히스토그램 생성"""
+        spec = self.test_items.get(item)
+        if not spec:
+            return None
+        half_width = spec['tolerance'] * self.span
+        return FixedHistogram(spec['reference'] - half_width, spec['reference'] + half_width, self.bins)
+
+    def day_path(self, day: str) -> Path:
+        return self.sketch_dir / f'sketch_{day}.json'
+
+    def load_day(self, day: str) -> Dict[str, Dict[str, Any]]:
+        """일별 스케치 로드"""
+        path = self.day_path(day)
+        if not path.exists():
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {
+            item: {
+                'sketch': QuantileSketch.from_dict(entry['sketch']),
+                'histogram': FixedHistogram.from_dict(entry['histogram']) if entry['histogram'] else None
+            }
+            for item, entry in data.items()
+        }
+
+    def save_day(self, day: str, entries: Dict[str, Dict[str, Any]]):
+        """일별 스케치 저장"""
+        data = {
+            item: {
+                'sketch': entry['sketch'].to_dict(),
+                'histogram': entry['histogram'].to_dict() if entry['histogram'] else None
+            }
+            for item, entry in entries.items()
+        }
+        path = self.day_path(day)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    def _add_to_entries(self, entries: Dict[str, Dict[str, Any]], test_data: Dict[str, Any]):
+        for result in test_data['results']:
+            item = result['test_item']
+            if item not in entries:
+                entries[item] = {'sketch': QuantileSketch(self.relative_accuracy(item)),
+                                 'histogram': self.new_histogram(item)}
+            value = float(result['measured_value'])
+            entries[item]['sketch'].add(value)
+            if entries[item]['histogram']:
+                entries[item]['histogram'].add(value)
+
+    def add_run(self, test_data: Dict[str, Any]):
+        """저장된 테스트 실행 하나를 해당 일자 스케치에 반영"""
+        day = test_data['timestamp'][:8]
+        entries = self.load_day(day)
+        self._add_to_entries(entries, test_data)
+        self.save_day(day, entries)
+
+    def add_runs(self, runs: Iterable[Dict[str, Any]]):
+        """여러 실행을 한 번에 반영 (일별 파일은 한 번씩만 저장)"""
+        by_day = {}
+        for test_data in runs:
+            by_day.setdefault(test_data['timestamp'][:8], []).append(test_data)
+        for day, day_runs in by_day.items():
+            entries = self.load_day(day)
+            for test_data in day_runs:
+                self._add_to_entries(entries, test_data)
+            self.save_day(day, entries)
+
+    def rebuild_day(self, day: str, runs: Iterable[Dict[str, Any]]):
+        """하루치 실행 목록으로 해당 일자 스케치 재구성"""
+        entries = {}
+        for test_data in runs:
+            self._add_to_entries(entries, test_data)
+        if entries:
+            self.save_day(day, entries)
+        elif self.day_path(day).exists():
+            self.day_path(day).unlink()
+
+    def rebuild(self, runs: Iterable[Dict[str, Any]]):
+        """시간 순서의 전체 실행 목록으로 모든 일자 스케치 재구성"""
+        for path in self.sketch_dir.glob('sketch_*.json'):
+            path.unlink()
+
+        current_day = None
+        entries = {}
+        for test_data in runs:
+            day = test_data['timestamp'][:8]
+            if day != current_day:
+                if current_day is not None:
+                    self.save_day(current_day, entries)
+                current_day = day
+                entries = self.load_day(day)
+            self._add_to_entries(entries, test_data)
+        if current_day is not None:
+            self.save_day(current_day, entries)
+
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump(self.settings(), f)
+
+    def get_distribution(self, item: str, start_date: Optional[date] = None,
+                         end_date: Optional[date] = None,
+                         quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Optional[Dict[str, Any]]:
+        """기간 내 일별 스케치를 병합해 분위수와 히스토그램 반환"""
+        sketch = None
+        histogram = None
+        for path in sorted(self.sketch_dir.glob('sketch_*.json')):
+            day = path.stem[len('sketch_'):]
+            day_date = datetime.strptime(day, '%Y%m%d').date()
+            if start_date and day_date < start_date:
+                continue
+            if end_date and day_date > end_date:
+                continue
+
+            entry = self.load_day(day).get(item)
+            if not entry:
+                continue
+            if sketch is None:
+                sketch = entry['sketch']
+                histogram = entry['histogram']
+            else:
+                sketch.merge(entry['sketch'])
+                if histogram and entry['histogram']:
+                    histogram.merge(entry['histogram'])
+
+        if sketch is None:
+            return None
+
+        return {
+            'test_item': item,
+            'count': sketch.count,
+            'min': sketch.min,
+            'max': sketch.max,
+            'quantiles': {q: sketch.quantile(q) for q in quantiles},
+            'histogram': histogram.to_dict() if histogram else None,
+            'edges': histogram.edges if histogram else None
+        }
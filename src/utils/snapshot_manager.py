@@ -0,0 +1,100 @@
+import json
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+SNAPSHOT_FORMAT = 'test-snapshot'
+SNAPSHOT_VERSION = 2
+
+def encode_value(value: Any) -> Any:
+    """캐시 값을 JSON으로 쓸 수 있는 형태로 변환 (튜플/날짜/집합/문자열이 아닌 키는 표시를 붙여 보존)"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, 'dtype') and hasattr(value, 'tolist'):
+        # numpy 스칼라/배열은 파이썬 값(목록)으로 저장
+        return encode_value(value.tolist())
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    if isinstance(value, tuple):
+        return {'__tuple__': [encode_value(item) for item in value]}
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    if isinstance(value, (set, frozenset)):
+        return {'__frozenset__': sorted((encode_value(item) for item in value), key=json.dumps)}
+    if isinstance(value, dict):
+        if all(isinstance(key, str) and not key.startswith('__') for key in value):
+            return {key: encode_value(item) for key, item in value.items()}
+        return {'__dict__': [[encode_value(key), encode_value(item)] for key, item in value.items()]}
+    raise TypeError(f'스냅샷에 저장할 수 없는 값: {type(value).__name__}')
+
+def decode_value(value: Any) -> Any:
+    """encode_value로 저장한 값 복원"""
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if '__tuple__' in value:
+        return tuple(decode_value(item) for item in value['__tuple__'])
+    if '__datetime__' in value:
+        return datetime.fromisoformat(value['__datetime__'])
+    if '__date__' in value:
+        return date.fromisoformat(value['__date__'])
+    if '__frozenset__' in value:
+        return frozenset(decode_value(item) for item in value['__frozenset__'])
+    if '__dict__' in value:
+        return {decode_value(key): decode_value(item) for key, item in value['__dict__']}
+    return {key: decode_value(item) for key, item in value.items()}
+
+
+class SnapshotManager:
+    """계산된 통계/이력 캐시를 JSON 스냅샷으로 저장하고 다음 실행 때 복원
+
+    첫 줄은 헤더(형식, 버전, 저장 시점의 데이터 변경 표식), 둘째 줄은 캐시 본문이다.
+    복원 시 헤더만 먼저 읽어 현재 표식과 다르면 본문을 읽지 않고 버린다.
+    사용자가 쓸 수 있는 data 디렉토리에 있으므로 pickle이 아닌 JSON으로 저장한다.
+    """
+
+    def __init__(self, snapshot_path: Path):
+        self.snapshot_path = Path(snapshot_path)
+        self.saved_at = 0.0
+
+    def save(self, payload: Dict[str, Any], markers: Dict[str, Any]):
+        """스냅샷 저장 (임시 파일에 쓴 뒤 교체)"""
+        header = {'format': SNAPSHOT_FORMAT, 'version': SNAPSHOT_VERSION,
+                  'markers': markers, 'created_at': time.time()}
+        tmp_path = self.snapshot_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(header, ensure_ascii=False) + '\n')
+                f.write(json.dumps(encode_value(payload), ensure_ascii=False) + '\n')
+            tmp_path.replace(self.snapshot_path)
+            self.saved_at = header['created_at']
+        except Exception as e:
+            print(f"스냅샷 저장 중 오류 발생: {e}")
+
+    def load(self, markers: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """현재 변경 표식과 일치하는 스냅샷만 복원"""
+        if not self.snapshot_path.exists():
+            return None
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                # 헤더만 먼저 읽어 본문을 해석하기 전에 검증
+                header = json.loads(f.readline())
+                if (header.get('format') != SNAPSHOT_FORMAT or header.get('version') != SNAPSHOT_VERSION
+                        or header.get('markers') != markers):
+                    return None
+                payload = decode_value(json.loads(f.readline()))
+            if not isinstance(payload, dict):
+                return None
+            self.saved_at = header['created_at']
+            return payload
+        except Exception as e:
+            print(f"스냅샷 로드 중 오류 발생: {e}")
+            return None
+
+    def is_due(self, interval: float) -> bool:
+        """마지막 저장 후 interval초가 지났는지 여부"""
+        return time.time() - self.saved_at >= interval
@@ -0,0 +1,275 @@
+import json
+import math
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional
+
+# X̄/R 관리도 상수 (부분군 크기별 A2, D3, D4, d2)
+XBAR_R_CONSTANTS = {
+    2: (1.880, 0.0, 3.267, 1.128),
+    3: (1.023, 0.0, 2.574, 1.693),
+    4: (0.729, 0.0, 2.282, 2.059),
+    5: (0.577, 0.0, 2.114, 2.326),
+    6: (0.483, 0.0, 2.004, 2.534),
+    7: (0.419, 0.076, 1.924, 2.704),
+    8: (0.373, 0.136, 1.864, 2.847),
+    9: (0.337, 0.184, 1.816, 2.970),
+    10: (0.308, 0.223, 1.777, 3.078),
+}
+
+# 개별값(I-MR) 관리도 상수
+MR_D2 = 1.128
+MR_D4 = 3.267
+
+# Western Electric 규칙 판정에 필요한 최근 측정값 수
+RULE_WINDOW = 8
+MAX_VIOLATIONS = 100
+
+class ItemSPCState:
+    """항목 하나의 스트리밍 SPC 상태 (Welford 방식 평균/분산)"""
+
+    def __init__(self, subgroup_size: int):
+        self.subgroup_size = subgroup_size
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        # 개별값 관리도
+        self.last_value = None
+        self.mr_count = 0
+        self.mr_mean = 0.0
+        # X̄/R 관리도
+        self.subgroup = []
+        self.subgroup_count = 0
+        self.xbar_mean = 0.0
+        self.r_mean = 0.0
+        # 규칙 판정
+        self.recent = deque(maxlen=RULE_WINDOW)
+        self.violations = deque(maxlen=MAX_VIOLATIONS)
+
+    def add(self, value: float, timestamp: str):
+        """측정값 하나 반영"""
+        self.check_rules(value, timestamp)
+
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        if self.last_value is not None:
+            self.mr_count += 1
+            self.mr_mean += (abs(value - self.last_value) - self.mr_mean) / self.mr_count
+        self.last_value = value
+
+        self.subgroup.append(value)
+        if len(self.subgroup) >= self.subgroup_size:
+            self.subgroup_count += 1
+            xbar = sum(self.subgroup) / len(self.subgroup)
+            r = max(self.subgroup) - min(self.subgroup)
+            self.xbar_mean += (xbar - self.xbar_mean) / self.subgroup_count
+            self.r_mean += (r - self.r_mean) / self.subgroup_count
+            self.subgroup = []
+
+        self.recent.append(value)
+
+    @property
+    def sigma(self) -> float:
+        """전체 표준편차 (표본)"""
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+    @property
+    def within_sigma(self) -> float:
+        """군내 표준편차 (이동범위 기반 추정)"""
+        return self.mr_mean / MR_D2 if self.mr_count > 0 else 0.0
+
+    def individuals_limits(self) -> Optional[Dict[str, float]]:
+        """개별값 관리도 중심선/관리한계"""
+        if self.mr_count == 0:
+            return None
+        sigma = self.within_sigma
+        return {
+            'center': self.mean,
+            'ucl': self.mean + 3 * sigma,
+            'lcl': self.mean - 3 * sigma,
+            'sigma': sigma,
+            'mr_center': self.mr_mean,
+            'mr_ucl': MR_D4 * self.mr_mean
+        }
+
+    def xbar_r_limits(self) -> Optional[Dict[str, float]]:
+        """X̄/R 관리도 중심선/관리한계"""
+        if self.subgroup_count == 0 or self.subgroup_size not in XBAR_R_CONSTANTS:
+            return None
+        a2, d3, d4, _ = XBAR_R_CONSTANTS[self.subgroup_size]
+        return {
+            'subgroup_size': self.subgroup_size,
+            'subgroups': self.subgroup_count,
+            'center': self.xbar_mean,
+            'ucl': self.xbar_mean + a2 * self.r_mean,
+            'lcl': self.xbar_mean - a2 * self.r_mean,
+            'r_center': self.r_mean,
+            'r_ucl': d4 * self.r_mean,
+            'r_lcl': d3 * self.r_mean
+        }
+
+    def check_rules(self, value: float, timestamp: str):
+        """새 측정값에 대해 Western Electric 규칙 위반 여부 판정"""
+        limits = self.individuals_limits()
+        if not limits or limits['sigma'] <= 0:
+            return
+
+        center = limits['center']
+        sigma = limits['sigma']
+        zones = [(v - center) / sigma for v in list(self.recent) + [value]]
+        last = zones[-1]
+        rules = []
+
+        # 규칙 1: 1점이 3σ 밖
+        if abs(last) > 3:
+            rules.append(1)
+        side = 1 if last > 0 else -1
+        # 규칙 2: 연속 3점 중 2점이 같은 쪽 2σ 밖
+        if side * last > 2 and sum(1 for z in zones[-3:] if side * z > 2) >= 2 and len(zones) >= 3:
+            rules.append(2)
+        # 규칙 3: 연속 5점 중 4점이 같은 쪽 1σ 밖
+        if side * last > 1 and sum(1 for z in zones[-5:] if side * z > 1) >= 4 and len(zones) >= 5:
+            rules.append(3)
+        # 규칙 4: 연속 8점이 중심선 같은 쪽
+        window = zones[-8:]
+        if len(window) == 8 and (all(z > 0 for z in window) or all(z < 0 for z in window)):
+            rules.append(4)
+
+        for rule in rules:
+            self.violations.append({'timestamp': timestamp, 'rule': rule, 'value': value})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'n': self.n, 'mean': self.mean, 'm2': self.m2,
+            'min': self.min, 'max': self.max,
+            'last_value': self.last_value, 'mr_count': self.mr_count, 'mr_mean': self.mr_mean,
+            'subgroup': self.subgroup, 'subgroup_count': self.subgroup_count,
+            'xbar_mean': self.xbar_mean, 'r_mean': self.r_mean,
+            'recent': list(self.recent), 'violations': list(self.violations)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], subgroup_size: int) -> 'ItemSPCState':
+        state = cls(subgroup_size)
+        for key in ('n', 'mean', 'm2', 'min', 'max', 'last_value', 'mr_count',
+                    'mr_mean', 'subgroup', 'subgroup_count', 'xbar_mean', 'r_mean'):
+            setattr(state, key, data[key])
+        state.recent.extend(data['recent'])
+        state.violations.extend(data['violations'])
+        return state
+
+
+class SPCManager:
+    """테스트 항목별 공정 능력(Cp/Cpk)과 관리도 통계를 저장 시점마다 증분 갱신"""
+
+    def __init__(self, test_items: Dict[str, Dict[str, Any]], state_path: Path, subgroup_size: int = 5):
+        self.test_items = test_items
+        self.state_path = Path(state_path)
+        self.subgroup_size = subgroup_size
+        self.items = {}
+        self.initialized = False
+        self.load_state()
+
+    def load_state(self):
+        """저장된 SPC 상태 로드"""
+        self.items = {}
+        self.initialized = False
+        if not self.state_path.exists():
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('subgroup_size') != self.subgroup_size:
+                return
+            self.items = {
+                item: ItemSPCState.from_dict(state, self.subgroup_size)
+                for item, state in data['items'].items()
+            }
+            self.initialized = True
+        except Exception as e:
+            print(f"SPC 상태 로드 중 오류 발생: {e}")
+            self.items = {}
+
+    def save_state(self):
+        """SPC 상태 저장"""
+        data = {
+            'subgroup_size': self.subgroup_size,
+            'items': {item: state.to_dict() for item, state in self.items.items()}
+        }
+        tmp_path = self.state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        tmp_path.replace(self.state_path)
+        self.initialized = True
+
+    def invalidate(self):
+        """저장된 상태 폐기 (실행 삭제 등으로 증분 갱신이 불가능할 때)"""
+        self.items = {}
+        self.initialized = False
+        if self.state_path.exists():
+            self.state_path.unlink()
+
+    def add_run(self, test_data: Dict[str, Any], save: bool = True):
+        """저장된 테스트 실행 하나를 SPC 상태에 반영"""
+        for result in test_data['results']:
+            item = result['test_item']
+            if item not in self.items:
+                self.items[item] = ItemSPCState(self.subgroup_size)
+            self.items[item].add(float(result['measured_value']), test_data['timestamp'])
+        if save:
+            self.save_state()
+
+    def rebuild(self, runs: Iterable[Dict[str, Any]]):
+        """시간 순서의 전체 실행 목록으로 상태 재구성"""
+        self.items = {}
+        for test_data in runs:
+            self.add_run(test_data, save=False)
+        self.save_state()
+
+    def get_item_statistics(self, item: str) -> Optional[Dict[str, Any]]:
+        """항목 하나의 공정 능력/관리도 통계"""
+        state = self.items.get(item)
+        if state is None:
+            return None
+
+        stats = {
+            'count': state.n,
+            'mean': state.mean,
+            'sigma': state.sigma,
+            'within_sigma': state.within_sigma,
+            'min': state.min,
+            'max': state.max,
+            'usl': None,
+            'lsl': None,
+            'cp': None,
+            'cpk': None,
+            'pp': None,
+            'ppk': None,
+            'individuals': state.individuals_limits(),
+            'xbar_r': state.xbar_r_limits(),
+            'violations': list(state.violations)
+        }
+
+        spec = self.test_items.get(item)
+        if spec:
+            usl = spec['reference'] + spec['tolerance']
+            lsl = spec['reference'] - spec['tolerance']
+            stats['usl'] = usl
+            stats['lsl'] = lsl
+            for prefix, sigma in (('c', state.within_sigma), ('p', state.sigma)):
+                if sigma > 0:
+                    stats[f'{prefix}p'] = (usl - lsl) / (6 * sigma)
+                    stats[f'{prefix}pk'] = min(usl - state.mean, state.mean - lsl) / (3 * sigma)
+
+        return stats
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """전체 항목의 공정 능력/관리도 통계"""
+        return {item: self.get_item_statistics(item) for item in self.items}
@@ -0,0 +1,84 @@
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+# 프로그램 시작부터 메인 창이 처음 표시되기까지의 시간 예산(ms)
+STARTUP_BUDGET_MS = 400
+# 메인 창 모듈 import 시간 예산(ms)
+STARTUP_IMPORT_BUDGET_MS = 150
+# 메인 창 표시 전에 로드되면 안 되는 무거운 모듈 (해당 하위 시스템을 열 때나 백그라운드에서 로드)
+DEFERRED_MODULES = ['pandas', 'matplotlib', 'serial', 'jinja2', 'openpyxl']
+
+class StartupProfiler:
+    """시작 단계별 소요 시간 기록 (main.py --profile-startup)
+
+    measure(이름)로 감싼 구간 시간과 mark(이름) 시점의 시작 후 경과 시간을 모아
+    report()에서 예산과 비교해 출력한다. 꺼져 있으면 아무것도 기록하지 않는다.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.sections: List[Tuple[str, float]] = []
+        self.marks: Dict[str, float] = {}
+        self.loaded_modules: Optional[List[str]] = None
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.start) * 1000
+
+    @contextmanager
+    def measure(self, name: str):
+        """구간 소요 시간 기록"""
+        if not self.enabled:
+            yield
+            return
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - begin) * 1000)
+
+    def record(self, name: str, elapsed_ms: float):
+        if self.enabled:
+            self.sections.append((name, elapsed_ms))
+
+    def mark(self, name: str):
+        """시작 후 경과 시간 기록 (메인 창 표시 시점이면 이미 로드된 무거운 모듈도 기록)"""
+        if not self.enabled:
+            return
+        self.marks[name] = self.elapsed_ms()
+        if name == 'window_shown':
+            self.loaded_modules = [module for module in DEFERRED_MODULES if module in sys.modules]
+
+    def section_ms(self, name: str) -> Optional[float]:
+        for section, elapsed in self.sections:
+            if section == name:
+                return elapsed
+        return None
+
+    def report(self) -> bool:
+        """기록한 시간을 출력하고 예산 안에 들었는지 반환"""
+        if not self.enabled:
+            return True
+        print("시작 프로파일:")
+        for name, elapsed in self.sections:
+            print(f"  {name}: {elapsed:.1f} ms")
+        for name, elapsed in self.marks.items():
+            print(f"  [{name}] 시작 후 {elapsed:.1f} ms")
+
+        ok = True
+        checks = [
+            ('메인 창 import', self.section_ms('import_main_window'), STARTUP_IMPORT_BUDGET_MS),
+            ('메인 창 표시', self.marks.get('window_shown'), STARTUP_BUDGET_MS)
+        ]
+        for label, elapsed, budget in checks:
+            if elapsed is None:
+                continue
+            within = elapsed <= budget
+            ok = ok and within
+            print(f"  {label}: {elapsed:.1f} / {budget} ms {'통과' if within else '예산 초과'}")
+        if self.loaded_modules:
+            ok = False
+            print(f"  메인 창 표시 전에 로드된 무거운 모듈: {', '.join(self.loaded_modules)}")
+        return ok
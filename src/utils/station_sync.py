@@ -0,0 +1,139 @@
+import heapq
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .test_manager import TestManager
+from .history_query import HistoryQuery
+from .statistics_engine import StatisticsEngine
+
+class StationSync:
+    """스테이션 data 디렉토리의 새/변경 실행 파일만 중앙 디렉토리로 복사
+
+    스테이션별 동기화 기록(파일 크기, 수정 시각)을 남겨 다음 동기화 때 비교한다.
+    스테이션에서 삭제되거나 보관 처리된 실행은 중앙에 그대로 남긴다.
+    """
+
+    def __init__(self, station_id: str, source_dir: Path, manager: TestManager):
+        self.station_id = station_id
+        self.source_dir = Path(source_dir)
+        self.manager = manager
+        self.manifest_path = manager.data_dir / 'sync_manifest.json'
+
+    def load_manifest(self) -> Dict[str, List[int]]:
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_manifest(self, manifest: Dict[str, List[int]]):
+        tmp_path = self.manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        tmp_path.replace(self.manifest_path)
+
+    def sync(self) -> Dict[str, Any]:
+        """새/변경 실행 파일 복사 후 중앙 색인/통계에 반영"""
+        if not self.source_dir.exists():
+            return {'station': self.station_id, 'copied': 0, 'updated': 0, 'error': '경로 없음'}
+
+        manifest = self.load_manifest()
+        copied = 0
+        updated = 0
+
+        with os.scandir(self.source_dir) as entries:
+            changed = []
+            for entry in entries:
+                if not (entry.name.startswith('test_') and entry.name.endswith('.json')):
+                    continue
+                stat = entry.stat()
+                signature = [stat.st_size, stat.st_mtime_ns]
+                if manifest.get(entry.name) != signature:
+                    changed.append((entry.name, signature))
+
+        runs = []
+        with self.manager.lock:
+            for name, signature in sorted(changed):
+                target = self.manager.data_dir / name
+                if target.exists():
+                    # 내용이 바뀐 실행은 기존 파일을 지운 뒤 반영분을 제외
+                    # (파일이 남아 있으면 일별 스케치 재구성에 옛 내용이 다시 들어감)
+                    with open(target, 'r', encoding='utf-8') as f:
+                        old_data = json.load(f)
+                    target.unlink()
+                    self.manager.unregister_run(old_data)
+                    updated += 1
+                else:
+                    copied += 1
+
+                shutil.copy2(self.source_dir / name, target)
+                with open(target, 'r', encoding='utf-8') as f:
+                    runs.append(json.load(f))
+                manifest[name] = signature
+
+            # 복사한 실행은 색인/증분 통계에 한 번에 반영
+            db_manager = self.manager.db_manager
+            if runs and db_manager.get_meta('runs_indexed'):
+                db_manager.add_runs([db_manager.run_row(self.manager.run_id_of(run), run) for run in runs])
+            self.manager.register_runs(runs)
+
+        if changed:
+            self.save_manifest(manifest)
+        return {'station': self.station_id, 'copied': copied, 'updated': updated, 'error': None}
+
+
+class StationDataset:
+    """여러 스테이션의 실행 데이터를 하나의 논리 데이터셋으로 묶어 조회
+
+    스테이션마다 중앙 디렉토리 아래 별도 TestManager를 두고,
+    조회는 스테이션별로 병렬 실행한 뒤 병합한다.
+    """
+
+    def __init__(self, central_dir: Path, sources: List[Dict[str, str]], max_workers: Optional[int] = None):
+        self.central_dir = Path(central_dir)
+        self.sources = sources
+        self.managers = {
+            source['id']: TestManager(data_dir=self.central_dir / source['id'])
+            for source in sources
+        }
+        self.max_workers = max_workers or max(len(sources), 1)
+        self.statistics_engine = StatisticsEngine()
+
+    def _map(self, func):
+        """스테이션별 작업을 병렬 실행해 {스테이션: 결과} 반환"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {station: executor.submit(func, station, manager)
+                       for station, manager in self.managers.items()}
+            return {station: future.result() for station, future in futures.items()}
+
+    def sync_all(self) -> List[Dict[str, Any]]:
+        """모든 스테이션 증분 동기화"""
+        sources = {source['id']: source['path'] for source in self.sources}
+        results = self._map(lambda station, manager: StationSync(station, sources[station], manager).sync())
+        return list(results.values())
+
+    def get_test_history(self, query: Optional[HistoryQuery] = None) -> List[Dict[str, Any]]:
+        """전체 스테이션 이력을 실행 ID 최신순으로 병합"""
+        query = query or HistoryQuery()
+        histories = self._map(lambda station, manager: manager.get_test_history(query=query))
+        return list(heapq.merge(*histories.values(), key=lambda record: record['run_id'], reverse=True))
+
+    def get_test_statistics(self, period: str = 'day') -> Dict[str, Any]:
+        """스테이션별 사전 집계를 모아 전체 통계 계산"""
+        def collect(station, manager):
+            start_date = manager.get_period_start(period)
+            manager.ensure_rollups()
+            return (manager.rollup_manager.query('daily', start_date=start_date),
+                    manager.rollup_manager.query('hourly', start_date=start_date))
+
+        rows = self._map(collect).values()
+        daily_rows = [row for daily, _ in rows for row in daily]
+        hourly_rows = [row for _, hourly in rows for row in hourly]
+        return self.statistics_engine.compute_from_rollups(daily_rows, hourly_rows)
+
+    def get_station_statistics(self, period: str = 'day') -> Dict[str, Dict[str, Any]]:
+        """스테이션별 통계"""
+        return self._map(lambda station, manager: manager.get_test_statistics(period))
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+from typing import List, Dict, Any, Iterable
+
+# 근무조 구분 (이름, 시작 시각, 종료 시각)
+DEFAULT_SHIFTS = [
+    ('주간', 6, 14),
+    ('오후', 14, 22),
+    ('야간', 22, 6),
+]
+
+# 집계 단위 DataFrame 컬럼 (원시 이력은 건당 count=1, m2=0 인 집계로 취급)
+AGGREGATE_COLUMNS = ['test_item', 'day', 'hour', 'count', 'passed', 'mean', 'm2', 'min', 'max']
+
+class StatisticsEngine:
+    """테스트 이력을 DataFrame으로 적재해 그룹 단위 벡터 연산으로 통계를 계산"""
+
+    def __init__(self, shifts=None):
+        self.shifts = shifts or DEFAULT_SHIFTS
+
+    def to_frame(self, history: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+        """이력 레코드를 타입이 지정된 집계 단위 DataFrame으로 변환"""
+        raw = pd.DataFrame.from_records(
+            list(history),
+            columns=['timestamp', 'test_item', 'measured_value',
+                     'reference_value', 'error', 'result']
+        )
+        time = pd.to_datetime(raw['timestamp'].str[:15], format='%Y%m%d_%H%M%S')
+        measured = raw['measured_value'].astype('float64')
+
+        return pd.DataFrame({
+            'test_item': raw['test_item'].astype('category'),
+            'day': time.dt.strftime('%Y%m%d'),
+            'hour': time.dt.hour.astype('int64'),
+            'count': np.ones(len(raw), dtype=np.int64),
+            'passed': (raw['result'] == 'PASS').to_numpy(dtype=np.int64),
+            'mean': measured,
+            'm2': np.zeros(len(raw), dtype=np.float64),
+            'min': measured,
+            'max': measured
+        }, columns=AGGREGATE_COLUMNS)
+
+    def rollups_to_frame(self, rows: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+        """RollupManager 집계 구간 목록을 집계 단위 DataFrame으로 변환"""
+        rows = pd.DataFrame.from_records(
+            list(rows),
+            columns=['bucket', 'test_item', 'count', 'passed', 'mean', 'm2', 'min', 'max']
+        )
+        buckets = rows['bucket'].astype(str)
+
+        return pd.DataFrame({
+            'test_item': rows['test_item'].astype('category'),
+            'day': buckets.str[:8],
+            'hour': pd.to_numeric(buckets.str[8:10], errors='coerce').fillna(0).astype('int64'),
+            'count': rows['count'].astype('int64'),
+            'passed': rows['passed'].astype('int64'),
+            'mean': rows['mean'].astype('float64'),
+            'm2': rows['m2'].astype('float64'),
+            'min': rows['min'].astype('float64'),
+            'max': rows['max'].astype('float64')
+        }, columns=AGGREGATE_COLUMNS)
+
+    def assign_shift(self, hours: np.ndarray) -> pd.Categorical:
+        """시각 배열을 근무조 이름 배열로 변환"""
+        conditions = []
+        for _, start, end in self.shifts:
+            if start < end:
+                conditions.append((hours >= start) & (hours < end))
+            else:
+                conditions.append((hours >= start) | (hours < end))
+        names = [name for name, _, _ in self.shifts]
+        return pd.Categorical(np.select(conditions, names, default=names[-1]), categories=names)
+
+    def compute(self, history: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """기존 get_test_statistics와 같은 형태의 통계 딕셔너리 생성"""
+        frame = self.to_frame(history)
+        return self.compute_frame(frame, frame)
+
+    def compute_from_rollups(self, daily_rows: Iterable[Dict[str, Any]],
+                             hourly_rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """일/시간 단위 사전 집계로부터 통계 딕셔너리 생성"""
+        return self.compute_frame(self.rollups_to_frame(daily_rows), self.rollups_to_frame(hourly_rows))
+
+    def compute_frame(self, frame: pd.DataFrame, hourly_frame: pd.DataFrame) -> Dict[str, Any]:
+        """집계 단위 DataFrame으로 통계 계산 (시간대/근무조는 hourly_frame 사용)"""
+        total_tests = int(frame['count'].sum())
+        total_passed = int(frame['passed'].sum())
+        hours = hourly_frame['hour'].to_numpy()
+
+        return {
+            'total_tests': total_tests,
+            'total_passed': total_passed,
+            'total_failed': total_tests - total_passed,
+            'average_pass_rate': (total_passed / total_tests * 100) if total_tests > 0 else 0,
+            'test_types': self._type_stats(frame),
+            'daily_stats': self._bucket_stats(frame, frame['day'], 'date', reverse=True),
+            'hourly_stats': self._bucket_stats(hourly_frame, hours, 'hour'),
+            'shift_stats': self._bucket_stats(hourly_frame, self.assign_shift(hours), 'shift'),
+            'measurement_stats': self._measurement_stats(frame)
+        }
+
+    def _type_stats(self, frame: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """테스트 유형별 통계 (최근 데이터에 처음 나타난 순서 유지)"""
+        ordered = frame.sort_values('day', ascending=False, kind='stable')
+        grouped = ordered.groupby('test_item', observed=True, sort=False)[['count', 'passed']].sum()
+        counts = grouped['count'].to_numpy()
+        passed = grouped['passed'].to_numpy()
+        pass_rates = passed / counts * 100
+
+        return {
+            str(item): {
+                'count': int(count),
+                'passed': int(ok),
+                'failed': int(count - ok),
+                'pass_rate': float(rate)
+            }
+            for item, count, ok, rate in zip(grouped.index, counts, passed, pass_rates)
+        }
+
+    def _bucket_stats(self, frame: pd.DataFrame, keys, key_name: str,
+                      reverse: bool = False) -> List[Dict[str, Any]]:
+        """시간 구간(일/시/근무조)별 통계"""
+        if frame.empty:
+            return []
+        grouped = frame[['count', 'passed']].groupby(keys, observed=True).sum()
+        grouped = grouped[grouped['count'] > 0].sort_index(ascending=not reverse)
+        totals = grouped['count'].to_numpy()
+        passed = grouped['passed'].to_numpy()
+        pass_rates = passed / totals * 100
+
+        return [
+            {
+                key_name: key.item() if hasattr(key, 'item') else key,
+                'total': int(total),
+                'passed': int(ok),
+                'failed': int(total - ok),
+                'pass_rate': float(rate)
+            }
+            for key, total, ok, rate in zip(grouped.index, totals, passed, pass_rates)
+        ]
+
+    def _measurement_stats(self, frame: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+        """항목별 측정값 평균/표준편차/최소/최대 (구간 모멘트 병합)"""
+        frame = frame[frame['count'] > 0]
+        weighted = frame.assign(total=frame['mean'] * frame['count'])
+        grouped = weighted.groupby('test_item', observed=True, sort=False).agg(
+            count=('count', 'sum'), total=('total', 'sum'), m2=('m2', 'sum'),
+            min=('min', 'min'), max=('max', 'max')
+        )
+        means = grouped['total'] / grouped['count']
+
+        # 구간 평균과 전체 평균의 차이로 인한 분산 기여분 (Chan 병합)
+        spread = frame['count'] * (frame['mean'] - frame['test_item'].map(means).astype('float64')) ** 2
+        m2 = grouped['m2'] + spread.groupby(frame['test_item'], observed=True).sum().reindex(grouped.index)
+        counts = grouped['count'].to_numpy()
+        stds = np.sqrt(np.where(counts > 1, m2.to_numpy() / np.maximum(counts - 1, 1), 0.0))
+
+        return {
+            str(item): {
+                'mean': float(mean),
+                'std': float(std),
+                'min': float(low),
+                'max': float(high)
+            }
+            for item, mean, std, low, high in zip(
+                grouped.index, means.to_numpy(), stds,
+                grouped['min'].to_numpy(), grouped['max'].to_numpy())
+        }
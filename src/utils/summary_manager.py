@@ -0,0 +1,258 @@
+import json
+import math
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+from .report_generator import ReportGenerator
+from .settings_manager import SettingsManager
+
+PERIOD_KINDS = ('shift', 'day', 'week', 'month', 'lot')
+PERIOD_NAMES = {'shift': '근무조', 'day': '일간', 'week': '주간', 'month': '월간', 'lot': '로트'}
+# 요약 리포트 실행 목록에 넣는 최대 실행 수 (최신순)
+RUN_LIST_LIMIT = 500
+# 불합격 상위 항목 수
+TOP_FAILURE_COUNT = 5
+
+class SummaryManager:
+    """근무조/일/주/월/로트 요약을 사전 집계(RollupManager, SPC, 실행 색인)로 계산
+
+    원시 실행 파일은 읽지 않으므로 한 달 요약도 집계 구간 수에 비례하는 시간에 만든다.
+    """
+
+    def __init__(self, test_manager):
+        self.test_manager = test_manager
+        self.statistics_engine = test_manager.statistics_engine
+
+    # ---- 기간 ----
+
+    def shift_at(self, time: datetime) -> Tuple[int, datetime]:
+        """시각이 속한 근무조 번호와 시작 시각"""
+        for index, (_, start, end) in enumerate(self.statistics_engine.shifts):
+            if start < end and start <= time.hour < end:
+                return index, time.replace(hour=start, minute=0, second=0, microsecond=0)
+            if start >= end and (time.hour >= start or time.hour < end):
+                day = time.date() if time.hour >= start else time.date() - timedelta(days=1)
+                return index, datetime.combine(day, datetime.min.time()).replace(hour=start)
+        raise ValueError(f'근무조를 찾을 수 없음: {time}')
+
+    def period_at(self, kind: str, time: datetime) -> Dict[str, Any]:
+        """시각이 속한 기간 {'kind', 'id', 'label', 'start', 'end'} (end는 포함하지 않음)"""
+        day = datetime.combine(time.date(), datetime.min.time())
+        if kind == 'shift':
+            index, start = self.shift_at(time)
+            name, first, last = self.statistics_engine.shifts[index]
+            end = start + timedelta(hours=(last - first) % 24 or 24)
+            return {'kind': kind, 'id': f"shift_{start:%Y%m%d}_{index + 1}",
+                    'label': f'{start:%Y-%m-%d} {name}', 'start': start, 'end': end}
+        if kind == 'day':
+            return {'kind': kind, 'id': f'day_{day:%Y%m%d}', 'label': f'{day:%Y-%m-%d}',
+                    'start': day, 'end': day + timedelta(days=1)}
+        if kind == 'week':
+            start = day - timedelta(days=day.weekday())
+            end = start + timedelta(days=7)
+            return {'kind': kind, 'id': f'week_{start:%Y%m%d}',
+                    'label': f'{start:%Y-%m-%d} ~ {end - timedelta(days=1):%Y-%m-%d}', 'start': start, 'end': end}
+        if kind == 'month':
+            start = day.replace(day=1)
+            end = (start + timedelta(days=32)).replace(day=1)
+            return {'kind': kind, 'id': f'month_{start:%Y%m}', 'label': f'{start:%Y-%m}',
+                    'start': start, 'end': end}
+        raise ValueError(f'알 수 없는 기간 구분: {kind}')
+
+    def previous_period(self, kind: str, time: datetime) -> Dict[str, Any]:
+        """시각 직전에 끝난 기간"""
+        return self.period_at(kind, self.period_at(kind, time)['start'] - timedelta(seconds=1))
+
+    # ---- 요약 ----
+
+    def build(self, kind: str, time: Optional[datetime] = None, lot: Optional[str] = None) -> Dict[str, Any]:
+        """기간(또는 로트) 요약 생성"""
+        # 집계와 색인을 여러 번 나누어 읽으므로 그동안 다른 스레드의 저장이 끼어들지 않게 함
+        with self.test_manager.lock:
+            return self._build(kind, time, lot)
+
+    def _build(self, kind: str, time: Optional[datetime], lot: Optional[str]) -> Dict[str, Any]:
+        self.test_manager.ensure_rollups()
+        self.test_manager.ensure_run_index()
+        db_manager = self.test_manager.db_manager
+
+        if kind == 'lot':
+            if not lot:
+                raise ValueError('로트 요약에는 로트가 필요합니다')
+            rows = self.test_manager.rollup_manager.query_lot(lot)
+            runs = db_manager.find_runs(lot=lot)
+            lot_key = self.test_manager.rollup_manager.partition_key('lot', lot)
+            period = {'kind': kind, 'id': f'lot_{lot_key}', 'label': lot, 'start': None, 'end': None}
+            run_totals = {'runs': len(runs), 'failed_runs': sum(1 for run in runs if run['failed_count'])}
+            trend = self._run_trend(runs)
+            runs = runs[:RUN_LIST_LIMIT]
+        else:
+            period = self.period_at(kind, time or datetime.now())
+            rows, trend = self._period_rows(period)
+            start_key = period['start'].strftime('%Y%m%d_%H%M%S')
+            end_key = period['end'].strftime('%Y%m%d_%H%M%S')
+            run_totals = db_manager.run_totals(start_key, end_key)
+            runs = db_manager.runs_between(start_key, end_key, limit=RUN_LIST_LIMIT)
+
+        frame = self.statistics_engine.rollups_to_frame(rows)
+        stats = self.statistics_engine.compute_frame(frame, frame)
+        items = self._item_summary(stats)
+        top_failures = sorted((item for item in items if item['failed'] > 0),
+                              key=lambda item: item['failed'], reverse=True)[:TOP_FAILURE_COUNT]
+
+        return {
+            'kind': kind,
+            'kind_name': PERIOD_NAMES[kind],
+            'period_id': period['id'],
+            'label': period['label'],
+            'start': period['start'].strftime('%Y-%m-%d %H:%M') if period['start'] else None,
+            'end': period['end'].strftime('%Y-%m-%d %H:%M') if period['end'] else None,
+            'total_tests': stats['total_tests'],
+            'passed_tests': stats['total_passed'],
+            'failed_tests': stats['total_failed'],
+            'pass_rate': stats['average_pass_rate'],
+            'run_count': run_totals['runs'],
+            'failed_runs': run_totals['failed_runs'],
+            'trend': trend,
+            'items': items,
+            'top_failures': top_failures,
+            'runs': runs
+        }
+
+    def _period_rows(self, period: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """기간 집계 행과 통과율 추이 (하루 이하는 시간 단위, 그 이상은 일 단위)"""
+        rollup_manager = self.test_manager.rollup_manager
+        start, end = period['start'], period['end']
+        last_day = (end - timedelta(seconds=1)).date()
+        if end - start <= timedelta(days=1):
+            start_key, end_key = start.strftime('%Y%m%d%H'), end.strftime('%Y%m%d%H')
+            rows = [row for row in rollup_manager.query('hourly', start.date(), last_day)
+                    if start_key <= row['bucket'] < end_key]
+            label = lambda bucket: f'{bucket[8:10]}시'
+        else:
+            rows = rollup_manager.query('daily', start.date(), last_day)
+            label = lambda bucket: f'{bucket[4:6]}-{bucket[6:8]}'
+
+        buckets = {}
+        for row in rows:
+            total, passed = buckets.get(row['bucket'], (0, 0))
+            buckets[row['bucket']] = (total + row['count'], passed + row['passed'])
+        trend = [
+            {'label': label(bucket), 'total': total, 'pass_rate': passed / total * 100 if total else 0}
+            for bucket, (total, passed) in sorted(buckets.items())
+        ]
+        return rows, trend
+
+    @staticmethod
+    def _run_trend(runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """실행 색인 행으로 일별 결과 통과율 추이 계산 (로트 요약용)"""
+        days = {}
+        for run in runs:
+            total, failed = days.get(run['run_id'][:8], (0, 0))
+            days[run['run_id'][:8]] = (total + run['result_count'], failed + run['failed_count'])
+        return [
+            {'label': f'{day[4:6]}-{day[6:8]}', 'total': total,
+             'pass_rate': (total - failed) / total * 100 if total else 0}
+            for day, (total, failed) in sorted(days.items())
+        ]
+
+    def _item_summary(self, stats: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """항목별 수율, 기간 Ppk(기간 내 전체 표준편차), 현재 공정 Cpk(SPC 상태)"""
+        spc_stats = self.test_manager.get_spc_statistics() or {}
+        items = []
+        for item, type_stats in stats['test_types'].items():
+            measurement = stats['measurement_stats'].get(item, {})
+            spec = self.test_manager.test_items.get(item)
+            ppk = None
+            if spec and measurement.get('std'):
+                usl = spec['reference'] + spec['tolerance']
+                lsl = spec['reference'] - spec['tolerance']
+                mean = measurement['mean']
+                ppk = min(usl - mean, mean - lsl) / (3 * measurement['std'])
+            cpk = (spc_stats.get(item) or {}).get('cpk')
+            items.append({
+                'test_item': item,
+                'count': type_stats['count'],
+                'passed': type_stats['passed'],
+                'failed': type_stats['failed'],
+                'pass_rate': type_stats['pass_rate'],
+                'mean': measurement.get('mean'),
+                'std': measurement.get('std'),
+                'ppk': ppk if ppk is None or math.isfinite(ppk) else None,
+                'cpk': cpk
+            })
+        return items
+
+
+class ReportScheduler:
+    """기간 경계가 지나면 직전 기간의 요약 리포트를 data/reports/summary에 자동 생성
+
+    기간 구분별로 마지막으로 만든 기간을 schedule.json에 기록해, 프로그램을 다시 시작해도
+    같은 기간을 두 번 만들지 않는다. 처음 실행할 때는 직전 기간 하나만 만든다.
+    """
+
+    def __init__(self, test_manager, report_generator: Optional[ReportGenerator] = None,
+                 periods: Optional[List[str]] = None, interval: float = 60):
+        self.summary_manager = SummaryManager(test_manager)
+        self.report_generator = report_generator or ReportGenerator()
+        self.periods = periods or SettingsManager().get_report_schedule_settings()['periods']
+        self.interval = interval
+        self.report_dir = self.report_generator.report_dir / 'summary'
+        self.state_path = self.report_dir / 'schedule.json'
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def load_state(self) -> Dict[str, str]:
+        if not self.state_path.exists():
+            return {}
+        with open(self.state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_state(self, state: Dict[str, str]):
+        tmp_path = self.state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        tmp_path.replace(self.state_path)
+
+    def run_due(self, now: Optional[datetime] = None) -> List[str]:
+        """경계가 지난 기간의 요약 리포트 생성 후 생성한 파일 목록 반환"""
+        now = now or datetime.now()
+        if not self.report_dir.exists():
+            self.report_dir.mkdir(parents=True)
+
+        state = self.load_state()
+        created = []
+        for kind in self.periods:
+            period = self.summary_manager.previous_period(kind, now)
+            if state.get(kind) == period['id']:
+                continue
+            summary = self.summary_manager.build(kind, period['start'])
+            created.append(self.report_generator.generate_summary_report(summary, report_dir=self.report_dir))
+            state[kind] = period['id']
+            self.save_state(state)
+        return created
+
+    def _loop(self):
+        while True:
+            try:
+                self.run_due()
+            except Exception as e:
+                print(f"요약 리포트 자동 생성 중 오류 발생: {e}")
+            if self.stop_event.wait(self.interval):
+                return
+
+    def start(self):
+        """백그라운드 스레드에서 주기적으로 확인 시작"""
+        if self.thread is not None:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """자동 생성 중지"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
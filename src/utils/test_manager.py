@@ -1,25 +1,158 @@
 import os
 import json
+import gzip
+import functools
+import threading
 from datetime import datetime, timedelta
 import random
 from pathlib import Path
+import numpy as np
+from .spc_manager import SPCManager
+from .sketch_manager import SketchManager
+from .rollup_manager import RollupManager, BUCKET_WIDTHS
+from .settings_manager import SettingsManager
+from .history_query import HistoryQuery, HistoryCursor, SORT_FIELDS
+from .db_manager import DBManager
+from .run_id import new_run_id
+from .history_loader import HistoryLoader, parse_run_files
+from .downsampling import downsample
+from .snapshot_manager import SnapshotManager
+
+# 이 개수 이상의 실행 파일은 프로세스 풀로 병렬 로드
+PARALLEL_LOAD_THRESHOLD = 2000
+# 이 건수 이하의 이력 조회 결과만 캐시/스냅샷에 보관
+HISTORY_CACHE_LIMIT = 5000
+# 캐시가 새로 채워졌을 때 스냅샷을 다시 쓰는 최소 간격(초)
+SNAPSHOT_INTERVAL = 300
+# 추이 그래프 기본 최대 점 수 (그래프 가로 픽셀 수 정도)
+SERIES_MAX_POINTS = 1000
+# 범위 안 실행 수가 이 이하이면 실행별 원시 측정값으로 추이 표시 (작업 스레드에서 파일을 직접 읽는 상한)
+RAW_SERIES_LIMIT = 500
+# 범위가 이 시간 이하이면 5분 단위 집계 사용
+MINUTELY_SERIES_HOURS = 48
+# 범위가 이 시간 이하이면 시간 단위 집계, 넘으면 일 단위 집계 사용
+HOURLY_SERIES_HOURS = 24 * 120
+# 관리도에 항상 표시하는 관리 한계 이탈 점의 최대 수
+CONTROL_CHART_MAX_VIOLATIONS = 500
+# 히트맵 범위가 이 일수를 넘으면 날짜 대신 요일별로 묶음
+HEATMAP_MAX_DAYS = 62
+WEEKDAY_NAMES = ['월', '화', '수', '목', '금', '토', '일']
+
+# data 디렉토리별 데이터 잠금 (같은 디렉토리를 쓰는 TestManager 인스턴스끼리 공유)
+_data_locks = {}
+_data_locks_guard = threading.Lock()
+# 보존 기간 압축이 실행 중인 data 디렉토리
+_compacting = set()
+
+def data_lock(data_dir) -> threading.RLock:
+    """data 디렉토리의 공용 데이터 잠금"""
+    key = str(Path(data_dir).resolve())
+    with _data_locks_guard:
+        if key not in _data_locks:
+            _data_locks[key] = threading.RLock()
+        return _data_locks[key]
+
+def synchronized(method):
+    """메서드를 data 디렉토리 잠금 안에서 실행
+
+    캐시, SPC/스케치/집계 상태 파일, 색인 재구성은 스레드 안전하지 않으므로
+    작업 스레드(렌더링/이력 조회/리포트 스케줄러)와 GUI 스레드의 접근을 한 줄로 세운다.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 class TestManager:
-    def __init__(self):
-        self.data_dir = Path('data')
+    def __init__(self, data_dir=None):
+        self.data_dir = Path(data_dir or 'data')
         self.ensure_data_dir()
+        # 생성기(iter_*)와 커서를 쓰는 호출 측은 읽는 동안 이 잠금을 직접 잡는다
+        self.lock = data_lock(self.data_dir)
         self.test_items = {
             '전압': {'unit': 'V', 'reference': 3.3, 'tolerance': 0.1},
             '전류': {'unit': 'mA', 'reference': 100, 'tolerance': 5},
             '온도': {'unit': '°C', 'reference': 25, 'tolerance': 2},
             '저항': {'unit': 'Ω', 'reference': 1000, 'tolerance': 50}
         }
+        self._statistics_engine = None
+        self.spc_manager = SPCManager(self.test_items, self.data_dir / 'spc_state.json')
+        self.sketch_manager = SketchManager(self.test_items, self.data_dir / 'sketches')
+        self.rollup_manager = RollupManager(self.data_dir / 'rollups')
+        self.archive_dir = self.data_dir / 'archive'
+        settings_manager = SettingsManager()
+        self.retention_settings = settings_manager.get_retention_settings()
+        self.station_settings = settings_manager.get_station_settings()
+        self.plant_settings = settings_manager.get_plant_settings()
+        self.db_manager = DBManager(self.data_dir / 'tester.db')
+        self.generation_path = self.data_dir / 'generation'
+        self.snapshot_manager = SnapshotManager(self.data_dir / 'snapshot.json')
+        self.cache = {}
+        self.cache_markers = self.change_markers()
+        self.cache = self.snapshot_manager.load(self.cache_markers) or {}
+
+    @property
+    def statistics_engine(self):
+        """통계 엔진 (pandas를 쓰므로 통계를 처음 계산할 때 생성)"""
+        if self._statistics_engine is None:
+            from .statistics_engine import StatisticsEngine
+            self._statistics_engine = StatisticsEngine()
+        return self._statistics_engine
 
     def ensure_data_dir(self):
         """데이터 디렉토리 생성"""
         if not self.data_dir.exists():
             self.data_dir.mkdir(parents=True)
 
+    def change_markers(self):
+        """데이터 변경 표식 (변경 세대 번호, 최신 실행 ID)"""
+        generation = self.generation_path.read_text().strip() if self.generation_path.exists() else '0'
+        latest = self.db_manager.run_ids_between(limit=1) if self.db_manager.get_meta('runs_indexed') else []
+        return {
+            'generation': generation,
+            'latest_run_id': latest[0] if latest else None
+        }
+
+    def bump_generation(self):
+        """데이터 변경 세대 번호 증가 (캐시/스냅샷 무효화)"""
+        generation = int(self.generation_path.read_text().strip() or 0) if self.generation_path.exists() else 0
+        # change_markers는 잠금 없이 읽으므로 임시 파일에 쓴 뒤 교체
+        tmp_path = self.generation_path.with_suffix('.tmp')
+        tmp_path.write_text(str(generation + 1))
+        tmp_path.replace(self.generation_path)
+
+    @synchronized
+    def _cached(self, key, compute, cacheable=lambda value: True):
+        """변경 표식이 같으면 캐시된 결과 반환, 다르면 캐시를 비우고 재계산"""
+        markers = self.change_markers()
+        if markers != self.cache_markers:
+            self.cache = {}
+            self.cache_markers = markers
+
+        if key in self.cache:
+            return self.cache[key]
+
+        value = compute()
+        if cacheable(value):
+            self.cache[key] = value
+            if self.snapshot_manager.is_due(SNAPSHOT_INTERVAL):
+                self.save_snapshot()
+        return value
+
+    @synchronized
+    def _peek_cached(self, key):
+        """변경 표식이 같을 때만 캐시된 결과 반환 (없으면 None, 계산하지 않음)"""
+        if self.change_markers() != self.cache_markers:
+            return None
+        return self.cache.get(key)
+
+    @synchronized
+    def save_snapshot(self):
+        """통계/이력 캐시 스냅샷 저장 (종료 시 또는 주기적으로 호출)"""
+        if self.cache:
+            self.snapshot_manager.save(self.cache, self.cache_markers)
+
     def run_test(self, test_item):
         """테스트 실행"""
         if test_item not in self.test_items:
@@ -47,137 +180,736 @@ class TestManager:
             'unit': item_info['unit']
         }
 
-    def save_test_results(self, results):
-        """테스트 결과 저장"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
+    @synchronized
+    def save_test_results(self, results, dut_info=None):
+        """테스트 결과 저장 (dut_info: serial_number/lot/fixture/station)"""
+        dut_info = dut_info or {}
+        station = dut_info.get('station') or self.station_settings.get('id', '')
+        run_id = new_run_id(station)
+        timestamp = run_id[:15]
+
         test_data = {
+            'run_id': run_id,
             'timestamp': timestamp,
+            'dut': {
+                'serial_number': dut_info.get('serial_number', ''),
+                'lot': dut_info.get('lot', ''),
+                'fixture': dut_info.get('fixture') or self.station_settings.get('fixture', ''),
+                'station': station
+            },
             'results': results
         }
         
-        filepath = self.data_dir / f'test_{timestamp}.json'
+        filepath = self.data_dir / f'test_{run_id}.json'
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(test_data, f, ensure_ascii=False, indent=2)
+
+        self.register_run(test_data)
+
+        # 보존 기간이 지난 원시 데이터 압축 (하루 한 번, 저장 경로를 막지 않도록 백그라운드에서)
+        self.schedule_compaction()
             
         return str(filepath)
 
-    def get_test_history(self, test_type=None, start_date=None):
-        """테스트 이력 조회"""
-        history = []
-        
-        # JSON 파일 목록 조회
-        json_files = sorted(self.data_dir.glob('test_*.json'), reverse=True)
-        
-        for file in json_files:
+    @synchronized
+    def register_run(self, test_data):
+        """새로 저장(또는 동기화)된 실행을 색인과 증분 통계에 반영"""
+        run_id = self.run_id_of(test_data)
+
+        # 실행 색인 갱신
+        if self.db_manager.get_meta('runs_indexed'):
+            self.db_manager.add_run(run_id, test_data)
+        self.bump_generation()
+
+        # SPC 통계 증분 갱신 (초기화 전이면 다음 조회 시 재구성)
+        self.spc_manager.load_state()
+        if self.spc_manager.initialized:
+            self.spc_manager.add_run(test_data)
+        if self.sketch_manager.initialized:
+            self.sketch_manager.add_run(test_data)
+        if self.rollup_manager.initialized:
+            self.rollup_manager.add_run(test_data)
+
+    @synchronized
+    def register_runs(self, runs):
+        """대량으로 추가된 실행을 증분 통계에 일괄 반영 (색인은 호출 측에서 추가)
+
+        시간 순서와 무관하게 들어오는 실행은 SPC 이동 범위를 깨므로 SPC 상태는 폐기하고
+        다음 조회 때 재구성한다.
+        """
+        if not runs:
+            return
+        self.bump_generation()
+        self.spc_manager.invalidate()
+        if self.sketch_manager.initialized:
+            self.sketch_manager.add_runs(runs)
+        if self.rollup_manager.initialized:
+            self.rollup_manager.add_runs(runs)
+
+    @synchronized
+    def unregister_run(self, test_data):
+        """삭제(또는 교체)된 실행을 색인과 증분 통계에서 제외 (파일은 이미 삭제된 상태)"""
+        run_id = self.run_id_of(test_data)
+        self.db_manager.remove_run(run_id)
+        self.bump_generation()
+        if self.rollup_manager.initialized:
+            self.rollup_manager.remove_run(test_data)
+        self.spc_manager.invalidate()
+        if self.sketch_manager.initialized:
+            day = run_id[:8]
+            # 같은 날의 보관된 실행도 스케치에 남아 있어야 함
+            self.sketch_manager.rebuild_day(day, self.iter_test_runs(day, include_archive=True))
+
+    def iter_test_runs(self, day=None, include_archive=False):
+        """저장된 테스트 실행을 오래된 순서로 조회 (day: YYYYMMDD)"""
+        if include_archive:
+            yield from self.iter_archived_runs(day)
+
+        pattern = f'test_{day}_*.json' if day else 'test_*.json'
+        files = sorted(self.data_dir.glob(pattern))
+        if len(files) >= PARALLEL_LOAD_THRESHOLD:
+            for chunk in HistoryLoader().iter_chunks(files):
+                yield from chunk.iter_runs()
+            return
+
+        for file in files:
             with open(file, 'r', encoding='utf-8') as f:
+                yield json.load(f)
+
+    @synchronized
+    def load_history_columns(self, start_date=None, end_date=None,
+                             progress_callback=None, cancel_event=None):
+        """기간 내 실행 파일을 병렬로 읽어 컬럼 청크로 반환 (오래된 순)
+
+        progress_callback(완료 파일 수, 전체 파일 수)로 진행률을 알리고,
+        cancel_event(threading.Event)가 설정되면 읽은 부분까지만 반환한다.
+        """
+        run_ids = sorted(self.get_run_ids(start_date, end_date))
+        files = [self.data_dir / f'test_{run_id}.json' for run_id in run_ids]
+        files = [file for file in files if file.exists()]
+        return HistoryLoader().load(files, progress_callback, cancel_event)
+
+    @staticmethod
+    def run_id_of(test_data):
+        """실행 ID (이전 형식 파일은 타임스탬프)"""
+        return test_data.get('run_id', test_data['timestamp'])
+
+    @synchronized
+    def ensure_run_index(self, batch_size=5000):
+        """실행 ID/시리얼/로트 색인이 없으면 전체 이력으로 생성"""
+        if self.db_manager.get_meta('runs_indexed'):
+            return
+        self.rebuild_run_index(batch_size)
+
+    @synchronized
+    def rebuild_run_index(self, batch_size=5000):
+        """실행 파일과 보관 파일로 실행 색인 재구성"""
+        self.db_manager.clear_runs()
+        batch = []
+        for test_data in self.iter_test_runs(include_archive=True):
+            batch.append(self.db_manager.run_row(self.run_id_of(test_data), test_data))
+            if len(batch) >= batch_size:
+                self.db_manager.add_runs(batch)
+                batch = []
+        self.db_manager.add_runs(batch)
+        self.db_manager.set_meta('runs_indexed', '1')
+
+    @synchronized
+    def trace_runs(self, serial_number=None, lot=None, station=None, start_date=None, end_date=None):
+        """DUT 시리얼 번호/로트/스테이션의 실행 목록 조회 (RMA 추적, 기간으로 좁힐 수 있음)"""
+        self.ensure_run_index()
+        start_key, end_key = self.date_keys(start_date, end_date)
+        return self.db_manager.find_runs(serial_number=serial_number, lot=lot, station=station,
+                                         start_key=start_key, end_key=end_key)
+
+    @synchronized
+    def get_latest_runs(self, limit=20):
+        """최근 실행 N건 조회 (정렬된 실행 ID 색인 사용)"""
+        self.ensure_run_index()
+        return self.db_manager.latest_runs(limit)
+
+    @synchronized
+    def get_run_ids(self, start_date=None, end_date=None, limit=None):
+        """기간 내 실행 ID를 최신순으로 조회 (정렬된 실행 ID 색인 범위 탐색)"""
+        self.ensure_run_index()
+        start_key, end_key = self.date_keys(start_date, end_date)
+        return self.db_manager.run_ids_between(start_key, end_key, limit=limit)
+
+    @staticmethod
+    def date_keys(start_date=None, end_date=None):
+        """날짜 범위를 실행 ID 범위 (시작 이상, 끝 미만)로 변환"""
+        start_key = start_date.strftime('%Y%m%d') if start_date else None
+        end_key = (end_date + timedelta(days=1)).strftime('%Y%m%d') if end_date else None
+        return start_key, end_key
+
+    def iter_archived_runs(self, day=None):
+        """압축 보관된 테스트 실행을 오래된 순서로 조회 (day: YYYYMMDD)"""
+        pattern = f'test_{day[:6]}.jsonl.gz' if day else 'test_*.jsonl.gz'
+        for archive in sorted(self.archive_dir.glob(pattern)):
+            with gzip.open(archive, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    test_data = json.loads(line)
+                    if day is None or self.run_id_of(test_data)[:8] == day:
+                        yield test_data
+
+    def archive_path(self, run_id):
+        """실행이 보관되는 월별 압축 파일 경로"""
+        return self.archive_dir / f'test_{run_id[:6]}.jsonl.gz'
+
+    def find_archived_run(self, run_id):
+        """보관 파일에서 실행 하나 조회 (없으면 None)"""
+        path = self.archive_path(run_id)
+        if not path.exists():
+            return None
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip() and f'"{run_id}"' in line:
+                    test_data = json.loads(line)
+                    if self.run_id_of(test_data) == run_id:
+                        return test_data
+        return None
+
+    def remove_archived_run(self, run_id):
+        """보관 파일에서 실행 하나를 빼고 다시 씀 (임시 파일에 쓴 뒤 교체), 뺀 실행 반환"""
+        path = self.archive_path(run_id)
+        if not path.exists():
+            return None
+        removed = None
+        tmp_path = path.with_suffix('.tmp')
+        with gzip.open(path, 'rt', encoding='utf-8') as source, \
+                gzip.open(tmp_path, 'wt', encoding='utf-8') as target:
+            for line in source:
+                if not line.strip():
+                    continue
+                if removed is None and f'"{run_id}"' in line:
+                    test_data = json.loads(line)
+                    if self.run_id_of(test_data) == run_id:
+                        removed = test_data
+                        continue
+                target.write(line if line.endswith('\n') else line + '\n')
+        if removed is None:
+            tmp_path.unlink()
+        else:
+            tmp_path.replace(path)
+        return removed
+
+    def compaction_due(self):
+        """오늘 보존 기간 압축을 아직 하지 않았는지 여부"""
+        return self.rollup_manager.load_meta().get('last_compaction') != datetime.now().strftime('%Y%m%d')
+
+    def schedule_compaction(self):
+        """압축할 때가 되었으면 백그라운드 스레드에서 compact_old_runs 실행
+
+        첫 압축은 전체 집계 재구성을 포함할 수 있으므로 저장(GUI) 경로에서 기다리지 않는다.
+        같은 data 디렉토리의 압축은 한 번에 하나만 실행한다. 반환: 새로 시작했는지 여부
+        """
+        if not self.compaction_due():
+            return False
+        key = str(self.data_dir.resolve())
+        with _data_locks_guard:
+            if key in _compacting:
+                return False
+            _compacting.add(key)
+
+        def run():
+            try:
+                self.compact_old_runs()
+            except Exception as e:
+                print(f"원시 데이터 압축 중 오류 발생: {e}")
+            finally:
+                with _data_locks_guard:
+                    _compacting.discard(key)
+
+        # 보관 파일을 쓰는 도중 프로세스가 끝나지 않도록 데몬 스레드로 두지 않음
+        thread = threading.Thread(target=run, name='compaction')
+        thread.start()
+        return True
+
+    def compact_old_runs(self, raw_days=None):
+        """보존 기간이 지난 원시 실행 파일을 월별 압축 보관 파일로 이동
+
+        월 단위로 잠금을 잡았다 놓으므로 오래 걸려도 다른 스레드의 저장/조회가 중간중간 진행된다.
+        """
+        if raw_days is None:
+            raw_days = self.retention_settings['raw_days']
+
+        # 집계가 먼저 만들어져 있어야 압축 후에도 통계가 유지됨
+        self.ensure_rollups()
+
+        cutoff = (datetime.now().date() - timedelta(days=raw_days)).strftime('%Y%m%d')
+        old_files = [file for file in sorted(self.data_dir.glob('test_*.json'))
+                     if file.stem[len('test_'):][:8] < cutoff]
+
+        # 월별로 묶어서 이어쓰기
+        by_month = {}
+        for file in old_files:
+            by_month.setdefault(file.stem[len('test_'):][:6], []).append(file)
+
+        moved = 0
+        for month, files in by_month.items():
+            with self.lock:
+                # 목록을 만든 뒤 삭제된 실행은 건너뜀
+                files = [file for file in files if file.exists()]
+                if not files:
+                    continue
+                if not self.archive_dir.exists():
+                    self.archive_dir.mkdir(parents=True)
+                with gzip.open(self.archive_dir / f'test_{month}.jsonl.gz', 'at', encoding='utf-8') as archive:
+                    for file in files:
+                        with open(file, 'r', encoding='utf-8') as f:
+                            archive.write(json.dumps(json.load(f), ensure_ascii=False) + '\n')
+                for file in files:
+                    file.unlink()
+                moved += len(files)
+                self.bump_generation()
+
+        with self.lock:
+            self.rollup_manager.save_meta(last_compaction=datetime.now().strftime('%Y%m%d'))
+        return moved
+
+    @synchronized
+    def ensure_rollups(self):
+        """5분/시간/일/주 단위 집계가 없으면(또는 집계 단위 구성이 바뀌었으면) 전체 이력으로 생성"""
+        if not self.rollup_manager.initialized:
+            self.rollup_manager.rebuild(self.iter_test_runs(include_archive=True))
+
+    @synchronized
+    def get_test_history(self, test_type=None, start_date=None, query=None):
+        """테스트 이력 조회"""
+        if query is None:
+            query = HistoryQuery(test_type=test_type, start_date=start_date)
+        return self._cached(
+            ('history', query.cache_key()),
+            lambda: list(self.iter_history(query)),
+            cacheable=lambda history: len(history) <= HISTORY_CACHE_LIMIT
+        )
+
+    def iter_history(self, query, descending=True):
+        """조건에 맞는 테스트 이력을 최신순(descending=False면 오래된 순)으로 조회 (조건은 저장소 단계별로 먼저 적용)"""
+        yield from self._iter_run_ids(self.find_run_ids(query), query, descending)
+
+    @synchronized
+    def open_history(self, query, order_by='timestamp', descending=True, cancelled=None):
+        """조건에 맞는 이력을 정렬 순서대로 필요한 만큼씩 읽는 커서
+
+        시각 순서는 실행 색인 순서 그대로 파일을 차례로 읽으므로 앞쪽 행만 바로 꺼낼 수 있다.
+        다른 필드 정렬은 조건에 맞는 이력을 모두 조회(캐시 사용)한 뒤 그 필드로 정렬한다.
+        같은 값끼리는 최신순을 유지한다. 전체 조회 중 cancelled()가 참이 되면 None을 반환한다.
+        """
+        if order_by not in SORT_FIELDS:
+            raise ValueError(f'정렬할 수 없는 필드: {order_by}')
+        if order_by == 'timestamp':
+            # 이미 조회해 둔 결과(스냅샷 포함)가 있으면 파일을 다시 읽지 않음
+            history = self._peek_cached(('history', query.cache_key()))
+            if history is not None:
+                return HistoryCursor(history if descending else reversed(history))
+            return HistoryCursor(self.iter_history(query, descending))
+        key = ('history', query.cache_key())
+        history = self._peek_cached(key)
+        if history is None:
+            history = []
+            for row in self.iter_history(query):
+                if cancelled is not None and cancelled():
+                    return None
+                history.append(row)
+            self._cached(key, lambda: history, cacheable=lambda rows: len(rows) <= HISTORY_CACHE_LIMIT)
+        return HistoryCursor(sorted(history, key=lambda row: row[order_by], reverse=descending))
+
+    @synchronized
+    def find_run_ids(self, query):
+        """색인 단계 조건(실행 ID, 시리얼, 로트, 기간)에 맞는 실행 ID를 최신순으로 조회"""
+        # 색인으로 대상 실행이 정해지면 해당 실행만, 아니면 정렬된 실행 ID 색인에서 기간 범위만 조회
+        run_ids = self._resolve_run_ids(query)
+        if run_ids is None:
+            run_ids = self.get_run_ids(query.start_date, query.end_date)
+        return [run_id for run_id in sorted(run_ids, reverse=True) if query.matches_key(run_id)]
+
+    def _resolve_run_ids(self, query):
+        """실행 ID/시리얼/로트/스테이션/추적 검색어 조건을 색인으로 실행 ID 집합으로 변환 (해당 조건이 없으면 None)"""
+        run_ids = set(query.run_ids) if query.run_ids is not None else None
+        if query.serial_number or query.lot or query.station:
+            found = {run['run_id'] for run in self.trace_runs(query.serial_number, query.lot, query.station,
+                                                               query.start_date, query.end_date)}
+            run_ids = found if run_ids is None else run_ids & found
+        if query.trace:
+            found = {run['run_id'] for run in self.trace_runs(serial_number=query.trace) +
+                     self.trace_runs(lot=query.trace)}
+            run_ids = found if run_ids is None else run_ids & found
+        return run_ids
+
+    def _iter_run_ids(self, run_ids, query, descending=True):
+        """지정된 실행들만 최신순(또는 오래된 순)으로 조회 (보관된 실행은 include_archive일 때만)
+
+        보관된 실행은 원시 파일보다 오래되었으므로 최신순이면 마지막에, 오래된 순이면 처음에 읽는다.
+        """
+        run_ids = [run_id for run_id in sorted(run_ids, reverse=descending) if query.matches_key(run_id)]
+        archived = set()
+        if not descending:
+            archived = {run_id for run_id in run_ids
+                        if not (self.data_dir / f'test_{run_id}.json').exists()}
+            yield from self._iter_archived(archived, query, descending)
+
+        for run_id in run_ids:
+            if run_id in archived:
+                continue
+            filepath = self.data_dir / f'test_{run_id}.json'
+            if not filepath.exists():
+                archived.add(run_id)
+                continue
+            with open(filepath, 'r', encoding='utf-8') as f:
                 test_data = json.load(f)
-                
-            test_date = datetime.strptime(test_data['timestamp'][:8], '%Y%m%d').date()
-            
-            # 날짜 필터 적용
-            if start_date and test_date < start_date:
+            yield from self._expand_run(test_data, query)
+
+        if descending:
+            yield from self._iter_archived(archived, query, descending)
+
+    def _iter_archived(self, archived, query, descending=True):
+        """보관 파일에서 지정된 실행만 조회"""
+        if not archived or not query.include_archive:
+            return
+        months = {run_id[:6] for run_id in archived}
+        for archive in sorted(self.archive_dir.glob('test_*.jsonl.gz'), reverse=descending):
+            if archive.name[len('test_'):][:6] not in months:
                 continue
-                
-            # 테스트 유형 필터 적용
-            for result in test_data['results']:
-                if test_type and result['test_item'] != test_type:
-                    continue
-                    
-                history.append({
-                    'timestamp': test_data['timestamp'],
-                    'test_item': result['test_item'],
-                    'measured_value': result['measured_value'],
-                    'reference_value': result['reference_value'],
-                    'error': result['error'],
-                    'result': result['result']
-                })
-                
-        return history
+            with gzip.open(archive, 'rt', encoding='utf-8') as f:
+                runs = [json.loads(line) for line in f if line.strip()]
+            for test_data in (reversed(runs) if descending else runs):
+                if self.run_id_of(test_data) in archived:
+                    yield from self._expand_run(test_data, query)
 
+    def _expand_run(self, test_data, query):
+        """실행 하나를 조건에 맞는 결과 레코드로 전개"""
+        if query.has_run_filter and not query.matches_run(test_data):
+            return
+
+        dut = test_data.get('dut') or {}
+        for result in test_data['results']:
+            if not query.matches_result(result):
+                continue
+
+            yield {
+                'run_id': self.run_id_of(test_data),
+                'timestamp': test_data['timestamp'],
+                'test_item': result['test_item'],
+                'measured_value': result['measured_value'],
+                'reference_value': result['reference_value'],
+                'error': result['error'],
+                'result': result['result'],
+                'serial_number': dut.get('serial_number', ''),
+                'lot': dut.get('lot', ''),
+                'station': dut.get('station', '')
+            }
+
+    @synchronized
     def get_test_detail(self, test_id):
-        """테스트 상세 정보 조회"""
+        """테스트 상세 정보 조회 (원시 파일이 압축 보관되었으면 보관 파일에서)"""
         filepath = self.data_dir / f'test_{test_id}.json'
         if not filepath.exists():
-            return None
+            return self.find_archived_run(test_id)
             
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
 
+    @synchronized
     def delete_test(self, test_id):
-        """테스트 삭제"""
+        """테스트 삭제 (압축 보관된 실행은 보관 파일에서 제거)"""
         filepath = self.data_dir / f'test_{test_id}.json'
         if filepath.exists():
+            with open(filepath, 'r', encoding='utf-8') as f:
+                test_data = json.load(f)
             filepath.unlink()
-            return True
-        return False
+        else:
+            test_data = self.remove_archived_run(test_id)
+            if test_data is None:
+                return False
+        self.unregister_run(test_data)
+        return True
 
-    def get_test_statistics(self, period='day'):
-        """테스트 통계 조회"""
-        # 시작 날짜 설정
+    def mount_stations(self, stations=None, central_dir=None):
+        """여러 스테이션 data 디렉토리를 하나의 논리 데이터셋으로 연결
+
+        stations: [{'id': 스테이션 ID, 'path': 스테이션 data 경로}], 생략 시 plant 설정 사용
+        """
+        from .station_sync import StationDataset
+
+        stations = stations if stations is not None else self.plant_settings['stations']
+        central_dir = central_dir or self.plant_settings['central_dir']
+        return StationDataset(central_dir, stations)
+
+    def get_period_start(self, period):
+        """기간 구분(day/week/month)의 시작 날짜"""
         if period == 'day':
-            start_date = datetime.now().date()
+            return datetime.now().date()
         elif period == 'week':
-            start_date = datetime.now().date() - timedelta(days=7)
+            return datetime.now().date() - timedelta(days=7)
         elif period == 'month':
-            start_date = datetime.now().date() - timedelta(days=30)
-        else:
-            start_date = None
+            return datetime.now().date() - timedelta(days=30)
+        return None
+
+    @synchronized
+    def get_test_statistics(self, period='day'):
+        """테스트 통계 조회"""
+        # 시작 날짜 설정
+        start_date = self.get_period_start(period)
             
-        # 테스트 이력 조회
-        history = self.get_test_history(start_date=start_date)
+        return self._cached(('statistics', period, start_date),
+                            lambda: self._compute_statistics(start_date))
+
+    def _compute_statistics(self, start_date):
+        """사전 집계로 통계 계산 (원시 이력을 읽지 않음)"""
+        self.ensure_rollups()
+        daily_rows = self.rollup_manager.query('daily', start_date=start_date)
+        hourly_rows = self.rollup_manager.query('hourly', start_date=start_date)
         
         # 통계 계산
-        total_tests = len(history)
-        total_passed = sum(1 for test in history if test['result'] == 'PASS')
-        total_failed = total_tests - total_passed
-        
-        # 테스트 유형별 통계
-        test_types = {}
-        for test in history:
-            test_item = test['test_item']
-            if test_item not in test_types:
-                test_types[test_item] = {
-                    'count': 0,
-                    'passed': 0,
-                    'failed': 0,
-                    'pass_rate': 0
-                }
-                
-            stats = test_types[test_item]
-            stats['count'] += 1
-            if test['result'] == 'PASS':
-                stats['passed'] += 1
-            else:
-                stats['failed'] += 1
-            stats['pass_rate'] = (stats['passed'] / stats['count']) * 100
-            
-        # 일별 통계
-        daily_stats = {}
-        for test in history:
-            date = test['timestamp'][:8]  # YYYYMMDD
-            if date not in daily_stats:
-                daily_stats[date] = {
-                    'date': date,
-                    'total': 0,
-                    'passed': 0,
-                    'failed': 0,
-                    'pass_rate': 0
-                }
-                
-            stats = daily_stats[date]
-            stats['total'] += 1
-            if test['result'] == 'PASS':
-                stats['passed'] += 1
-            else:
-                stats['failed'] += 1
-            stats['pass_rate'] = (stats['passed'] / stats['total']) * 100
-            
+        return self.statistics_engine.compute_from_rollups(daily_rows, hourly_rows)
+
+    @synchronized
+    def get_spc_statistics(self, test_item=None):
+        """항목별 공정 능력(Cp/Cpk) 및 관리도 통계 조회"""
+        def compute():
+            # 다른 창에서 저장/삭제했을 수 있으므로 저장된 상태를 다시 읽음
+            self.spc_manager.load_state()
+            if not self.spc_manager.initialized:
+                self.spc_manager.rebuild(self.iter_test_runs(include_archive=True))
+            return self.spc_manager.get_statistics()
+
+        spc_stats = self._cached(('spc',), compute)
+        if test_item:
+            return spc_stats.get(test_item)
+        return spc_stats
+
+    @synchronized
+    def series_range(self, start=None, end=None):
+        """추이 조회 범위 (start 생략 시 첫 실행부터, end 생략 시 현재까지)"""
+        self.ensure_run_index()
+        end = end or datetime.now()
+        if start is None:
+            first = self.db_manager.run_ids_between(limit=1, descending=False)
+            start = datetime.strptime(first[0][:15], '%Y%m%d_%H%M%S') if first else end - timedelta(days=1)
+        return start, end
+
+    def rollup_level(self, start, end):
+        """범위 길이에 맞는 집계 단위 (minutely/hourly/daily)"""
+        if end - start <= timedelta(hours=MINUTELY_SERIES_HOURS):
+            return 'minutely'
+        return 'hourly' if end - start <= timedelta(hours=HOURLY_SERIES_HOURS) else 'daily'
+
+    @synchronized
+    def get_measurement_series(self, test_item, start=None, end=None, max_points=SERIES_MAX_POINTS):
+        """기간(확대 범위) 내 측정값 추이 조회
+
+        범위 안 실행이 RAW_SERIES_LIMIT 이하이면 실행별 원시 측정값을 구간별 최소/최대로 추리고,
+        넘으면 범위 길이에 따라 5분/시간/일 단위 집계 평균을 LTTB로 max_points 이하로 줄인다.
+        집계 단위에서는 줄인 점 사이 구간의 최소/최대를 lower/upper로 함께 반환한다.
+        """
+        start, end = self.series_range(start, end)
+        level, times, values, lower, upper, _ = self._series_arrays(test_item, start, end)
+        index = downsample(times.astype('int64'), values, max_points,
+                           method='minmax' if level == 'raw' else 'lttb')
+        return self._series_result(test_item, level, start, end, times, values, lower, upper, index)
+
+    def _series_arrays(self, test_item, start, end):
+        """범위 내 항목 추이 배열 (단위, 시각, 값, 구간 최소, 구간 최대, 구간 측정 수)
+
+        원시 측정값이면 최소/최대는 None이고 측정 수는 모두 1이다.
+        """
+        start_key, end_key = start.strftime('%Y%m%d_%H%M%S'), end.strftime('%Y%m%d_%H%M%S')
+        if self.db_manager.run_totals(start_key, end_key)['runs'] <= RAW_SERIES_LIMIT:
+            times, values = self._raw_series(test_item, start_key, end_key)
+            # 원시 파일이 보관(압축)되어 없으면 집계로 표시
+            if len(times):
+                return 'raw', times, values, None, None, np.ones(len(values), dtype='int64')
+        level = self.rollup_level(start, end)
+        return (level,) + self._rollup_series(test_item, level, start, end)
+
+    def _series_result(self, test_item, level, start, end, times, values, lower, upper, index):
+        """추린 인덱스로 추이 결과 생성 (집계 단위는 추린 점 사이 구간의 최소/최대 포함)"""
+        if lower is not None and len(index):
+            lower = np.minimum.reduceat(lower, index).tolist()
+            upper = np.maximum.reduceat(upper, index).tolist()
+
+        return {
+            'test_item': test_item,
+            'unit': self.test_items.get(test_item, {}).get('unit', ''),
+            'level': level,
+            'start': start,
+            'end': end,
+            'count': len(values),
+            'times': times[index].tolist(),
+            'values': values[index].tolist(),
+            'lower': lower,
+            'upper': upper
+        }
+
+    @synchronized
+    def get_control_chart(self, test_item, start=None, end=None, max_points=SERIES_MAX_POINTS):
+        """기간(확대 범위) 내 항목 관리도 데이터 조회
+
+        get_measurement_series와 같은 해상도 규칙을 따르고, 현재 SPC 상태의 중심선과
+        군내 표준편차로 관리 한계를 붙인다. 원시 측정값은 개별값 관리도(중심 ± 3σ),
+        집계 구간 평균은 구간 측정 수 n에 따른 X̄ 관리도(중심 ± 3σ/√n)이다.
+        관리 한계를 벗어난 점은 점 수를 줄이기 전에 찾아 축소 후에도 항상 남긴다.
+        """
+        start, end = self.series_range(start, end)
+        level, times, values, lower, upper, counts = self._series_arrays(test_item, start, end)
+        item_stats = self.get_spc_statistics(test_item) or {}
+        limits = item_stats.get('individuals')
+
+        index = downsample(times.astype('int64'), values, max_points,
+                           method='minmax' if level == 'raw' else 'lttb')
+        violations = np.array([], dtype='int64')
+        if limits:
+            half_width = 3 * limits['sigma'] / np.sqrt(np.maximum(counts, 1))
+            outside = np.abs(values - limits['center']) > half_width
+            violations = np.flatnonzero(outside)[-CONTROL_CHART_MAX_VIOLATIONS:]
+            index = np.union1d(index, violations)
+
+        series = self._series_result(test_item, level, start, end, times, values, lower, upper, index)
+        series.update({
+            'center': limits['center'] if limits else None,
+            'ucl': (limits['center'] + half_width[index]).tolist() if limits else None,
+            'lcl': (limits['center'] - half_width[index]).tolist() if limits else None,
+            'usl': item_stats.get('usl'),
+            'lsl': item_stats.get('lsl'),
+            'violation_count': int(np.count_nonzero(outside)) if limits else 0,
+            'violations': np.searchsorted(index, violations).tolist()
+        })
+        return series
+
+    def _raw_series(self, test_item, start_key, end_key):
+        """실행 ID 범위 내 항목의 실행별 측정값 (시각 오름차순 datetime64 배열, 값 배열)"""
+        run_ids = self.db_manager.run_ids_between(start_key, end_key, descending=False)
+        paths = [str(path) for path in (self.data_dir / f'test_{run_id}.json' for run_id in run_ids)
+                 if path.exists()]
+        # RAW_SERIES_LIMIT 이하이므로 프로세스 풀 없이 현재 스레드에서 읽음
+        columns = parse_run_files(paths)
+        if test_item not in columns.items:
+            return np.array([], dtype='datetime64[s]'), np.array([], dtype='float64')
+
+        mask = np.asarray(columns.item_codes, dtype='int64') == columns.items.index(test_item)
+        run_index = np.asarray(columns.run_index, dtype='int64')[mask]
+        values = np.asarray(columns.measured_values, dtype='float64')[mask]
+        stamps = np.array([f'{t[:4]}-{t[4:6]}-{t[6:8]}T{t[9:11]}:{t[11:13]}:{t[13:15]}'
+                           for t in columns.timestamps], dtype='datetime64[s]')
+        times = stamps[run_index]
+        order = np.argsort(times, kind='stable')
+        return times[order], values[order]
+
+    def _rollup_series(self, test_item, level, start, end):
+        """집계 구간별 항목 평균/최소/최대/측정 수 (구간 중앙 시각)"""
+        self.ensure_rollups()
+        first, last = self.rollup_manager.bucket_key(level, start), self.rollup_manager.bucket_key(level, end)
+        rows = [row for row in self.rollup_manager.query(level, start.date(), end.date(), test_item=test_item)
+                if first <= row['bucket'] <= last and row['count'] > 0]
+        rows.sort(key=lambda row: row['bucket'])
+        offset = BUCKET_WIDTHS[level] / 2
+        times = np.array([self.rollup_manager.bucket_start(level, row['bucket']) + offset for row in rows],
+                         dtype='datetime64[s]')
+        return (times,
+                np.array([row['mean'] for row in rows], dtype='float64'),
+                np.array([row['min'] for row in rows], dtype='float64'),
+                np.array([row['max'] for row in rows], dtype='float64'),
+                np.array([row['count'] for row in rows], dtype='int64'))
+
+    @synchronized
+    def get_pass_rate_series(self, start=None, end=None, max_points=SERIES_MAX_POINTS):
+        """기간(확대 범위) 내 통과율 추이 조회 (범위 길이에 따라 5분/시간/일 단위 집계, LTTB로 축소)"""
+        start, end = self.series_range(start, end)
+        self.ensure_rollups()
+        level = self.rollup_level(start, end)
+        first, last = self.rollup_manager.bucket_key(level, start), self.rollup_manager.bucket_key(level, end)
+
+        buckets = {}
+        for row in self.rollup_manager.query(level, start.date(), end.date()):
+            if first <= row['bucket'] <= last:
+                total, passed = buckets.get(row['bucket'], (0, 0))
+                buckets[row['bucket']] = (total + row['count'], passed + row['passed'])
+        keys = sorted(bucket for bucket, (total, _) in buckets.items() if total > 0)
+
+        times = np.array([self.rollup_manager.bucket_start(level, key) for key in keys], dtype='datetime64[s]')
+        rates = np.array([buckets[key][1] / buckets[key][0] * 100 for key in keys], dtype='float64')
+        index = downsample(times.astype('int64'), rates, max_points)
         return {
-            'total_tests': total_tests,
-            'total_passed': total_passed,
-            'total_failed': total_failed,
-            'average_pass_rate': (total_passed / total_tests * 100) if total_tests > 0 else 0,
-            'test_types': test_types,
-            'daily_stats': sorted(daily_stats.values(), key=lambda x: x['date'], reverse=True)
-        } 
\ No newline at end of file
+            'level': level,
+            'start': start,
+            'end': end,
+            'count': len(keys),
+            'times': times[index].tolist(),
+            'values': rates[index].tolist()
+        }
+
+    @synchronized
+    def get_pass_rate_heatmap(self, start=None, end=None):
+        """기간 내 날짜 × 시간대별 통과율 (시간 단위 집계로 계산)
+
+        범위가 HEATMAP_MAX_DAYS일을 넘으면 날짜 대신 요일 × 시간대로 묶는다.
+        rates/counts는 [행][시] 2차원 목록이며 측정이 없는 칸의 통과율은 None이다.
+        """
+        start, end = self.series_range(start, end)
+        self.ensure_rollups()
+        first, last = self.rollup_manager.bucket_key('hourly', start), self.rollup_manager.bucket_key('hourly', end)
+        by_weekday = (end.date() - start.date()).days + 1 > HEATMAP_MAX_DAYS
+        if by_weekday:
+            labels = list(WEEKDAY_NAMES)
+        else:
+            labels = [(start.date() + timedelta(days=i)).strftime('%m-%d')
+                      for i in range((end.date() - start.date()).days + 1)]
+
+        totals = np.zeros((len(labels), 24), dtype='int64')
+        passed = np.zeros((len(labels), 24), dtype='int64')
+        for row in self.rollup_manager.query('hourly', start.date(), end.date()):
+            if not first <= row['bucket'] <= last:
+                continue
+            day = datetime.strptime(row['bucket'][:8], '%Y%m%d').date()
+            index = day.weekday() if by_weekday else (day - start.date()).days
+            hour = int(row['bucket'][8:10])
+            totals[index, hour] += row['count']
+            passed[index, hour] += row['passed']
+
+        rates = np.where(totals > 0, passed / np.maximum(totals, 1) * 100, np.nan)
+        return {
+            'mode': 'weekday' if by_weekday else 'day',
+            'start': start,
+            'end': end,
+            'count': int(totals.sum()),
+            'labels': labels,
+            'rates': [[None if np.isnan(rate) else float(rate) for rate in row] for row in rates],
+            'counts': totals.tolist()
+        }
+
+    @synchronized
+    def get_measurement_distribution(self, test_item, start_date=None, end_date=None):
+        """기간 내 측정값 분위수(p1/p50/p99 등)와 히스토그램, 규격/공정 능력 조회
+
+        Ppk는 기간 내 일 단위 집계 모멘트로 구한 전체 표준편차, Cpk는 현재 SPC 상태의
+        군내 표준편차 기준이다.
+        """
+        if not self.sketch_manager.initialized:
+            self.sketch_manager.rebuild(self.iter_test_runs(include_archive=True))
+
+        distribution = self.sketch_manager.get_distribution(test_item, start_date, end_date)
+        if distribution is None:
+            return None
+
+        self.ensure_rollups()
+        rows = self.rollup_manager.query('daily', start_date, end_date, test_item=test_item)
+        frame = self.statistics_engine.rollups_to_frame(rows)
+        measurement = self.statistics_engine.compute_frame(frame, frame)['measurement_stats'].get(test_item, {})
+        item_stats = self.get_spc_statistics(test_item) or {}
+        usl, lsl = item_stats.get('usl'), item_stats.get('lsl')
+        ppk = None
+        if usl is not None and measurement.get('std'):
+            ppk = min(usl - measurement['mean'], measurement['mean'] - lsl) / (3 * measurement['std'])
+
+        distribution.update({
+            'mean': measurement.get('mean'),
+            'std': measurement.get('std'),
+            'usl': usl,
+            'lsl': lsl,
+            'cpk': item_stats.get('cpk'),
+            'ppk': ppk
+        })
+        return distribution
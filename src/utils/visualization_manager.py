@@ -1,115 +1,466 @@
-import matplotlib.pyplot as plt
-import pandas as pd
-from pathlib import Path
-from typing import List, Dict, Any
+import math
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+import numpy as np
+from .artifact_cache import ArtifactCache
+from .downsampling import lttb_indices
+
+# matplotlib은 그래프를 처음 그릴 때 import한다 (다이얼로그 모듈 import 시간 단축)
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# 그래프 스타일 버전 (그리는 방식이 바뀌면 올려서 캐시 무효화)
+GRAPH_STYLE_VERSION = 3
+# 그래프 캐시 한도
+GRAPH_CACHE_MAX_BYTES = 200 * 1024 * 1024
+GRAPH_CACHE_MAX_AGE_DAYS = 30
+# 차트 종류별로 남겨 두는 유휴 Figure 수
+FIGURE_POOL_SIZE = 4
+# 이 점 수 이하일 때만 점 표시
+MARKER_MAX_POINTS = 60
+# 추이 데이터 해상도 표시 이름
+LEVEL_NAMES = {'raw': '실행별', 'minutely': '5분별', 'hourly': '시간별', 'daily': '일별'}
+# 규격/관리 한계선 색
+SPEC_COLOR = 'tab:red'
+LIMIT_COLOR = 'tab:orange'
+
+class ChartFigure:
+    """Figure 하나와 그 위에 그린 차트의 데이터 아티스트
+
+    같은 종류의 차트를 다시 그리면 축/제목 설정은 그대로 두고 데이터 아티스트만 갱신한다.
+    figure를 생략하면 Agg 캔버스를 붙인 화면 없는 Figure를 만든다.
+    """
+
+    def __init__(self, figure: Optional['Figure'] = None, figsize: Tuple[float, float] = (10, 6)):
+        if figure is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            figure = Figure(figsize=figsize)
+            FigureCanvasAgg(figure)
+        self.figure = figure
+        self.ax = figure.add_subplot()
+        self.chart = None
+        self.artists = {}
+
+    def reset(self, chart: Optional[str] = None):
+        """축을 비우고 아티스트 기록 삭제 (색상 막대는 축 공간을 돌려받도록 제거)"""
+        colorbar = self.artists.get('colorbar')
+        if colorbar is not None:
+            colorbar.remove()
+        self.ax.clear()
+        self.artists = {}
+        self.chart = chart
+
+    def prepare(self, chart: str) -> bool:
+        """다른 종류의 차트가 그려져 있으면 축을 비우고 True (고정 요소를 새로 그려야 함)"""
+        if self.chart == chart:
+            return False
+        self.reset(chart)
+        return True
+
+
+class FigurePool:
+    """차트 종류/크기별로 재사용하는 ChartFigure 모음
+
+    한 ChartFigure는 한 번에 한 스레드만 사용하므로 여러 작업 스레드에서 동시에 그려도 된다.
+    """
+
+    def __init__(self, max_idle: int = FIGURE_POOL_SIZE):
+        self.max_idle = max_idle
+        self.lock = threading.Lock()
+        self.idle = {}
+
+    @contextmanager
+    def acquire(self, chart: str, figsize: Tuple[float, float]):
+        key = (chart, tuple(figsize))
+        with self.lock:
+            figures = self.idle.get(key)
+            figure = figures.pop() if figures else None
+        if figure is None:
+            figure = ChartFigure(figsize=figsize)
+
+        try:
+            yield figure
+        except Exception:
+            # 그리다 실패한 Figure는 상태를 알 수 없으므로 버림
+            figure = None
+            raise
+        finally:
+            if figure is not None:
+                with self.lock:
+                    figures = self.idle.setdefault(key, [])
+                    if len(figures) < self.max_idle:
+                        figures.append(figure)
+
 
 class VisualizationManager:
     def __init__(self):
         self.graph_dir = Path('data/graphs')
         self.ensure_graph_dir()
+        self.artifact_cache = ArtifactCache(self.graph_dir, GRAPH_CACHE_MAX_BYTES, GRAPH_CACHE_MAX_AGE_DAYS)
+        self.figure_pool = FigurePool()
 
     def ensure_graph_dir(self):
         """그래프 저장 디렉토리 생성"""
         if not self.graph_dir.exists():
             self.graph_dir.mkdir(parents=True)
 
-    def create_test_summary_graph(self, stats: Dict[str, Any]) -> str:
-        """테스트 요약 그래프 생성"""
-        plt.figure(figsize=(10, 6))
-        
-        # 테스트 유형별 통과율
+    def render_cached(self, kind: str, data: Any, plot, figsize: Tuple[float, float] = (10, 6)) -> str:
+        """입력 데이터와 스타일 버전이 같으면 이전 그래프 파일을 재사용하고, 없을 때만 plot(chart)로 그림"""
+        filename = f"{kind}_{self.artifact_cache.make_key(kind, GRAPH_STYLE_VERSION, data)}.png"
+        cached = self.artifact_cache.get(filename)
+        if cached:
+            return str(cached)
+
+        filepath = self.graph_dir / filename
+        # 같은 그래프를 여러 스레드가 동시에 그려도 임시 파일이 겹치지 않도록 스레드 ID 포함
+        tmp_path = self.graph_dir / f'{filename}.{threading.get_ident()}.tmp'
+        with self.figure_pool.acquire(kind, figsize) as chart:
+            plot(chart)
+            chart.figure.savefig(tmp_path, format='png')
+        tmp_path.replace(filepath)
+        self.artifact_cache.put(filepath)
+        return str(filepath)
+
+    @staticmethod
+    def _update_bars(chart: ChartFigure, key: str, x: List[float], heights: List[float], **kwargs):
+        """막대 수가 같으면 높이만 바꾸고, 다르면 막대를 다시 만듦"""
+        bars = chart.artists.get(key)
+        if bars is not None and len(bars) == len(heights):
+            for bar, position, height in zip(bars, x, heights):
+                bar.set_x(position - bar.get_width() / 2)
+                bar.set_height(height)
+            return bars
+
+        if bars is not None:
+            bars.remove()
+        bars = chart.ax.bar(x, heights, **kwargs)
+        chart.artists[key] = bars
+        return bars
+
+    @staticmethod
+    def pixel_width(chart: ChartFigure) -> int:
+        """축의 가로 픽셀 수 (추이 데이터를 이 점 수 정도로 줄여 그림)"""
+        return max(int(chart.ax.get_window_extent().width), 100)
+
+    @staticmethod
+    def _prepare_time_axis(chart: ChartFigure, ylabel: str):
+        """날짜 축과 추이 선 준비"""
+        from matplotlib.dates import AutoDateLocator, ConciseDateFormatter
+        locator = AutoDateLocator()
+        chart.ax.xaxis.set_major_locator(locator)
+        chart.ax.xaxis.set_major_formatter(ConciseDateFormatter(locator))
+        chart.ax.set_ylabel(ylabel)
+        chart.ax.grid(True)
+        chart.artists['line'], = chart.ax.plot([], [], linewidth=1)
+
+    @staticmethod
+    def _set_time_range(chart: ChartFigure, x, series: Dict[str, Any], bounds: Optional[List] = None):
+        """조회 범위(확대 구간)가 있으면 그 범위로, 없으면 데이터 범위로 축 설정
+
+        bounds의 값 목록(최소/최대 음영 등)도 세로 범위에 포함한다.
+        """
+        from matplotlib.dates import date2num
+        chart.ax.relim()
+        for values in bounds or []:
+            chart.ax.update_datalim(list(zip(x, values)))
+        chart.ax.autoscale_view()
+        if series.get('start') and series.get('end'):
+            chart.ax.set_xlim(date2num(series['start']), date2num(series['end']))
+        elif len(x) == 1:
+            chart.ax.set_xlim(x[0] - 1, x[0] + 1)
+
+    @staticmethod
+    def _set_categories(chart: ChartFigure, labels: List[str], rotation: int = 45):
+        """범주 축 눈금 (막대/선은 0..n-1 위치에 그림)"""
+        chart.ax.set_xticks(range(len(labels)), labels, rotation=rotation)
+        chart.ax.relim()
+        chart.ax.autoscale_view()
+
+    def plot_test_summary(self, chart: ChartFigure, stats: Dict[str, Any]):
+        """테스트 유형별 통과율 막대"""
+        if chart.prepare('test_summary'):
+            chart.ax.set_title('테스트 유형별 통과율')
+            chart.ax.set_xlabel('테스트 유형')
+            chart.ax.set_ylabel('통과율 (%)')
+
         test_types = list(stats['test_types'].keys())
         pass_rates = [stats['test_types'][t]['pass_rate'] for t in test_types]
-        
-        plt.bar(test_types, pass_rates)
-        plt.title('테스트 유형별 통과율')
-        plt.xlabel('테스트 유형')
-        plt.ylabel('통과율 (%)')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        
-        # 그래프 저장
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filepath = self.graph_dir / f"test_summary_{timestamp}.png"
-        plt.savefig(filepath)
-        plt.close()
-        
-        return str(filepath)
+        self._update_bars(chart, 'bars', list(range(len(test_types))), pass_rates)
+        self._set_categories(chart, test_types)
+        chart.figure.tight_layout()
 
-    def create_daily_trend_graph(self, stats: Dict[str, Any]) -> str:
-        """일별 추이 그래프 생성"""
-        plt.figure(figsize=(12, 6))
-        
-        # 일별 데이터 준비
-        dates = [stat['date'] for stat in stats['daily_stats']]
-        pass_rates = [stat['pass_rate'] for stat in stats['daily_stats']]
-        
-        # 날짜 형식 변환
-        dates = [f"{d[:4]}-{d[4:6]}-{d[6:]}" for d in dates]
-        
-        plt.plot(dates, pass_rates, marker='o')
-        plt.title('일별 테스트 통과율 추이')
-        plt.xlabel('날짜')
-        plt.ylabel('통과율 (%)')
-        plt.xticks(rotation=45)
-        plt.grid(True)
-        plt.tight_layout()
-        
-        # 그래프 저장
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filepath = self.graph_dir / f"daily_trend_{timestamp}.png"
-        plt.savefig(filepath)
-        plt.close()
-        
-        return str(filepath)
+    def plot_daily_trend(self, chart: ChartFigure, stats: Dict[str, Any]):
+        """일별 통과율 추이 (통계의 daily_stats, 날짜 축)"""
+        daily_stats = sorted(stats['daily_stats'], key=lambda stat: stat['date'])
+        self.plot_pass_rate_series(chart, {
+            'level': 'daily',
+            'count': len(daily_stats),
+            'times': [datetime.strptime(stat['date'], '%Y%m%d') for stat in daily_stats],
+            'values': [stat['pass_rate'] for stat in daily_stats]
+        })
 
-    def create_test_distribution_graph(self, stats: Dict[str, Any]) -> str:
-        """테스트 분포 그래프 생성"""
-        plt.figure(figsize=(10, 6))
-        
-        # 테스트 유형별 분포
+    def plot_pass_rate_series(self, chart: ChartFigure, series: Dict[str, Any]):
+        """통과율 추이 선 (TestManager.get_pass_rate_series 형식, 가로 픽셀 수 이하로 LTTB 축소)"""
+        if chart.prepare('pass_rate_series'):
+            self._prepare_time_axis(chart, '통과율 (%)')
+            chart.ax.set_xlabel('날짜')
+
+        from matplotlib.dates import date2num
+        x = date2num(series['times']) if series['times'] else []
+        values = series['values']
+        index = lttb_indices(x, values, self.pixel_width(chart))
+        x = [x[i] for i in index]
+        values = [values[i] for i in index]
+
+        line = chart.artists['line']
+        line.set_data(x, values)
+        line.set_marker('o' if len(x) <= MARKER_MAX_POINTS else '')
+        chart.ax.set_title(f"{LEVEL_NAMES[series['level']]} 테스트 통과율 추이")
+        self._set_time_range(chart, x, series)
+        chart.figure.tight_layout()
+
+    def plot_measurement_series(self, chart: ChartFigure, series: Dict[str, Any]):
+        """측정값 추이 선 (TestManager.get_measurement_series 형식)
+
+        집계 단위 데이터는 구간 최소/최대 범위를 음영으로 함께 그린다.
+        """
+        if chart.prepare('measurement_series'):
+            self._prepare_time_axis(chart, '측정값')
+            chart.ax.set_xlabel('시간')
+
+        from matplotlib.dates import date2num
+        x = date2num(series['times']) if series['times'] else []
+        line = chart.artists['line']
+        line.set_data(x, series['values'])
+        line.set_marker('.' if len(x) <= MARKER_MAX_POINTS else '')
+
+        envelope = chart.artists.pop('envelope', None)
+        if envelope is not None:
+            envelope.remove()
+        bounds = None
+        if series.get('lower') and len(x):
+            bounds = [series['lower'], series['upper']]
+            chart.artists['envelope'] = chart.ax.fill_between(
+                x, series['lower'], series['upper'], step='post', alpha=0.2, linewidth=0)
+
+        unit = f" ({series['unit']})" if series.get('unit') else ''
+        chart.ax.set_ylabel(f'측정값{unit}')
+        chart.ax.set_title(f"{series['test_item']} 측정값 추이 "
+                           f"({LEVEL_NAMES[series['level']]}, {len(x)}/{series['count']}점)")
+        self._set_time_range(chart, x, series, bounds)
+        chart.figure.tight_layout()
+
+    def plot_control_chart(self, chart: ChartFigure, series: Dict[str, Any]):
+        """항목 관리도 (TestManager.get_control_chart 형식)
+
+        측정값/구간 평균 선에 중심선, 구간별 관리 한계(UCL/LCL), 규격 한계(USL/LSL)를 겹치고
+        관리 한계를 벗어난 점을 강조한다.
+        """
+        if chart.prepare('control_chart'):
+            self._prepare_time_axis(chart, '측정값')
+            chart.ax.set_xlabel('시간')
+            chart.artists['ucl'], = chart.ax.plot([], [], color=LIMIT_COLOR, linestyle='--',
+                                                  linewidth=1, drawstyle='steps-mid', label='UCL/LCL')
+            chart.artists['lcl'], = chart.ax.plot([], [], color=LIMIT_COLOR, linestyle='--',
+                                                  linewidth=1, drawstyle='steps-mid')
+            chart.artists['center'] = chart.ax.axhline(0, color='gray', linewidth=1, label='중심선')
+            chart.artists['usl'] = chart.ax.axhline(0, color=SPEC_COLOR, linewidth=1.5, label='USL/LSL')
+            chart.artists['lsl'] = chart.ax.axhline(0, color=SPEC_COLOR, linewidth=1.5)
+            chart.artists['violations'], = chart.ax.plot([], [], linestyle='', marker='o',
+                                                         color=SPEC_COLOR, markersize=4, label='관리 이탈')
+            chart.ax.legend(loc='upper left', fontsize=8)
+
+        from matplotlib.dates import date2num
+        x = date2num(series['times']) if series['times'] else []
+        line = chart.artists['line']
+        line.set_data(x, series['values'])
+        line.set_marker('.' if len(x) <= MARKER_MAX_POINTS else '')
+
+        has_limits = series['center'] is not None
+        chart.artists['ucl'].set_data(x, series['ucl'] if has_limits else [])
+        chart.artists['lcl'].set_data(x, series['lcl'] if has_limits else [])
+        bounds = [series['ucl'], series['lcl']] if has_limits and len(x) else []
+        for key, value in (('center', series['center']), ('usl', series['usl']), ('lsl', series['lsl'])):
+            line = chart.artists[key]
+            line.set_visible(value is not None)
+            if value is not None:
+                line.set_ydata([value, value])
+                bounds.append([value] * len(x))
+        chart.artists['violations'].set_data([x[i] for i in series['violations']],
+                                             [series['values'][i] for i in series['violations']])
+
+        unit = f" ({series['unit']})" if series.get('unit') else ''
+        chart.ax.set_ylabel(f'측정값{unit}')
+        chart.ax.set_title(f"{series['test_item']} 관리도 ({LEVEL_NAMES[series['level']]}, "
+                           f"관리 이탈 {series['violation_count']}/{series['count']}점)")
+        self._set_time_range(chart, x, series, bounds)
+        chart.figure.tight_layout()
+
+    def plot_pass_rate_heatmap(self, chart: ChartFigure, heatmap: Dict[str, Any]):
+        """날짜(또는 요일) × 시간대 통과율 히트맵 (TestManager.get_pass_rate_heatmap 형식)"""
+        rates = np.ma.masked_invalid(np.array(heatmap['rates'], dtype='float64'))
+        extent = (-0.5, 23.5, len(heatmap['labels']) - 0.5, -0.5)
+        image = chart.artists.get('image')
+        if chart.prepare('pass_rate_heatmap') or image is None:
+            image = chart.artists['image'] = chart.ax.imshow(
+                rates, aspect='auto', cmap='RdYlGn', vmin=0, vmax=100,
+                interpolation='nearest', extent=extent)
+            chart.artists['colorbar'] = chart.figure.colorbar(image, ax=chart.ax, label='통과율 (%)')
+            chart.ax.set_xlabel('시간대')
+            chart.ax.set_xticks(range(0, 24, 3))
+        else:
+            image.set_data(rates)
+            image.set_extent(extent)
+
+        labels = heatmap['labels']
+        # 행이 많으면 눈금 라벨을 건너뛰며 표시
+        step = max(1, math.ceil(len(labels) / 31))
+        chart.ax.set_yticks(range(0, len(labels), step), labels[::step])
+        chart.ax.set_ylabel('요일' if heatmap['mode'] == 'weekday' else '날짜')
+        chart.ax.set_title(f"시간대별 통과율 (n={heatmap['count']})")
+        chart.figure.tight_layout()
+
+    def plot_test_distribution(self, chart: ChartFigure, stats: Dict[str, Any]):
+        """테스트 유형별 분포 원 그래프 (조각 수가 바뀌므로 매번 다시 그림)"""
+        chart.reset('test_distribution')
         test_types = list(stats['test_types'].keys())
         counts = [stats['test_types'][t]['count'] for t in test_types]
-        
-        plt.pie(counts, labels=test_types, autopct='%1.1f%%')
-        plt.title('테스트 유형별 분포')
-        
-        # 그래프 저장
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filepath = self.graph_dir / f"test_distribution_{timestamp}.png"
-        plt.savefig(filepath)
-        plt.close()
-        
-        return str(filepath)
+        chart.ax.pie(counts, labels=test_types, autopct='%1.1f%%')
+        chart.ax.set_title('테스트 유형별 분포')
 
-    def create_test_result_graph(self, test_data: Dict[str, Any]) -> str:
-        """개별 테스트 결과 그래프 생성"""
-        plt.figure(figsize=(12, 6))
-        
-        # 테스트 결과 데이터 준비
+    def plot_test_result(self, chart: ChartFigure, test_data: Dict[str, Any]):
+        """테스트 항목별 측정값/기준값 막대"""
         test_items = [r['test_item'] for r in test_data['results']]
         measured_values = [r['measured_value'] for r in test_data['results']]
         reference_values = [r['reference_value'] for r in test_data['results']]
-        
-        # 막대 그래프 생성
         x = range(len(test_items))
         width = 0.35
-        
-        plt.bar([i - width/2 for i in x], measured_values, width, label='측정값')
-        plt.bar([i + width/2 for i in x], reference_values, width, label='기준값')
-        
-        plt.title('테스트 항목별 측정값과 기준값 비교')
-        plt.xlabel('테스트 항목')
-        plt.ylabel('값')
-        plt.xticks(x, test_items, rotation=45)
-        plt.legend()
-        plt.tight_layout()
-        
-        # 그래프 저장
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filepath = self.graph_dir / f"test_result_{timestamp}.png"
-        plt.savefig(filepath)
-        plt.close()
-        
-        return str(filepath) 
\ No newline at end of file
+
+        if chart.prepare('test_result'):
+            chart.ax.set_title('테스트 항목별 측정값과 기준값 비교')
+            chart.ax.set_xlabel('테스트 항목')
+            chart.ax.set_ylabel('값')
+        self._update_bars(chart, 'measured', [i - width/2 for i in x], measured_values, width=width, label='측정값')
+        self._update_bars(chart, 'reference', [i + width/2 for i in x], reference_values, width=width, label='기준값')
+        chart.ax.legend()
+        self._set_categories(chart, test_items)
+        chart.figure.tight_layout()
+
+    def plot_measurement_distribution(self, chart: ChartFigure, distribution: Dict[str, Any]):
+        """측정값 분포(고정 구간 히스토그램)와 주요 분위수"""
+        if chart.prepare('measurement_distribution'):
+            chart.ax.set_xlabel('측정값')
+            chart.ax.set_ylabel('빈도')
+            for label in ('p1', 'p50', 'p99'):
+                chart.artists[label] = (chart.ax.axvline(0, linestyle='--', color='gray', visible=False),
+                                        chart.ax.text(0, 0, '', fontsize=9, visible=False))
+            for label in ('LSL', 'USL'):
+                chart.artists[label] = (chart.ax.axvline(0, color=SPEC_COLOR, linewidth=1.5, visible=False),
+                                        chart.ax.text(0, 0, '', fontsize=9, color=SPEC_COLOR, visible=False))
+            chart.artists['fit'], = chart.ax.plot([], [], color='black', linewidth=1)
+            chart.artists['capability'] = chart.ax.text(
+                0.98, 0.95, '', transform=chart.ax.transAxes, fontsize=9, ha='right', va='top',
+                bbox={'boxstyle': 'round', 'facecolor': 'white', 'alpha': 0.8})
+
+        # 구간 경계가 같으면 막대 높이만 갱신
+        histogram = distribution['histogram']
+        edges = distribution['edges'] if histogram else []
+        bars = chart.artists.get('bars')
+        if bars is not None and (not histogram or len(bars) != len(histogram['counts'])
+                                 or chart.artists.get('edges') != edges):
+            bars.remove()
+            bars = chart.artists['bars'] = None
+        if histogram:
+            if bars is None:
+                widths = [edges[i + 1] - edges[i] for i in range(len(edges) - 1)]
+                chart.artists['bars'] = chart.ax.bar(edges[:-1], histogram['counts'], width=widths,
+                                                     align='edge', edgecolor='white')
+                chart.artists['edges'] = list(edges)
+            else:
+                for bar, count in zip(bars, histogram['counts']):
+                    bar.set_height(count)
+
+        # 구간 집계 평균/표준편차로 정규 분포 곡선 (막대와 같은 빈도 단위)
+        fit = chart.artists['fit']
+        mean, std = distribution.get('mean'), distribution.get('std')
+        if histogram and mean is not None and std:
+            x = np.linspace(edges[0], edges[-1], 200)
+            scale = sum(histogram['counts']) * (edges[1] - edges[0])
+            fit.set_data(x, scale * np.exp(-0.5 * ((x - mean) / std) ** 2) / (std * math.sqrt(2 * math.pi)))
+        else:
+            fit.set_data([], [])
+        # 숨겨 둔 표시선(처음 위치 0)은 범위 계산에서 제외
+        chart.ax.relim(visible_only=True)
+        chart.ax.autoscale_view()
+
+        # 주요 분위수와 규격 한계 표시 (라벨이 겹치지 않도록 높이를 달리함)
+        ylim = chart.ax.get_ylim()[1]
+        marks = [(distribution['quantiles'].get(q), label, ylim * 0.95)
+                 for q, label in ((0.01, 'p1'), (0.5, 'p50'), (0.99, 'p99'))]
+        marks += [(distribution.get('lsl'), 'LSL', ylim * 0.85), (distribution.get('usl'), 'USL', ylim * 0.85)]
+        for value, label, top in marks:
+            line, text = chart.artists[label]
+            line.set_visible(value is not None)
+            text.set_visible(value is not None)
+            if value is not None:
+                line.set_xdata([value, value])
+                text.set_position((value, top))
+                text.set_text(f' {label}={value:.3f}')
+
+        lines = []
+        for key, name in (('cpk', 'Cpk'), ('ppk', 'Ppk')):
+            if distribution.get(key) is not None:
+                lines.append(f'{name} {distribution[key]:.2f}')
+        if histogram and (histogram['underflow'] or histogram['overflow']):
+            lines.append(f"범위 밖 {histogram['underflow'] + histogram['overflow']}건")
+        capability = chart.artists['capability']
+        capability.set_text('\n'.join(lines))
+        capability.set_visible(bool(lines))
+
+        chart.ax.set_title(f"{distribution['test_item']} 측정값 분포 (n={distribution['count']})")
+        chart.figure.tight_layout()
+
+    def create_test_summary_graph(self, stats: Dict[str, Any]) -> str:
+        """테스트 요약 그래프 생성"""
+        return self.render_cached('test_summary', stats['test_types'],
+                                  lambda chart: self.plot_test_summary(chart, stats))
+
+    def create_daily_trend_graph(self, stats: Dict[str, Any]) -> str:
+        """일별 추이 그래프 생성"""
+        return self.render_cached('daily_trend', stats['daily_stats'],
+                                  lambda chart: self.plot_daily_trend(chart, stats), figsize=(12, 6))
+
+    def create_measurement_series_graph(self, series: Dict[str, Any]) -> str:
+        """측정값 추이 그래프 생성"""
+        return self.render_cached('measurement_series', series,
+                                  lambda chart: self.plot_measurement_series(chart, series), figsize=(12, 6))
+
+    def create_test_distribution_graph(self, stats: Dict[str, Any]) -> str:
+        """테스트 분포 그래프 생성"""
+        return self.render_cached('test_distribution', stats['test_types'],
+                                  lambda chart: self.plot_test_distribution(chart, stats))
+
+    def create_test_result_graph(self, test_data: Dict[str, Any]) -> str:
+        """개별 테스트 결과 그래프 생성"""
+        return self.render_cached('test_result', test_data['results'],
+                                  lambda chart: self.plot_test_result(chart, test_data), figsize=(12, 6))
+
+    def create_control_chart_graph(self, series: Dict[str, Any]) -> str:
+        """항목 관리도 그래프 생성"""
+        return self.render_cached('control_chart', series,
+                                  lambda chart: self.plot_control_chart(chart, series), figsize=(12, 6))
+
+    def create_pass_rate_heatmap_graph(self, heatmap: Dict[str, Any]) -> str:
+        """시간대별 통과율 히트맵 그래프 생성"""
+        return self.render_cached('pass_rate_heatmap', heatmap,
+                                  lambda chart: self.plot_pass_rate_heatmap(chart, heatmap), figsize=(12, 6))
+
+    def create_measurement_distribution_graph(self, distribution: Dict[str, Any]) -> str:
+        """측정값 분포(히스토그램/분위수) 그래프 생성"""
+        return self.render_cached('measurement_distribution', distribution,
+                                  lambda chart: self.plot_measurement_distribution(chart, distribution),
+                                  figsize=(12, 6))
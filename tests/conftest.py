@@ -0,0 +1,70 @@
+import itertools
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 저장소 루트에서 src 패키지를 import할 수 있도록 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.run_id import RunIdGenerator
+
+# 테스트 실행 데이터의 항목별 기준값/단위 (TestManager.test_items 기본값과 같음)
+ITEM_SPECS = {'전압': (3.3, 'V'), '전류': (100, 'mA'), '온도': (25, '°C'), '저항': (1000, 'Ω')}
+
+
+class RunFactory:
+    """저장 형식의 실행 데이터와 test_<실행 ID>.json 파일 생성
+
+    실행 ID는 new_run_id와 같은 형식이며 순번이 계속 늘어나므로 같은 초의 실행도 겹치지 않는다.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.sequence = itertools.count(1)
+
+    def make(self, when, value=3.3, item='전압', passed=True, station='ST01',
+             serial_number='SN1', lot='L1'):
+        run_id = RunIdGenerator.format_id(when, station, next(self.sequence))
+        reference, unit = ITEM_SPECS[item]
+        return {
+            'run_id': run_id,
+            'timestamp': run_id[:15],
+            'dut': {'serial_number': serial_number, 'lot': lot, 'fixture': '', 'station': station},
+            'results': [{'test_item': item, 'measured_value': value, 'reference_value': reference,
+                         'error': abs(value - reference) / reference * 100,
+                         'result': 'PASS' if passed else 'FAIL', 'unit': unit}]
+        }
+
+    def write(self, test_data, directory=None, mtime_ns=None) -> Path:
+        """실행 파일 쓰기 (directory 생략 시 manager의 data 디렉토리)"""
+        path = Path(directory or self.manager.data_dir) / f"test_{test_data['run_id']}.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(test_data, f, ensure_ascii=False)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def add(self, when, register=True, **fields):
+        """manager에 실행 저장 (register면 색인/증분 통계에도 반영)"""
+        test_data = self.make(when, **fields)
+        self.write(test_data)
+        if register:
+            self.manager.register_run(test_data)
+        return test_data
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """임시 작업 디렉토리(config/, data/)를 쓰는 TestManager"""
+    monkeypatch.chdir(tmp_path)
+    from src.utils.test_manager import TestManager
+    return TestManager(data_dir=tmp_path / 'data')
+
+
+@pytest.fixture
+def runs(manager):
+    """manager data 디렉토리용 실행 파일 생성기"""
+    return RunFactory(manager)
@@ -0,0 +1,68 @@
+import os
+import time
+
+from src.utils.artifact_cache import ArtifactCache
+
+
+def write_entry(cache_dir, name, size, used_at):
+    path = cache_dir / name
+    path.write_bytes(b'x' * size)
+    os.utime(path, (used_at, used_at))
+    return path
+
+
+def key(n):
+    return f'{n:020x}'
+
+
+def test_evicts_least_recently_used_over_size_limit(tmp_path):
+    now = time.time()
+    cache = ArtifactCache(tmp_path, max_bytes=250)
+    oldest = write_entry(tmp_path, f'report_{key(1)}.html', 100, now - 300)
+    middle = write_entry(tmp_path, f'report_{key(2)}.html', 100, now - 200)
+    newest = write_entry(tmp_path, f'report_{key(3)}.html', 100, now - 100)
+
+    assert cache.evict() == 1
+    assert not oldest.exists()
+    assert middle.exists() and newest.exists()
+
+
+def test_get_refreshes_use_time(tmp_path):
+    now = time.time()
+    cache = ArtifactCache(tmp_path, max_bytes=150)
+    first = write_entry(tmp_path, f'graph_{key(1)}.png', 100, now - 300)
+    second = write_entry(tmp_path, f'graph_{key(2)}.png', 100, now - 200)
+
+    assert cache.get(first.name) == first
+    cache.evict()
+    assert first.exists()
+    assert not second.exists()
+    assert cache.get(second.name) is None
+
+
+def test_pages_are_evicted_with_their_report(tmp_path):
+    now = time.time()
+    cache = ArtifactCache(tmp_path, max_bytes=10_000, max_age_days=1)
+    old_files = [write_entry(tmp_path, name, 10, now - 2 * 86400)
+                 for name in (f'report_{key(1)}.html', f'report_{key(1)}_p1.html', f'report_{key(1)}_p2.html')]
+    # 페이지 하나만 최근에 사용했으면 리포트 전체가 남음
+    kept = [write_entry(tmp_path, f'report_{key(2)}.html', 10, now - 2 * 86400),
+            write_entry(tmp_path, f'report_{key(2)}_p1.html', 10, now)]
+    other = write_entry(tmp_path, 'index.html', 10, now - 10 * 86400)
+
+    assert cache.evict() == 1
+    assert not any(path.exists() for path in old_files)
+    assert all(path.exists() for path in kept)
+    assert other.exists()
+
+
+def test_put_evicts_at_most_once_per_interval(tmp_path):
+    now = time.time()
+    cache = ArtifactCache(tmp_path, max_bytes=100, evict_interval=3600)
+    cache.put(write_entry(tmp_path, f'report_{key(1)}.html', 100, now - 100))
+    second = cache.put(write_entry(tmp_path, f'report_{key(2)}.html', 100, now))
+    assert (tmp_path / f'report_{key(1)}.html').exists() and second.exists()
+
+    cache.evicted_at = 0.0
+    cache.put(second)
+    assert not (tmp_path / f'report_{key(1)}.html').exists()
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from src.utils.downsampling import downsample, lttb_indices, minmax_indices
+
+
+def noisy_series(n=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n, dtype='float64')
+    y = np.sin(x / 200) + rng.normal(0, 0.05, n)
+    return x, y
+
+
+def test_lttb_keeps_endpoints_and_threshold():
+    x, y = noisy_series()
+    indices = lttb_indices(x, y, 300)
+    assert len(indices) == 300
+    assert indices[0] == 0 and indices[-1] == len(x) - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_keeps_spike():
+    x, y = noisy_series()
+    y[2345] = 10.0
+    assert 2345 in lttb_indices(x, y, 100)
+
+
+def test_lttb_returns_all_points_when_below_threshold():
+    x, y = noisy_series(50)
+    assert np.array_equal(lttb_indices(x, y, 100), np.arange(50))
+    assert np.array_equal(lttb_indices(x, y, 2), np.arange(50))
+
+
+def test_minmax_keeps_bucket_extremes():
+    x, y = noisy_series()
+    buckets = 50
+    indices = minmax_indices(x, y, buckets)
+    assert len(indices) <= 2 * buckets
+    assert np.all(np.diff(indices) > 0)
+    for bucket in np.array_split(np.arange(len(x)), buckets):
+        assert bucket[np.argmin(y[bucket])] in indices
+        assert bucket[np.argmax(y[bucket])] in indices
+
+
+def test_minmax_handles_uneven_and_constant_x():
+    # 측정 간격이 고르지 않아 비는 구간이 있어도 점 수는 한도 이하
+    x = np.concatenate([np.linspace(0, 1, 500), np.linspace(100, 101, 500)])
+    y = np.arange(1000, dtype='float64')
+    indices = minmax_indices(x, y, 20)
+    assert len(indices) <= 40
+    assert {0, 499, 500, 999} <= set(indices)
+
+    same = minmax_indices(np.zeros(100), np.arange(100), 10)
+    assert list(same) == [0, 99]
+
+
+def test_downsample_dispatch():
+    x, y = noisy_series()
+    assert np.array_equal(downsample(x, y, 200), lttb_indices(x, y, 200))
+    assert np.array_equal(downsample(x, y, 200, method='minmax'), minmax_indices(x, y, 100))
+    with pytest.raises(ValueError):
+        downsample(x, y, 200, method='average')
@@ -0,0 +1,35 @@
+import builtins
+import csv
+import threading
+from datetime import datetime, timedelta
+
+import src.utils.test_manager as test_manager_module
+from src.utils.export_manager import ExportManager
+from src.utils.history_query import HistoryQuery
+
+
+def test_run_deleted_during_export(manager, runs, monkeypatch, tmp_path):
+    start = datetime.now() - timedelta(hours=1)
+    run_ids = [runs.add(start + timedelta(minutes=i), value=3.3 + i / 100)['run_id'] for i in range(3)]
+    target = f'test_{run_ids[1]}.json'
+    manager.ensure_run_index()
+    deleter = threading.Thread(target=manager.delete_test, args=(run_ids[1],))
+
+    # 내보내기가 실행 파일 존재를 확인한 직후(열기 직전)에 다른 스레드가 그 실행을 삭제
+    def racing_open(file, *args, **kwargs):
+        if str(file).endswith(target) and not deleter.is_alive() and deleter.ident is None:
+            deleter.start()
+            deleter.join(0.2)
+        return builtins.open(file, *args, **kwargs)
+
+    monkeypatch.setattr(test_manager_module, 'open', racing_open, raising=False)
+    result = ExportManager(manager).export(HistoryQuery(), fmt='CSV', path=tmp_path / 'history.csv')
+    deleter.join(5)
+
+    assert result['rows'] == 3
+    with open(result['path'], encoding='utf-8-sig') as f:
+        exported = [row['run_id'] for row in csv.DictReader(f)]
+    assert exported == sorted(run_ids, reverse=True)
+    # 삭제는 내보내기가 그 실행을 다 읽은 뒤에 진행
+    assert not deleter.is_alive()
+    assert manager.get_test_detail(run_ids[1]) is None
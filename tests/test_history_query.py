@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from src.utils.history_query import HistoryCursor, HistoryQuery
+
+
+def test_cursor_checks_cancel_before_reading():
+    read = []
+
+    def rows():
+        for i in range(10):
+            read.append(i)
+            yield {'index': i}
+
+    cursor = HistoryCursor(rows())
+    assert [row['index'] for row in cursor.fetch(3)] == [0, 1, 2]
+    assert cursor.fetch(3, cancelled=lambda: True) == []
+    # 취소되면 다음 행을 읽지 않고 다음 fetch에서 이어 읽음
+    assert read == [0, 1, 2]
+    assert not cursor.exhausted
+    assert [row['index'] for row in cursor.fetch(100, cancelled=lambda: False)] == list(range(3, 10))
+    assert cursor.exhausted
+    assert cursor.fetched == 10
+
+
+def test_station_filter_uses_run_index(manager, runs):
+    added = [runs.add(datetime(2024, 3, 1, 10, 0, i), register=False, station=station, serial_number=f'SN{i}')
+             for i, station in enumerate(['ST01', 'ST02', 'ST01'])]
+    manager.ensure_run_index()
+
+    query = HistoryQuery(station='ST01')
+    assert manager.find_run_ids(query) == [added[2]['run_id'], added[0]['run_id']]
+    assert [row['station'] for row in manager.iter_history(query)] == ['ST01', 'ST01']
+    assert manager.find_run_ids(HistoryQuery(station='ST01', start_date=datetime(2024, 3, 2).date())) == []
+
+
+def test_trace_matches_serial_or_lot(manager, runs):
+    added = [runs.add(datetime(2024, 3, 1, 10, 0, i), register=False, serial_number=serial, lot=lot)
+             for i, (serial, lot) in enumerate([('SN1', 'L1'), ('SN2', 'SN1'), ('SN3', 'L2')])]
+
+    # 색인은 조회할 때(작업 스레드에서) 만들어짐
+    query = HistoryQuery(trace='SN1', include_archive=True)
+    assert manager.find_run_ids(query) == [added[1]['run_id'], added[0]['run_id']]
+    assert {row['serial_number'] for row in manager.get_test_history(query=query)} == {'SN1', 'SN2'}
+    assert query.cache_key() != HistoryQuery(trace='SN2', include_archive=True).cache_key()
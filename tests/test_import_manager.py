@@ -0,0 +1,56 @@
+import csv
+from datetime import datetime, timedelta
+
+from src.utils.import_manager import ImportManager
+
+
+def write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['일시', '시리얼', '스테이션', '항목', '측정값 (V)'])
+        writer.writerows(rows)
+    return path
+
+
+def recent(minutes):
+    return (datetime.now() - timedelta(minutes=minutes)).strftime('%Y/%m/%d %H:%M:%S')
+
+
+def test_reimport_is_deduplicated(manager, tmp_path):
+    path = write_csv(tmp_path / 'legacy.csv', [
+        [recent(30), 'SN1', 'ST01', 'voltage', '3.31'],
+        [recent(30), 'SN1', 'ST01', '전류', '101'],
+        [recent(20), 'SN2', 'ST01', '전압', '3.29'],
+    ])
+    importer = ImportManager(manager)
+
+    first = importer.import_paths([path])
+    assert (first['runs'], first['duplicates'], first['rejected']) == (2, 0, 0)
+    assert len(list(manager.data_dir.glob('test_*.json'))) == 2
+
+    second = importer.import_paths([path])
+    assert (second['runs'], second['duplicates']) == (0, 2)
+    assert len(list(manager.data_dir.glob('test_*.json'))) == 2
+
+
+def test_same_content_under_another_run_id_is_duplicate(manager, runs, tmp_path):
+    when = datetime.now() - timedelta(minutes=10)
+    original = runs.make(when)
+    first, second = tmp_path / 'a', tmp_path / 'b'
+    first.mkdir()
+    second.mkdir()
+    runs.write(original, first)
+    # 다른 도구에서 같은 실행을 다른 실행 ID로 내보낸 경우
+    runs.write(dict(original, run_id=runs.make(when)['run_id']), second)
+
+    importer = ImportManager(manager)
+    assert importer.import_paths([first])['runs'] == 1
+    stats = importer.import_paths([second])
+    assert (stats['runs'], stats['duplicates']) == (0, 1)
+
+
+def test_duplicates_within_one_batch(manager, tmp_path):
+    row = [recent(5), 'SN1', 'ST01', '전압', '3.3']
+    other = [recent(4), 'SN2', 'ST01', '전압', '3.2']
+    stats = ImportManager(manager).import_paths([write_csv(tmp_path / 'dup.csv', [row, other, row])])
+    assert (stats['runs'], stats['duplicates']) == (2, 1)
@@ -0,0 +1,55 @@
+import json
+
+from src.utils import report_generator
+from src.utils.report_generator import (DEFAULT_TEMPLATES, TEMPLATE_MANIFEST, TEMPLATE_VERSION,
+                                        ReportGenerator, template_hash)
+
+LEGACY_TEMPLATE = '<html><body>{{ test_date }}</body></html>\n'
+
+
+def write_template(tmp_path, name, text):
+    templates = tmp_path / 'templates'
+    templates.mkdir(exist_ok=True)
+    (templates / name).write_text(text, encoding='utf-8')
+    return templates / name
+
+
+def test_missing_templates_are_created(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ReportGenerator()
+    for name, template in DEFAULT_TEMPLATES.items():
+        assert (tmp_path / 'templates' / name).read_text(encoding='utf-8') == template
+    manifest = json.loads((tmp_path / 'templates' / TEMPLATE_MANIFEST).read_text(encoding='utf-8'))
+    assert manifest['version'] == TEMPLATE_VERSION
+
+
+def test_unmodified_legacy_template_is_replaced(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(report_generator.LEGACY_TEMPLATE_HASHES, 'report_template.html',
+                        {template_hash(LEGACY_TEMPLATE)})
+    path = write_template(tmp_path, 'report_template.html', LEGACY_TEMPLATE.replace('\n', '\r\n'))
+    ReportGenerator()
+    assert path.read_text(encoding='utf-8') == DEFAULT_TEMPLATES['report_template.html']
+
+
+def test_modified_template_is_kept(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = write_template(tmp_path, 'report_template.html', LEGACY_TEMPLATE + '<!-- 사내 양식 -->\n')
+    ReportGenerator()
+    assert '사내 양식' in path.read_text(encoding='utf-8')
+
+
+def test_outdated_default_is_replaced_only_if_unmodified(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ReportGenerator()
+    templates = tmp_path / 'templates'
+    (templates / 'base.html').write_text('이전 기본 base', encoding='utf-8')
+    (templates / 'macros.html').write_text('사용자 수정 macros', encoding='utf-8')
+    manifest = json.loads((templates / TEMPLATE_MANIFEST).read_text(encoding='utf-8'))
+    manifest['version'] = TEMPLATE_VERSION - 1
+    manifest['hashes']['base.html'] = template_hash('이전 기본 base')
+    (templates / TEMPLATE_MANIFEST).write_text(json.dumps(manifest), encoding='utf-8')
+
+    ReportGenerator()
+    assert (templates / 'base.html').read_text(encoding='utf-8') == DEFAULT_TEMPLATES['base.html']
+    assert (templates / 'macros.html').read_text(encoding='utf-8') == '사용자 수정 macros'
@@ -0,0 +1,55 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+def wait_for_compaction(timeout=10):
+    deadline = time.time() + timeout
+    while any(thread.name == 'compaction' for thread in threading.enumerate()):
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_compaction_moves_old_runs_to_archive(manager, runs):
+    old = datetime.now() - timedelta(days=400)
+    old_ids = [runs.add(old + timedelta(minutes=i), value=3.3 + i / 100)['run_id'] for i in range(3)]
+    recent_id = runs.add(datetime.now() - timedelta(days=1))['run_id']
+
+    assert manager.compact_old_runs(raw_days=180) == 3
+    assert not (manager.data_dir / f'test_{old_ids[0]}.json').exists()
+    assert (manager.data_dir / f'test_{recent_id}.json').exists()
+    assert sorted(manager.run_id_of(run) for run in manager.iter_archived_runs()) == old_ids
+    assert not manager.compaction_due()
+    # 집계는 압축 후에도 유지
+    assert sum(row['count'] for row in manager.rollup_manager.query('daily')) == 4
+
+
+def test_detail_and_delete_find_archived_runs(manager, runs):
+    old = datetime.now() - timedelta(days=400)
+    # 같은 초에 저장된 실행도 실행 ID가 겹치지 않음
+    first, second = runs.add(old, value=3.25)['run_id'], runs.add(old, value=3.35)['run_id']
+    manager.compact_old_runs(raw_days=180)
+    manager.ensure_run_index()
+
+    detail = manager.get_test_detail(second)
+    assert detail['run_id'] == second
+    assert detail['results'][0]['measured_value'] == 3.35
+
+    assert manager.delete_test(second)
+    assert manager.get_test_detail(second) is None
+    assert [manager.run_id_of(run) for run in manager.iter_archived_runs()] == [first]
+    assert manager.db_manager.existing_run_ids([first, second]) == {first}
+    assert sum(row['count'] for row in manager.rollup_manager.query('daily')) == 1
+    # 같은 날의 보관된 다른 실행은 스케치에 남음
+    assert manager.get_measurement_distribution('전압')['count'] == 1
+    assert not manager.delete_test(second)
+
+
+def test_save_schedules_compaction_in_background(manager, runs):
+    runs.add(datetime.now() - timedelta(days=400))
+    manager.save_test_results([manager.run_test('전압')])
+    wait_for_compaction()
+
+    assert not manager.compaction_due()
+    assert len(list(manager.iter_archived_runs())) == 1
+    assert not manager.schedule_compaction()
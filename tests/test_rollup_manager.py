@@ -0,0 +1,129 @@
+import itertools
+import random
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from src.utils.rollup_manager import RollupManager
+
+_sequence = itertools.count()
+
+
+def make_run(timestamp, values, lot='L1'):
+    return {
+        'run_id': f'{timestamp}_ST01_{next(_sequence):06d}',
+        'timestamp': timestamp,
+        'dut': {'lot': lot},
+        'results': [
+            {'test_item': item, 'measured_value': value, 'result': 'PASS' if passed else 'FAIL'}
+            for item, value, passed in values
+        ]
+    }
+
+
+def random_runs(count, seed=0):
+    rng = random.Random(seed)
+    runs = []
+    for i in range(count):
+        timestamp = f'202403{1 + i % 10:02d}_{i % 24:02d}{i % 60:02d}00'
+        runs.append(make_run(timestamp, [('전압', rng.gauss(3.3, 0.05), rng.random() > 0.1),
+                                         ('전류', rng.gauss(100, 2), True)],
+                             lot=f'L{i % 3}'))
+    return runs
+
+
+def rows_by_key(manager, tier):
+    return {(row['bucket'], row['test_item']): row for row in manager.query(tier)}
+
+
+def test_moments_match_numpy(tmp_path):
+    runs = random_runs(200)
+    manager = RollupManager(tmp_path / 'rollups')
+    manager.rebuild(runs)
+
+    rows = [row for row in manager.query('daily', test_item='전압') if row['bucket'] == '20240301']
+    values = [run['results'][0]['measured_value'] for run in runs if run['timestamp'].startswith('20240301')]
+    assert len(rows) == 1
+    row = rows[0]
+    assert row['count'] == len(values)
+    assert row['mean'] == pytest.approx(np.mean(values))
+    assert row['m2'] / (row['count'] - 1) == pytest.approx(np.var(values, ddof=1))
+    assert (row['min'], row['max']) == (min(values), max(values))
+
+
+def test_incremental_equals_rebuild(tmp_path):
+    runs = random_runs(120, seed=1)
+    incremental = RollupManager(tmp_path / 'a')
+    incremental.rebuild([])
+    for run in runs[:40]:
+        incremental.add_run(run)
+    incremental.add_runs(runs[40:])
+    rebuilt = RollupManager(tmp_path / 'b')
+    rebuilt.rebuild(runs)
+
+    for tier in ('minutely', 'hourly', 'daily', 'weekly'):
+        a, b = rows_by_key(incremental, tier), rows_by_key(rebuilt, tier)
+        assert a.keys() == b.keys()
+        for key in a:
+            assert a[key]['count'] == b[key]['count']
+            assert a[key]['passed'] == b[key]['passed']
+            assert a[key]['mean'] == pytest.approx(b[key]['mean'])
+            assert a[key]['m2'] == pytest.approx(b[key]['m2'], abs=1e-9)
+    assert incremental.query_lot('L1') and len(incremental.query_lot('L1')) == len(rebuilt.query_lot('L1'))
+
+
+def test_remove_run_restores_moments(tmp_path):
+    runs = random_runs(60, seed=2)
+    manager = RollupManager(tmp_path / 'rollups')
+    manager.rebuild(runs)
+    for run in runs[30:]:
+        manager.remove_run(run)
+    expected = RollupManager(tmp_path / 'expected')
+    expected.rebuild(runs[:30])
+
+    actual, wanted = rows_by_key(manager, 'daily'), rows_by_key(expected, 'daily')
+    assert actual.keys() == wanted.keys()
+    for key in actual:
+        assert actual[key]['count'] == wanted[key]['count']
+        assert actual[key]['passed'] == wanted[key]['passed']
+        assert actual[key]['mean'] == pytest.approx(wanted[key]['mean'])
+        assert actual[key]['m2'] == pytest.approx(wanted[key]['m2'], abs=1e-9)
+
+
+def test_removing_last_run_drops_bucket(tmp_path):
+    run = make_run('20240305_100000', [('전압', 3.3, True)])
+    manager = RollupManager(tmp_path / 'rollups')
+    manager.rebuild([run])
+    manager.remove_run(run)
+    assert manager.query('hourly') == []
+    assert manager.query_lot('L1') == []
+
+
+def test_query_filters_and_weekly_bucket(tmp_path):
+    manager = RollupManager(tmp_path / 'rollups')
+    manager.rebuild([make_run('20240306_100000', [('전압', 3.3, True)]),
+                     make_run('20240312_100000', [('전압', 3.4, False)])])
+
+    assert RollupManager.bucket_key('weekly', datetime(2024, 3, 6, 10)) == '20240304'
+    daily = manager.query('daily', start_date=date(2024, 3, 7))
+    assert [row['bucket'] for row in daily] == ['20240312']
+    assert daily[0]['failed'] == 1
+    # 주 단위는 시작일이 속한 주 전체 포함
+    weekly = manager.query('weekly', start_date=date(2024, 3, 7))
+    assert sorted(row['bucket'] for row in weekly) == ['20240304', '20240311']
+    assert manager.initialized
+
+
+def test_minutely_buckets(tmp_path):
+    manager = RollupManager(tmp_path / 'rollups')
+    manager.rebuild([make_run('20240306_100700', [('전압', 3.3, True)]),
+                     make_run('20240306_100930', [('전압', 3.5, True)]),
+                     make_run('20240306_101000', [('전압', 3.4, False)])])
+
+    assert RollupManager.bucket_key('minutely', datetime(2024, 3, 6, 10, 7, 59)) == '202403061005'
+    assert RollupManager.bucket_start('minutely', '202403061005') == datetime(2024, 3, 6, 10, 5)
+    rows = sorted(manager.query('minutely'), key=lambda row: row['bucket'])
+    assert [(row['bucket'], row['count']) for row in rows] == [('202403061005', 2), ('202403061010', 1)]
+    assert rows[0]['mean'] == pytest.approx(3.4)
+    assert (tmp_path / 'rollups' / 'minutely' / 'rollup_20240306.json').exists()
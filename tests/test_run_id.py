@@ -0,0 +1,52 @@
+import threading
+from datetime import datetime
+
+from src.utils import run_id
+from src.utils.run_id import RunIdGenerator
+
+
+def test_ids_increase_and_are_unique():
+    generator = RunIdGenerator()
+    ids = [generator.next_id('ST01') for _ in range(5000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_ids_increase_when_clock_goes_back(monkeypatch):
+    generator = RunIdGenerator()
+    clock = iter([2_000_000_000_000_000_000, 1_999_999_999_000_000_000, 1_999_999_999_000_000_000])
+    monkeypatch.setattr(run_id.time, 'time_ns', lambda: next(clock))
+    ids = [generator.next_id('ST01') for _ in range(3)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 3
+
+
+def test_ids_unique_across_threads():
+    generator = RunIdGenerator()
+    ids = []
+    lock = threading.Lock()
+
+    def work():
+        local = [generator.next_id('ST01') for _ in range(1000)]
+        with lock:
+            ids.extend(local)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(ids)) == 4000
+
+
+def test_format_and_station_sanitizing():
+    generator = RunIdGenerator()
+    value = generator.next_id('line 1/A')
+    date_part, time_part, fraction, station, sequence = value.split('_')
+    assert datetime.strptime(f'{date_part}_{time_part}', '%Y%m%d_%H%M%S')
+    assert len(fraction) == 9 and len(sequence) == 6
+    assert station == 'line-1-A'
+    assert generator.next_id('').split('_')[3] == 'NA'
+
+    imported = RunIdGenerator.format_id(datetime(2024, 3, 1, 12, 30, 5, 250000), 'ST01', 1000001)
+    assert imported == '20240301_123005_250000000_ST01_000001'
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+
+from src.utils import test_manager as test_manager_module
+
+
+def write_runs(runs, start, count, step=timedelta(minutes=1)):
+    # 색인/집계는 조회할 때 파일로 만들어지도록 등록하지 않음
+    return [runs.add(start + i * step, register=False, value=3.3 + (i % 10) * 0.01, serial_number=f'SN{i}')
+            for i in range(count)]
+
+
+def test_short_range_over_raw_limit_uses_minutely_rollups(manager, runs, monkeypatch):
+    monkeypatch.setattr(test_manager_module, 'RAW_SERIES_LIMIT', 100)
+    start = datetime(2024, 3, 6, 8, 0)
+    write_runs(runs, start, 300)
+    # 원시 파일을 읽으면 실패하도록 막음
+    monkeypatch.setattr(test_manager_module, 'parse_run_files', None)
+
+    series = manager.get_measurement_series('전압', start, start + timedelta(hours=6))
+    assert series['level'] == 'minutely'
+    assert series['count'] == 60
+    assert series['times'][0] == datetime(2024, 3, 6, 8, 2, 30)
+    assert series['lower'][0] == 3.3 and series['upper'][0] == 3.34
+
+    rates = manager.get_pass_rate_series(start, start + timedelta(hours=6))
+    assert rates['level'] == 'minutely' and rates['count'] == 60
+
+
+def test_small_range_uses_raw_values(manager, runs):
+    start = datetime(2024, 3, 6, 8, 0)
+    write_runs(runs, start, 50)
+    series = manager.get_measurement_series('전압', start, start + timedelta(hours=1))
+    assert series['level'] == 'raw'
+    assert series['count'] == 50
+
+
+def test_rollup_level_by_range(manager):
+    start = datetime(2024, 3, 1)
+    assert manager.rollup_level(start, start + timedelta(hours=48)) == 'minutely'
+    assert manager.rollup_level(start, start + timedelta(days=30)) == 'hourly'
+    assert manager.rollup_level(start, start + timedelta(days=365)) == 'daily'
@@ -0,0 +1,93 @@
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.utils.sketch_manager import QuantileSketch, SketchManager
+
+TEST_ITEMS = {'전압': {'unit': 'V', 'reference': 3.3, 'tolerance': 0.1}}
+
+
+def make_run(timestamp, value, item='전압'):
+    return {
+        'run_id': f'{timestamp}_000001',
+        'timestamp': timestamp,
+        'results': [{'test_item': item, 'measured_value': value, 'result': 'PASS'}]
+    }
+
+
+def test_quantiles_within_relative_accuracy():
+    rng = random.Random(1)
+    values = [rng.uniform(1, 1000) for _ in range(5000)] + [-rng.uniform(1, 10) for _ in range(500)] + [0.0] * 10
+    sketch = QuantileSketch(0.01)
+    for value in values:
+        sketch.add(value)
+
+    assert sketch.count == len(values)
+    assert sketch.min == min(values)
+    assert sketch.max == max(values)
+    for q in (0.05, 0.25, 0.5, 0.75, 0.99):
+        expected = np.quantile(values, q, method='lower')
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.03)
+
+
+def test_merge_equals_single_sketch():
+    rng = random.Random(2)
+    values = [rng.gauss(100, 5) for _ in range(2000)]
+    whole = QuantileSketch(0.01)
+    first, second = QuantileSketch(0.01), QuantileSketch(0.01)
+    for i, value in enumerate(values):
+        whole.add(value)
+        (first if i % 2 else second).add(value)
+
+    first.merge(second)
+    assert first.count == whole.count
+    assert first.positive == whole.positive
+    assert (first.min, first.max) == (whole.min, whole.max)
+    assert first.quantile(0.5) == whole.quantile(0.5)
+
+
+def test_merge_rejects_different_accuracy():
+    with pytest.raises(ValueError):
+        QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+def test_round_trip_dict():
+    sketch = QuantileSketch(0.005)
+    for value in (-2.0, 0.0, 1.5, 3.0, 3.0):
+        sketch.add(value)
+    restored = QuantileSketch.from_dict(sketch.to_dict())
+    assert restored.to_dict() == sketch.to_dict()
+    assert restored.quantile(0.5) == sketch.quantile(0.5)
+
+
+def test_spec_accuracy_separates_quantiles_near_reference(tmp_path):
+    rng = random.Random(3)
+    manager = SketchManager(TEST_ITEMS, tmp_path / 'sketches')
+    runs = [make_run(f'20240101_{i:06d}', 3.3 + rng.uniform(-0.1, 0.1)) for i in range(30)]
+    manager.rebuild(runs)
+
+    assert manager.initialized
+    distribution = manager.get_distribution('전압')
+    quantiles = distribution['quantiles']
+    values = sorted(run['results'][0]['measured_value'] for run in runs)
+    # 버킷 폭이 공차(0.1 V)의 몇 %이므로 하위 분위수가 한 값으로 뭉치지 않음
+    assert len({quantiles[0.01], quantiles[0.05], quantiles[0.25]}) == 3
+    assert quantiles[0.5] == pytest.approx(np.quantile(values, 0.5, method='lower'), abs=0.005)
+
+
+def test_accuracy_change_requires_rebuild(tmp_path):
+    manager = SketchManager(TEST_ITEMS, tmp_path / 'sketches')
+    manager.rebuild([make_run('20240101_000000', 3.3)])
+    changed = SketchManager({'전압': {'unit': 'V', 'reference': 3.3, 'tolerance': 0.2}}, tmp_path / 'sketches')
+    assert not changed.initialized
+
+
+def test_add_runs_merges_into_existing_day(tmp_path):
+    manager = SketchManager(TEST_ITEMS, tmp_path / 'sketches')
+    manager.rebuild([make_run('20240101_000000', 3.25)])
+    manager.add_runs([make_run('20240101_010000', 3.35), make_run('20240102_000000', 3.3)])
+
+    assert manager.get_distribution('전압')['count'] == 3
+    assert manager.get_distribution('전압', end_date=date(2024, 1, 1))['count'] == 2
@@ -0,0 +1,36 @@
+from datetime import date, datetime
+
+from src.utils.snapshot_manager import SnapshotManager
+
+MARKERS = {'generation': '3', 'latest_run_id': '20240301_100000_000000000_ST01_000001'}
+
+
+def test_round_trip_preserves_key_types(tmp_path):
+    payload = {
+        ('history', ('전압', date(2024, 3, 1), None, frozenset({'a', 'b'}), False)): [
+            {'run_id': 'r1', 'measured_value': 3.3, 'result': 'PASS'}
+        ],
+        ('statistics', 'day', date(2024, 3, 1)): {'by_hour': {9: 1.5, 10: None}, 'at': datetime(2024, 3, 1, 9, 30)},
+        ('spc',): {'전압': {'cpk': 1.2, 'limits': (3.2, 3.4)}}
+    }
+    manager = SnapshotManager(tmp_path / 'snapshot.json')
+    manager.save(payload, MARKERS)
+
+    assert SnapshotManager(tmp_path / 'snapshot.json').load(MARKERS) == payload
+
+
+def test_stale_or_foreign_snapshot_is_ignored(tmp_path):
+    path = tmp_path / 'snapshot.json'
+    manager = SnapshotManager(path)
+    manager.save({('spc',): {}}, MARKERS)
+    assert manager.load({**MARKERS, 'generation': '4'}) is None
+
+    path.write_bytes(b'\x80\x04\x95 not json')
+    assert manager.load(MARKERS) is None
+
+
+def test_manager_snapshot_is_json(manager):
+    manager.get_spc_statistics()
+    manager.save_snapshot()
+    header = (manager.data_dir / 'snapshot.json').read_text(encoding='utf-8').splitlines()[0]
+    assert '"version"' in header
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from src.utils.station_sync import StationSync
+
+
+def test_updated_run_is_not_double_counted(manager, runs, tmp_path):
+    source = tmp_path / 'station'
+    source.mkdir()
+    runs.write(runs.make(datetime(2024, 3, 1, 10), value=3.3), source)
+    changed = runs.make(datetime(2024, 3, 1, 11), value=3.2)
+    runs.write(changed, source)
+
+    manager.ensure_rollups()
+    manager.ensure_run_index()
+    manager.sketch_manager.rebuild([])
+    sync = StationSync('ST01', source, manager)
+    assert sync.sync()['copied'] == 2
+
+    # 같은 실행의 내용이 바뀌면 기존 반영분을 빼고 새 내용만 남아야 함
+    changed['results'][0]['measured_value'] = 3.4
+    runs.write(changed, source, mtime_ns=2_000_000_000_000_000_000)
+    result = sync.sync()
+    assert (result['copied'], result['updated']) == (0, 1)
+
+    sketch = manager.sketch_manager.load_day('20240301')['전압']['sketch']
+    assert sketch.count == 2
+    rows = manager.rollup_manager.query('daily', test_item='전압')
+    assert [(row['count'], row['max']) for row in rows] == [(2, 3.4)]
+    assert len(manager.trace_runs(serial_number='SN1')) == 2